@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from Axis_Label_Atlas import AtlasAxes
+from Curve_Family import plot_family
+from Enemy_Registry import load_registry
+from Enemy_TTK import C1, C2, C3, WEAPONS, dr_vanilla, dr_proposed_array, ttk_curve
+from Layer_Cache import LayeredScene
+
 config.pixel_width  = 2560
 config.pixel_height = 1440
 config.frame_rate   = 60
@@ -8,48 +14,18 @@ config.frame_rate   = 60
 #activate env .\manim-env\Scripts\Activate.ps1
 #render manim -pqh Warframe_Animations.py EnemyHealthAndDamage
 #render clean manim -pqh Armor_Changes.py TennoDRComparison --format=mov --transparent
+#render manim -pqh Armor_Changes.py TTKArmorComparison
+#render manim -pqh Armor_Changes.py ProposedDRVariants
 
-class TennoDRComparison(Scene):
+class TennoDRComparison(LayeredScene):
     def construct(self):
         # ---------- Model ----------
-        C_ARMOR = 300.0
-        A1, A2 = 500.0, 750.0
-        C1, C2, C3 = 0.50, 0.75, 0.90
-        HL_ARMOR = 300
-        LAMBDA = np.log(2) / HL_ARMOR
-
-        def smoothstep(t):
-            t = np.clip(t, 0.0, 1.0)
-            return 3*t**2 - 2*t**3
-
-        def dr_vanilla(a):
-            a = np.asarray(a, dtype=float)
-            return a / (a + C_ARMOR)
-
-        def dr_proposed_array(A):
-            A = np.asarray(A, dtype=float)
-
-            s1 = np.zeros_like(A)
-            m1 = (A >= 0) & (A < A1)
-            s1[m1] = smoothstep((A[m1] - 0.0) / (A1 - 0.0))
-            s1[A >= A1] = 1.0
-
-            s2 = np.zeros_like(A)
-            m2 = (A >= A1) & (A < A2)
-            s2[m2] = smoothstep((A[m2] - A1) / (A2 - A1))
-            s2[A >= A2] = 1.0
-
-            s3 = np.zeros_like(A)
-            m3 = (A >= A2)
-            s3[m3] = 1.0 - np.exp(-LAMBDA * (A[m3] - A2))
-
-            remaining = (1 - C1*s1) * (1 - C2*s2) * (1 - C3*s3)
-            return 1.0 - remaining
+        # dr_vanilla and dr_proposed_array live in Enemy_TTK, next to the TTK engine that uses them
 
         # ---------- Axes ----------
         x_min, x_max = 0, 5000
         y_min, y_max = 0.0, 1.0
-        ax = Axes(
+        ax = AtlasAxes(
             x_range=[x_min, x_max, 500],
             y_range=[y_min, y_max, 0.1],
             x_length=10.5, y_length=5.8,
@@ -82,3 +58,87 @@ class TennoDRComparison(Scene):
         self.play(Create(vg), run_time=1.5)
         self.play(Create(pg), run_time=3.0)
         self.wait(2)
+
+## ---------- Time to kill one enemy with vanilla vs proposed armor DR ----------#
+
+# ===================== CONFIG: =====================
+TTK_WEAPON = "Rifle"                  # name in Enemy_TTK.WEAPONS
+TTK_ENEMY  = "Corrupted Bombard"      # name in the enemy registry
+TTK_LEVEL_MAX = 200
+
+# ================================================================================
+
+class TTKArmorComparison(LayeredScene):
+    def construct(self):
+        enemies = load_registry()
+        levels = np.arange(1, TTK_LEVEL_MAX + 1)
+        _, ttk_v = ttk_curve(WEAPONS, TTK_WEAPON, enemies, TTK_ENEMY, levels, armor_model="vanilla")
+        _, ttk_p = ttk_curve(WEAPONS, TTK_WEAPON, enemies, TTK_ENEMY, levels, armor_model="proposed")
+
+        title = Text(
+            f"{TTK_WEAPON} vs {TTK_ENEMY}: Vanilla vs New",
+            font_size=36,
+            t2c={"Vanilla": BLUE, "New": RED}
+        ).to_edge(UP)
+
+        y_max = float(max(ttk_v.max(), ttk_p.max())) * 1.1
+        ax = AtlasAxes(
+            x_range=[0, TTK_LEVEL_MAX, 25],
+            y_range=[0, y_max],
+            x_length=10.5, y_length=5.8,
+            tips=False,
+            axis_config={"include_ticks": False, "include_numbers": False},
+            x_axis_config={"include_ticks": True, "include_numbers": True, "font_size": 28},
+        ).to_edge(DOWN).scale(0.8)
+
+        x_label = Text("Enemy Level", font_size=28).next_to(ax.x_axis, DOWN, buff=0.3)
+        y_label = Text("Time to Kill (s)", font_size=28).next_to(ax.y_axis, LEFT, buff=-1).rotate(PI/2)
+
+        vg = ax.plot_line_graph(levels, ttk_v, add_vertex_dots=False, line_color=BLUE, stroke_width=5)
+        pg = ax.plot_line_graph(levels, ttk_p, add_vertex_dots=False, line_color=RED, stroke_width=5)
+
+        self.play(Write(title), run_time=1.0)
+        self.play(Create(ax), FadeIn(x_label), FadeIn(y_label), run_time=1.5)
+        self.play(Create(vg), run_time=1.5)
+        self.play(Create(pg), run_time=3.0)
+        self.wait(2)
+
+## ---------- Many variants of the proposed DR curve at once ----------#
+
+# ===================== CONFIG: =====================
+# Every combination is one curve: 5 x 5 x 4 = 100 variants around C1, C2, C3
+VARIANT_C1 = np.linspace(0.40, 0.60, 5)
+VARIANT_C2 = np.linspace(0.65, 0.85, 5)
+VARIANT_C3 = np.linspace(0.80, 0.95, 4)
+VARIANT_X_STEP = 10                   # armor per sample
+
+# ================================================================================
+
+class ProposedDRVariants(LayeredScene):
+    def construct(self):
+        x_min, x_max = 0, 5000
+        ax = AtlasAxes(
+            x_range=[x_min, x_max, 500],
+            y_range=[0.0, 1.0, 0.1],
+            x_length=10.5, y_length=5.8,
+            tips=False,
+            axis_config={"include_numbers": True, "font_size": 36}
+        ).to_edge(DOWN).scale(0.8)
+
+        x_label = Text("Armor", font_size=28).next_to(ax.x_axis, DOWN, buff=0.3)
+        y_label = Text("Damage Reduction", font_size=28).next_to(ax.y_axis, LEFT, buff=-1).rotate(PI/2)
+        c1, c2, c3 = (g.ravel() for g in np.meshgrid(VARIANT_C1, VARIANT_C2, VARIANT_C3, indexing="ij"))
+        title = Text(f"New DR, {len(c1)} variants of C1, C2, C3", font_size=36, t2c={"New": RED}).to_edge(UP)
+
+        # ---------- Curves ----------
+        variants = plot_family(ax, dr_proposed_array, [x_min, x_max, VARIANT_X_STEP], c1=c1, c2=c2, c3=c3)
+        variants.set_stroke(color=RED, width=2, opacity=0.25)
+        chosen = plot_family(ax, dr_proposed_array, [x_min, x_max, VARIANT_X_STEP], c1=C1, c2=C2, c3=C3)
+        chosen.set_stroke(color=RED, width=5)
+
+        # ---------- Build & Animate ----------
+        self.play(Write(title), run_time=1.0)
+        self.play(Create(ax), FadeIn(x_label), FadeIn(y_label), run_time=1.5)
+        self.play(Create(variants), run_time=3.0)
+        self.play(Create(chosen), run_time=1.5)
+        self.wait(2)
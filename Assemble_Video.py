@@ -0,0 +1,254 @@
+import argparse
+import json
+import math
+import subprocess
+import sys
+import tempfile
+import time
+from fractions import Fraction
+from pathlib import Path
+
+from Render_Daemon import PROJECT_DIR, QUALITIES
+from Scene_Cache import cached_render
+
+## ---------- Final video from several scene outputs by stream copy, only crossfades are re-encoded ----------#
+#
+#activate env .\manim-env\Scripts\Activate.ps1
+#render python Assemble_Video.py final_video.txt
+#render python Assemble_Video.py final_video.txt -q h --format=mov --transparent -o media/assembled/final.mov
+#
+# The playlist has one clip per line: a scene ("<file> <Scene>", rendered through Scene_Cache, so only
+# scenes that changed are rendered again) or a finished video file. A "crossfade <seconds>" line between
+# two clips fades the first into the second, clips without one are simply cut together:
+#
+#   EHP_Formula_Animations.py EHPFormula
+#   EHP_Formula_Animations.py EHPComputeExample
+#   crossfade 0.5
+#   EHP_Formula_Animations.py ArmorDamageReduction
+#   Warframe_Tank_Table.py FramesTable
+#
+# Every clip is checked against the render profile (codec, size, frame rate, pixel / alpha format, codec
+# headers, audio) and then joined with ffmpeg's concat demuxer and -c copy, nothing is decoded.
+# A crossfade re-encodes only from the last keyframe before it in the first clip to the first keyframe
+# after it in the second (with the settings manim encodes with, so the headers stay the same), and the
+# copied parts are cut exactly at those keyframes.
+
+# ===================== CONFIG: =====================
+FFMPEG = "ffmpeg"
+FFPROBE = "ffprobe"
+ASSEMBLY_DIR = PROJECT_DIR / "media" / "assembled"
+PROFILE_SIZE = (2560, 1440)         # the scene files set pixel_width / pixel_height / frame_rate themselves
+PROFILE_FPS = 60
+
+# (format, transparent) -> codec and pixel format of manim's output, and the same encoder for crossfades
+CODECS = {
+    ("mp4", False):  ("h264", "yuv420p", ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23"]),
+    ("mov", False):  ("h264", "yuv420p", ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23"]),
+    ("mov", True):   ("qtrle", "argb", ["-c:v", "qtrle", "-pix_fmt", "argb"]),
+    ("webm", False): ("vp9", "yuv420p", ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p"]),
+    ("webm", True):  ("vp9", "yuva420p", ["-c:v", "libvpx-vp9", "-pix_fmt", "yuva420p"]),
+}
+
+# ================================================================================
+
+def _run(cmd):
+    return subprocess.run([str(c) for c in cmd], check=True, capture_output=True, text=True).stdout
+
+def profile_format(fmt=None, transparent=False):
+    """Container manim writes for --format / --transparent (transparent without a format is .mov)."""
+    return fmt or ("mov" if transparent else "mp4")
+
+def probe(path):
+    """Stream properties the profile check compares, plus the duration."""
+    info = json.loads(_run([
+        FFPROBE, "-v", "error", "-show_data_hash", "sha256",
+        "-show_entries", "stream=codec_type,codec_name,width,height,r_frame_rate,pix_fmt,extradata_hash"
+                         ":stream_tags:format=duration",
+        "-of", "json", path]))
+    video = [s for s in info["streams"] if s["codec_type"] == "video"]
+    audio = [s for s in info["streams"] if s["codec_type"] == "audio"]
+    if not video:
+        raise ValueError(f"{path} has no video stream")
+    v = video[0]
+    pix_fmt = v.get("pix_fmt")
+    tags = {k.lower(): val for k, val in v.get("tags", {}).items()}
+    if tags.get("alpha_mode") == "1":
+        pix_fmt = "yuva420p"    # VP9 keeps alpha as side data, ffprobe reports the base layer
+    return {
+        "codec": v["codec_name"],
+        "size": (v["width"], v["height"]),
+        "fps": Fraction(v["r_frame_rate"]),
+        "pix_fmt": pix_fmt,
+        "headers": v.get("extradata_hash"),
+        "audio": audio[0]["codec_name"] if audio else None,
+        "duration": float(info["format"]["duration"]),
+    }
+
+def keyframes(path, fps):
+    """Keyframes of the video stream as (frame index, pts, dts) with exact Fraction times, and the frame count.
+
+    With B-frames (manim's libx264 output) a keyframe is decoded before it is shown, its dts is earlier than its pts."""
+    info = json.loads(_run([
+        FFPROBE, "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "stream=time_base:packet=pts,dts,flags", "-of", "json", path]))
+    time_base = Fraction(info["streams"][0]["time_base"])
+    packets = sorted((int(p["pts"]), int(p.get("dts", p["pts"])), "K" in p["flags"])
+                     for p in info["packets"] if p.get("pts") is not None)
+    first = packets[0][0]
+    keys = [(round((pts - first) * time_base * fps), pts * time_base, dts * time_base)
+            for pts, dts, key in packets if key]
+    return keys, len(packets)
+
+def check_profile(clips, fmt=None, transparent=False, size=PROFILE_SIZE, fps=PROFILE_FPS):
+    """Raise ValueError listing every clip property that differs from the profile (or from the first clip)."""
+    codec, pix_fmt, _ = CODECS[(profile_format(fmt, transparent), bool(transparent))]
+    want = {"codec": codec, "size": tuple(size), "fps": Fraction(fps), "pix_fmt": pix_fmt}
+    problems = []
+    for clip in clips:
+        info = clip["info"]
+        for field, value in want.items():
+            if info[field] != value:
+                problems.append(f"{clip['name']}: {field} is {info[field]}, the profile wants {value}")
+        # Stream copy needs the same codec headers and the same audio layout in every part
+        for field in ("headers", "audio"):
+            if info[field] != clips[0]["info"][field]:
+                problems.append(f"{clip['name']}: {field} differ from {clips[0]['name']}")
+    if problems:
+        raise ValueError("clips do not match the render profile:\n  " + "\n  ".join(problems))
+
+def read_playlist(path):
+    """[(kind, value)]: ("scene", (file, scene)), ("video", path) or ("crossfade", seconds)."""
+    items = []
+    for n, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        words = line.split("#", 1)[0].split()
+        if not words:
+            continue
+        if words[0] == "crossfade" and len(words) == 2:
+            items.append(("crossfade", float(words[1])))
+        elif len(words) == 2 and words[0].endswith(".py"):
+            items.append(("scene", (words[0], words[1])))
+        elif len(words) == 1:
+            items.append(("video", Path(words[0])))
+        else:
+            raise ValueError(f"{path}:{n}: expected '<file.py> <Scene>', '<video>' or 'crossfade <seconds>'")
+    return items
+
+def _us_floor(t):
+    return f"{math.floor(t * 1_000_000) / 1_000_000:.6f}"
+
+def _us_ceil(t):
+    return f"{math.ceil(t * 1_000_000) / 1_000_000:.6f}"
+
+def _quote(path):
+    return "'" + Path(path).resolve().as_posix().replace("'", r"'\''") + "'"
+
+def _crossfade(a, a_start, b, b_end, fade, fps, encoder, path):
+    """a from frame a_start to its end faded into b up to (not including) frame b_end, re-encoded."""
+    offset = Fraction(a["frames"] - a_start - fade, 1) / fps
+    graph = (f"[0:v]trim=start_frame={a_start},setpts=PTS-STARTPTS[a];"
+             f"[1:v]trim=end_frame={b_end},setpts=PTS-STARTPTS[b];"
+             f"[a][b]xfade=transition=fade:duration={float(Fraction(fade) / fps):.6f}:offset={float(offset):.6f}[v]")
+    _run([FFMPEG, "-v", "error", "-y", "-i", a["path"], "-i", b["path"], "-filter_complex", graph,
+          "-map", "[v]", "-an", *encoder, "-r", str(fps), path])
+    return path
+
+def assemble(items, output=None, quality="h", fmt=None, transparent=False, name="assembled"):
+    """Render / collect the playlist clips, check them and join them by stream copy. Returns the output path."""
+    ext = profile_format(fmt, transparent)
+    codec, _, encoder = CODECS[(ext, bool(transparent))]
+    output = Path(output) if output else ASSEMBLY_DIR / f"{name}.{ext}"
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    clips, fades = [], []
+    for kind, value in items:
+        if kind == "crossfade":
+            if not clips or len(fades) == len(clips):
+                raise ValueError("a crossfade needs a clip on both sides")
+            fades.append(value)
+            continue
+        if len(fades) < len(clips):
+            fades.append(0.0)
+        if kind == "scene":
+            file, scene = value
+            job = {"file": file, "scene": scene, "quality": quality, "format": fmt, "transparent": transparent}
+            reply = cached_render(job)
+            if not reply["ok"]:
+                raise RuntimeError(f"{file} {scene} failed to render:\n{reply.get('traceback', reply.get('error'))}")
+            clips.append({"name": f"{file} {scene}", "path": Path(reply["output"])})
+        else:
+            clips.append({"name": str(value), "path": Path(value)})
+    if not clips or len(fades) == len(clips):
+        raise ValueError("the playlist must start and end with a clip")
+    fades.append(0.0)
+
+    for clip in clips:
+        clip["info"] = probe(clip["path"])
+    check_profile(clips, fmt, transparent)
+    if any(fades) and clips[0]["info"]["audio"]:
+        raise ValueError("crossfades between clips with audio are not supported, cut them or drop the audio")
+
+    fps = PROFILE_FPS
+    for i, clip in enumerate(clips):
+        if fades[i] or (i and fades[i - 1]):
+            clip["keys"], clip["frames"] = keyframes(clip["path"], fps)
+
+    with tempfile.TemporaryDirectory(dir=output.parent) as tmp:
+        lines = ["ffconcat version 1.0"]
+        start = 0           # first frame of the current clip that is still to be copied
+        start_time = None
+        for i, clip in enumerate(clips):
+            end, end_dts = None, None
+            if fades[i]:
+                fade = round(fades[i] * fps)
+                nxt = clips[i + 1]
+                # Last keyframe of this clip at or before the fade, first keyframe of the next one after it
+                cut = max((k for k in clip["keys"] if k[0] <= clip["frames"] - fade), default=None)
+                if cut is None or cut[0] < start or not 0 < fade <= min(clip["frames"], nxt["frames"]):
+                    raise ValueError(f"{clip['name']} is too short for its crossfade(s)")
+                end, _, end_dts = cut
+                resume = min((k[:2] for k in nxt["keys"] if k[0] >= fade), default=(nxt["frames"], None))
+            used_up = start_time is None and start > 0    # the previous crossfade re-encoded all of it
+            if not used_up and (end is None or end > start):
+                lines.append(f"file {_quote(clip['path'])}")
+                if start_time is not None:
+                    lines.append(f"inpoint {_us_ceil(start_time)}")     # seeks to the keyframe at/before it (pts)
+                if end_dts is not None:
+                    # outpoint is compared with decode timestamps: at the keyframe's dts the keyframe and
+                    # every packet after it in decode order are dropped, i.e. (closed GOP) every frame from it
+                    # on. duration keeps the next part's timestamps right after the last copied frame.
+                    lines.append(f"outpoint {_us_floor(end_dts)}")
+                    lines.append(f"duration {float(Fraction(end - start) / fps):.6f}")
+            if fades[i]:
+                path = _crossfade(clip, end, nxt, resume[0], fade, fps, encoder, Path(tmp) / f"crossfade_{i:03d}.{ext}")
+                if codec == "h264" and probe(path)["headers"] != clip["info"]["headers"]:
+                    raise RuntimeError(f"the crossfade after {clip['name']} was encoded with other h264 headers "
+                                       f"than the scene, check the encoder settings in CODECS")
+                lines.append(f"file {_quote(path)}")
+                start, start_time = resume
+            else:
+                start, start_time = 0, None
+
+        playlist = Path(tmp) / "playlist.ffconcat"
+        playlist.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        _run([FFMPEG, "-v", "error", "-y", "-f", "concat", "-safe", "0", "-i", playlist,
+              "-map", "0", "-c", "copy", output])
+    return output
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Join scene outputs into one video by stream copy")
+    parser.add_argument("playlist")
+    parser.add_argument("-o", "--output")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("--format")
+    parser.add_argument("-t", "--transparent", action="store_true")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    items = read_playlist(args.playlist)
+    output = assemble(items, args.output, args.quality, args.format, args.transparent, name=Path(args.playlist).stem)
+    clips = sum(kind != "crossfade" for kind, _ in items)
+    print(f"{output}  ({clips} clips, {time.perf_counter() - t0:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
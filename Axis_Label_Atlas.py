@@ -0,0 +1,63 @@
+from manim import *
+from manim.utils.config_ops import merge_dicts_recursively
+
+## ---------- Shared tick-number labels for Axes(include_numbers=True) ----------#
+#
+# manim already keeps one typeset mobject per digit, but every tick label is still a fresh DecimalNumber
+# (format, copy each digit, arrange, scale) on every axis. _plot_and_intersect builds two axes per enemy
+# and EnemyHealthPlotFull builds ax and ax_long with mostly the same numbers, so the finished labels are
+# kept here once per (number, font size, number config) and every new axis gets positioned copies.
+#
+# Use AtlasAxes exactly like Axes.
+
+_LABEL_ATLAS = {}
+
+def _atlas_key(x, font_size, mob_class, number_config):
+    places = number_config.get("num_decimal_places")
+    value = round(float(x), places) if places is not None else float(x)
+    config_key = tuple(sorted((k, repr(v)) for k, v in number_config.items()))
+    return mob_class, value, round(float(font_size), 3), config_key
+
+def atlas_label(x, font_size, mob_class=MathTex, **number_config):
+    """Unpositioned tick label for x, typeset once per process and copied afterwards.
+
+    Built like NumberLine.get_number_mobject: a DecimalNumber whose digits are mob_class (the line's label_constructor)."""
+    key = _atlas_key(x, font_size, mob_class, number_config)
+    if key not in _LABEL_ATLAS:
+        _LABEL_ATLAS[key] = DecimalNumber(x, font_size=font_size, mob_class=mob_class, **number_config).move_to(ORIGIN)
+    return _LABEL_ATLAS[key].copy()
+
+def clear_label_atlas():
+    _LABEL_ATLAS.clear()
+
+class AtlasNumberLine(NumberLine):
+    """NumberLine whose number labels come from the shared atlas."""
+
+    def get_number_mobject(self, x, direction=None, buff=None, font_size=None, label_constructor=None, **number_config):
+        number_config = merge_dicts_recursively(self.decimal_number_config, number_config)
+        if direction is None:
+            direction = self.label_direction
+        if buff is None:
+            buff = self.line_to_number_buff
+        if font_size is None:
+            font_size = self.font_size
+        if label_constructor is None:
+            label_constructor = getattr(self, "label_constructor", MathTex)
+
+        num_mob = atlas_label(x, font_size, label_constructor, **number_config)
+        num_mob.next_to(self.number_to_point(x), direction=direction, buff=buff)
+        if x < 0 and self.label_direction[0] == 0:
+            # Align without the minus sign
+            num_mob.shift(num_mob[0].width * LEFT / 2)
+        return num_mob
+
+class AtlasAxes(Axes):
+    """Axes built from AtlasNumberLine, same arguments as Axes."""
+
+    @staticmethod
+    def _create_axis(range_terms, axis_config, length):
+        axis_config["length"] = length
+        axis = AtlasNumberLine(range_terms, **axis_config)
+        # without the origin shift the graph does not exist when min > 0 or max < 0
+        axis.shift(-axis.number_to_point(Axes._origin_shift([axis.x_min, axis.x_max])))
+        return axis
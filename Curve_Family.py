@@ -0,0 +1,79 @@
+from manim import *
+import numpy as np
+
+## ---------- Many curves as one path: small multiples without one VMobject per curve ----------#
+#
+# ax.plot samples its function point by point in Python and every curve is its own VMobject, so 100 variants
+# are 100 samplings and 100 strokes per frame. A CurveFamily holds every curve as one subpath of a single
+# VMobject, built from a (n_curves, n_x) array in one vectorized call and stroked in one pass:
+#
+#   family = plot_family(ax, dr_proposed_array, [0, 5000, 10], c1=c1s, c2=c2s, c3=c3s)   # one curve per c1/c2/c3
+#   family = plot_family(ax, lambda L, base_level: 300 * health_blend(L, base_level), [1, 200, 1],
+#                        base_level=np.arange(1, 51))
+#   self.play(Create(family))       # every curve is drawn left to right at the same time
+#
+# Curves are polylines through the samples (no smoothing), so sample as finely as the curve needs.
+# All curves share one style, use one family per color.
+
+def axes_points(axes, xs, ys):
+    """Scene points of (x, y) data on axes, for arrays of any matching shapes, shape (..., 3)."""
+    origin = axes.x_axis.number_to_point(axes._origin_shift([axes.x_axis.x_min, axes.x_axis.x_max]))
+    xs, ys = np.broadcast_arrays(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+    x_pts = axes.x_axis.number_to_point(xs.reshape(-1))
+    y_pts = axes.y_axis.number_to_point(ys.reshape(-1))
+    return (x_pts + y_pts - origin).reshape(*xs.shape, 3)
+
+def _line_segments(starts, ends):
+    # Cubic bezier of a straight line: handles at 1/3 and 2/3
+    d = ends - starts
+    return np.stack([starts, starts + d / 3, starts + 2 * d / 3, ends], axis=-2)
+
+def _anchor_at(anchors, g):
+    """Points at polyline parameter g (segment index + fraction), anchors (m, n, 3), g (m, k)."""
+    j = np.minimum(np.floor(g).astype(int), anchors.shape[1] - 2)
+    f = (g - j)[..., None]
+    p0 = np.take_along_axis(anchors, j[..., None], axis=1)
+    p1 = np.take_along_axis(anchors, j[..., None] + 1, axis=1)
+    return p0 + (p1 - p0) * f
+
+class CurveFamily(VMobject):
+    """n_curves polylines with n_x anchors each, stored as subpaths of one VMobject."""
+
+    def __init__(self, anchors, **kwargs):
+        super().__init__(**kwargs)
+        anchors = np.asarray(anchors, dtype=float)
+        if anchors.ndim != 3 or anchors.shape[1] < 2:
+            raise ValueError(f"anchors must have shape (n_curves, n_x >= 2, 3), got {anchors.shape}")
+        self.n_curves, self.n_segments = anchors.shape[0], anchors.shape[1] - 1
+        self.points = _line_segments(anchors[:, :-1], anchors[:, 1:]).reshape(-1, 3)
+
+    def get_anchor_array(self):
+        """Current anchors, shape (n_curves, n_x, 3)."""
+        segments = self.points.reshape(self.n_curves, self.n_segments, 4, 3)
+        return np.concatenate([segments[:, :, 0], segments[:, -1:, 3]], axis=1)
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        # The same [a, b] slice of every curve, instead of a slice of all curves one after another,
+        # so Create / Uncreate / ZoomableAxes clipping run along x. Point count stays the same.
+        anchors = vmobject.get_anchor_array()
+        n = self.n_segments
+        k = np.arange(n, dtype=float)
+        lo, hi = a * n, b * n
+        g = np.broadcast_to(np.clip(np.stack([k, k + 1]), lo, hi), (anchors.shape[0], 2, n))
+        starts = _anchor_at(anchors, g[:, 0])
+        ends = _anchor_at(anchors, g[:, 1])
+        self.points = _line_segments(starts, ends).reshape(-1, 3)
+        return self
+
+def plot_family(axes, function, x_range, **params):
+    """CurveFamily with one curve per entry of the params arrays, function(x, **params) is evaluated
+    once on the whole (n_curves, n_x) grid. x_range is [x_min, x_max, x_step], style it with set_stroke."""
+    x_min, x_max, x_step = x_range
+    xs = np.append(np.arange(x_min, x_max, x_step, dtype=float), float(x_max))
+    columns = {name: np.asarray(value, dtype=float).reshape(-1, 1) for name, value in params.items()}
+    ys = np.atleast_2d(function(xs[None, :], **columns))
+    xs = np.broadcast_to(xs, ys.shape)
+    family = CurveFamily(axes_points(axes, xs, ys))
+    if hasattr(axes, "track"):
+        axes.track(family)      # ZoomableAxes: follow range changes
+    return family
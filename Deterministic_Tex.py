@@ -0,0 +1,126 @@
+from manim import *
+from collections.abc import MutableSet
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import os
+
+import manim.animation.transform_matching_parts as _matching_parts
+
+## ---------- Same TeX output on every run and worker count: ordered matching + pre-compiled MathTex builds ----------#
+#
+# config.threads is not a manim CE option (setting it only adds an unused attribute), manim builds every
+# mobject on the main thread. What differs from run to run is TransformMatchingTex / TransformMatchingShapes:
+# they pair parts through set(source_map).intersection(target_map) etc., and a set of tex strings (or of
+# hash(bytes) shape keys) iterates in an order that depends on Python's per-process hash seed. The groups
+# handed to Transform / FadeIn / FadeOut therefore get their submobjects in a different order every run.
+# OrderedTransformMatchingTex / OrderedTransformMatchingShapes pair parts in their submobject order instead.
+# They rely on the matching module calling the name `set` while the animation is built (manim CE 0.18/0.19)
+# and swap it for an insertion-ordered set only for that constructor call, see ordered_matching().
+#
+# build_tex compiles formulas in worker processes first (the latex / dvisvgm runs fill media/Tex), then
+# builds every mobject on the main thread from that cache, in the order they were given, so the scene is
+# the same for 1 or 16 workers:
+#
+#   step1, step2, step3 = build_tex((r"\mathbf{EHP}", r"=", r"\frac{H}{D}"), (...), (...))
+#   title = build_tex(r"\text{Armor}", cls=Tex)[0]
+#   self.play(OrderedTransformMatchingTex(step1, step2))
+
+# ===================== CONFIG: =====================
+TEX_WORKERS = None      # processes that pre-compile for build_tex, None: one per core
+
+# ================================================================================
+
+class _OrderedSet(MutableSet):
+    """set with insertion order, also for intersection() / difference() / union()."""
+
+    def __init__(self, iterable=()):
+        self._items = dict.fromkeys(iterable)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._items)!r})"
+
+    def add(self, item):
+        self._items[item] = None
+
+    def discard(self, item):
+        self._items.pop(item, None)
+
+    def intersection(self, *others):
+        others = [o if isinstance(o, (set, dict, _OrderedSet)) else set(o) for o in others]
+        return _OrderedSet(k for k in self._items if all(k in o for o in others))
+
+    def difference(self, *others):
+        others = [o if isinstance(o, (set, dict, _OrderedSet)) else set(o) for o in others]
+        return _OrderedSet(k for k in self._items if not any(k in o for o in others))
+
+    def union(self, *others):
+        result = _OrderedSet(self._items)
+        for o in others:
+            result |= o
+        return result
+
+@contextmanager
+def ordered_matching():
+    """Within the block, TransformMatchingTex / TransformMatchingShapes pair parts in insertion order.
+
+    Module globals come before builtins, so this only changes the name `set` inside the matching module,
+    and only until the block ends."""
+    if not hasattr(_matching_parts, "TransformMatchingAbstractBase"):
+        raise RuntimeError("manim.animation.transform_matching_parts changed, ordered_matching needs updating")
+    had, previous = hasattr(_matching_parts, "set"), getattr(_matching_parts, "set", None)
+    _matching_parts.set = _OrderedSet
+    try:
+        yield
+    finally:
+        if had:
+            _matching_parts.set = previous
+        else:
+            del _matching_parts.set
+
+class OrderedTransformMatchingTex(TransformMatchingTex):
+    """TransformMatchingTex with the parts paired in their submobject order."""
+
+    def __init__(self, *args, **kwargs):
+        with ordered_matching():
+            super().__init__(*args, **kwargs)
+
+class OrderedTransformMatchingShapes(TransformMatchingShapes):
+    """TransformMatchingShapes with the parts paired in their submobject order."""
+
+    def __init__(self, *args, **kwargs):
+        with ordered_matching():
+            super().__init__(*args, **kwargs)
+
+def _precompile(cls, strings, kwargs, dirs):
+    # Worker process: building the mobject once writes its .tex / .svg into media/Tex, the result is dropped
+    with tempconfig(dirs):
+        cls(*strings, **kwargs)
+
+def build_tex(*formulas, cls=MathTex, workers=None, **kwargs):
+    """cls(*formula, **kwargs) for every formula (a string or a tuple of strings).
+
+    Formulas are compiled into the TeX cache by worker processes, the mobjects are then built one after
+    the other on the calling thread. The list comes back in the given order, identical formulas are
+    built once and copied."""
+    specs = [(f,) if isinstance(f, str) else tuple(f) for f in formulas]
+    unique = list(dict.fromkeys(specs))
+    workers = min(workers or TEX_WORKERS or os.cpu_count() or 1, len(unique))
+    if workers > 1:
+        dirs = {"media_dir": config.media_dir, "tex_dir": config.tex_dir}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_precompile, [cls] * len(unique), unique, [kwargs] * len(unique), [dirs] * len(unique)))
+    built = {spec: cls(*spec, **kwargs) for spec in unique}
+    result, used = [], set()
+    for spec in specs:
+        result.append(built[spec].copy() if spec in used else built[spec])
+        used.add(spec)
+    return result
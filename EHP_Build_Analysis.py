@@ -0,0 +1,162 @@
+import numpy as np
+
+## ---------- Batched EHP math for whole tables of builds (no manim import, usable from a plain python shell) ----------#
+#
+# EHP = (H + E * Eff) / ( (1 - A/(A+300)) * prod_i (1 - DR_i) )
+#
+# Every function takes H, E, Eff, A as arrays of shape (builds,) (or anything that broadcasts)
+# and DR as an array of shape (builds, n_dr) with one column per extra DR source (abilities, arcanes, ...).
+# Armor is not part of DR, it goes through A/(A+300) like in EHPComputeExample.
+#
+# For tables with millions of builds use ehp_table + rank_builds: log-domain float64 accumulation,
+# float32 storage, and a ranking that still matches the float64 reference exactly.
+
+ARMOR_CONSTANT = 300.0
+
+# What "one unit" of each input means when ranking them against each other
+UNIT_STEPS = {
+    "health":     1.0,    # +1 health
+    "energy":     1.0,    # +1 energy
+    "efficiency": 0.01,   # +1% energy efficiency (Eff = 2.4 means 240%)
+    "armor":      1.0,    # +1 armor
+    "dr":         0.01,   # +1 percentage point on a DR source
+}
+
+def _as_build_arrays(H, E, Eff, A, DR):
+    H, E, Eff, A = (np.asarray(v, dtype=float) for v in (H, E, Eff, A))
+    DR = np.asarray(DR, dtype=float)
+    if DR.ndim == 0:
+        DR = DR[None]
+    return H, E, Eff, A, DR
+
+def armor_dr(A):
+    """Damage reduction from armor, A/(A+300)."""
+    A = np.asarray(A, dtype=float)
+    return A / (A + ARMOR_CONSTANT)
+
+def ehp_batch(H, E, Eff, A, DR, log_domain=False, dtype=np.float64):
+    """EHP of every build in one vectorized pass.
+
+    log_domain=True accumulates the DR stack as a sum of log1p(-DR_i) instead of a product
+    (see log_ehp_batch), dtype=np.float32 returns the result at half the size.
+    """
+    if log_domain:
+        with np.errstate(over="ignore"):
+            return np.exp(log_ehp_batch(H, E, Eff, A, DR)).astype(dtype, copy=False)
+    H, E, Eff, A, DR = _as_build_arrays(H, E, Eff, A, DR)
+    numerator = H + E * Eff
+    # 1 - A/(A+300) is 300/(A+300), written this way it never cancels
+    with np.errstate(divide="ignore"):
+        ehp = numerator * (A + ARMOR_CONSTANT) / ARMOR_CONSTANT / np.prod(1.0 - DR, axis=-1)
+    return ehp.astype(dtype, copy=False)
+
+def log_ehp_batch(H, E, Eff, A, DR):
+    """Natural log of EHP, every factor turned into a sum so nothing under- or overflows.
+
+    log EHP = log(H + E*Eff) + log1p(A/300) - sum_i log1p(-DR_i)
+    A stack of 0.90s adds 2.3 per source here instead of multiplying the denominator down by 10.
+    """
+    H, E, Eff, A, DR = _as_build_arrays(H, E, Eff, A, DR)
+    with np.errstate(divide="ignore"):
+        return np.log(H + E * Eff) + np.log1p(A / ARMOR_CONSTANT) - np.sum(np.log1p(-DR), axis=-1)
+
+# Builds per chunk when filling a table, keeps the float64 temporaries at a few MB
+CHUNK_BUILDS = 1 << 16
+
+def ehp_table(H, E, Eff, A, DR, dtype=np.float32, chunk=CHUNK_BUILDS):
+    """log EHP of a whole table of builds, accumulated in float64 chunks and stored as dtype.
+
+    With the default float32 a million builds take 4 MB instead of 8 MB. log EHP of any realistic
+    build is below ~50, where float32 still resolves relative EHP differences of about 4e-6;
+    rank_builds settles whatever falls inside that resolution against the float64 values.
+    """
+    H, E, Eff, A, DR = _as_build_arrays(H, E, Eff, A, DR)
+    shape = np.broadcast_shapes(H.shape, E.shape, Eff.shape, A.shape, DR.shape[:-1])
+    H, E, Eff, A = (np.broadcast_to(v, shape).reshape(-1) for v in (H, E, Eff, A))
+    DR = np.broadcast_to(DR, shape + DR.shape[-1:]).reshape(-1, DR.shape[-1])
+
+    out = np.empty(len(H), dtype=dtype)
+    for lo in range(0, len(out), chunk):
+        hi = lo + chunk
+        out[lo:hi] = log_ehp_batch(H[lo:hi], E[lo:hi], Eff[lo:hi], A[lo:hi], DR[lo:hi])
+    return out.reshape(shape)
+
+def rank_builds(table, H, E, Eff, A, DR):
+    """Build indices from highest to lowest EHP, identical to sorting the float64 log EHP.
+
+    Rounding to float32 never swaps two builds, it can only make them equal. So the order of the
+    stored table is already right except inside runs of equal stored values, and only those
+    builds get their log EHP recomputed in float64 to settle the order.
+    """
+    table = np.asarray(table).reshape(-1)
+    order = np.argsort(-table, kind="stable")
+    ranked = table[order]
+    tied = np.zeros(len(ranked), dtype=bool)
+    same = ranked[1:] == ranked[:-1]
+    tied[1:] |= same
+    tied[:-1] |= same
+    if not tied.any():
+        return order
+
+    H, E, Eff, A, DR = _as_build_arrays(H, E, Eff, A, DR)
+    shape = np.broadcast_shapes(H.shape, E.shape, Eff.shape, A.shape, DR.shape[:-1])
+    H, E, Eff, A = (np.broadcast_to(v, shape).reshape(-1) for v in (H, E, Eff, A))
+    DR = np.broadcast_to(DR, shape + DR.shape[-1:]).reshape(-1, DR.shape[-1])
+
+    pos = np.flatnonzero(tied)
+    idx = order[pos]
+    exact = log_ehp_batch(H[idx], E[idx], Eff[idx], A[idx], DR[idx])
+    run = np.cumsum(np.concatenate(([True], ~same)))[pos]   # which run of equal values each position is in
+    order[pos] = idx[np.lexsort((-exact, run))]
+    return order
+
+def input_names(n_dr):
+    return ["health", "energy", "efficiency", "armor"] + [f"DR_{i+1}" for i in range(n_dr)]
+
+def ehp_gradients(H, E, Eff, A, DR):
+    """Exact partial derivatives of EHP, one column per input (see input_names)."""
+    H, E, Eff, A, DR = _as_build_arrays(H, E, Eff, A, DR)
+    ehp = ehp_batch(H, E, Eff, A, DR)
+    with np.errstate(divide="ignore"):
+        # EHP is linear in the numerator, so d/dH is 1 / (total damage taken fraction)
+        per_numerator = (A + ARMOR_CONSTANT) / ARMOR_CONSTANT / np.prod(1.0 - DR, axis=-1)
+        d_dr = ehp[..., None] / (1.0 - DR)
+    columns = [
+        per_numerator,          # d/dH
+        per_numerator * Eff,    # d/dE
+        per_numerator * E,      # d/dEff
+        ehp / (A + ARMOR_CONSTANT),   # d/dA, EHP is linear in (A + 300)
+    ]
+    columns = [np.broadcast_to(c, ehp.shape) for c in columns]
+    return np.concatenate([np.stack(columns, axis=-1), d_dr], axis=-1)
+
+def ehp_gain_per_unit(H, E, Eff, A, DR, steps=None):
+    """Exact EHP gained by adding one unit (UNIT_STEPS) of each input, one column per input.
+
+    H, E, Eff and A enter EHP linearly so their gain is gradient * step. A DR source
+    does not: going from DR to DR + d multiplies EHP by (1 - DR)/(1 - DR - d), which is
+    what gets returned (inf once the step would reach 100%).
+    """
+    steps = {**UNIT_STEPS, **(steps or {})}
+    H, E, Eff, A, DR = _as_build_arrays(H, E, Eff, A, DR)
+    grads = ehp_gradients(H, E, Eff, A, DR)
+    ehp = ehp_batch(H, E, Eff, A, DR)
+
+    linear_steps = np.array([steps["health"], steps["energy"], steps["efficiency"], steps["armor"]])
+    gains = np.empty_like(grads)
+    gains[..., :4] = grads[..., :4] * linear_steps
+    d = steps["dr"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        remaining = 1.0 - DR - d
+        gains[..., 4:] = np.where(remaining > 0, ehp[..., None] * d / remaining, np.inf)
+    return gains
+
+def rank_inputs(H, E, Eff, A, DR, steps=None):
+    """Ranked recommendation per build: (names, gains, order).
+
+    order[b] lists the column indices of build b from most to least EHP per unit,
+    so names[order[b][0]] is the input worth investing in next.
+    """
+    gains = ehp_gain_per_unit(H, E, Eff, A, DR, steps)
+    order = np.argsort(-gains, axis=-1, kind="stable")
+    return input_names(gains.shape[-1] - 4), gains, order
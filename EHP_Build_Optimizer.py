@@ -0,0 +1,382 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from EHP_Build_Analysis import ARMOR_CONSTANT
+
+## ---------- Exhaustive max-EHP build search over a mod/arcane catalog (branch and bound, all cores) ----------#
+#
+#run python EHP_Build_Optimizer.py
+#
+# EHP = (H + E * Eff) * (A + 300) / 300 / prod_i (1 - DR_i)
+#
+# Every catalog entry adds flat health/armor/energy/efficiency and multiplies the damage taken by (1 - dr).
+# The search only ever visits a branch if an optimistic bound on it can still beat the best build found so far.
+# The bound takes, independently for every stat, the best k remaining entries (k = free slots), which is valid
+# because EHP only grows with each additive stat and shrinks with each (1 - dr) factor:
+#   - the (1 - dr) factors multiply, so the best k of them is just the product of the k smallest
+#   - armor only enters through A/(A+300), i.e. EHP is linear in (A + 300), so the best k armor values add up
+
+STATS = ("health", "armor", "energy", "efficiency")
+
+# ===================== CONFIG: =====================
+# Frame before any of the catalog entries. dr = damage reduction the frame always has (passives, abilities)
+EXAMPLE_BASE = {"health": 740, "armor": 290, "energy": 225, "efficiency": 1.0, "dr": [0.90]}
+
+# Free slots per slot type
+EXAMPLE_SLOTS = {"mod": 6, "aura": 1, "arcane": 2}
+
+# Flat values for the frame above (example values, plug in your own frame's numbers)
+EXAMPLE_CATALOG = [
+    {"name": "Vitality",             "slot": "mod",    "health": 1628},
+    {"name": "Umbral Vitality",      "slot": "mod",    "health": 1628},
+    {"name": "Steel Fiber",          "slot": "mod",    "armor": 319},
+    {"name": "Umbral Fiber",         "slot": "mod",    "armor": 290},
+    {"name": "Adaptation",           "slot": "mod",    "dr": 0.90},
+    {"name": "Flow",                 "slot": "mod",    "energy": 338},
+    {"name": "Streamline",           "slot": "mod",    "efficiency": 0.30},
+    {"name": "Fleeting Expertise",   "slot": "mod",    "efficiency": 0.60},
+    {"name": "Gladiator Resolve",    "slot": "mod",    "armor": 170},
+    {"name": "Stand United",         "slot": "aura",   "armor": 348},
+    {"name": "Physique",             "slot": "aura",   "health": 370},
+    {"name": "Arcane Guardian",      "slot": "arcane", "armor": 900},
+    {"name": "Arcane Ultimatum",     "slot": "arcane", "armor": 900},
+    {"name": "Molt Reconstruct",     "slot": "arcane", "health": 1000},
+    {"name": "Arcane Steadfast",     "slot": "arcane", "dr": 0.10},
+]
+
+# ================================================================================
+
+def catalog_arrays(catalog):
+    """Struct-of-arrays view of a catalog: one float array per stat, plus names, slots and keep = 1 - dr."""
+    arrays = {"name": [str(m["name"]) for m in catalog], "slot": [str(m.get("slot", "mod")) for m in catalog]}
+    for stat in STATS:
+        arrays[stat] = np.array([float(m.get(stat, 0.0)) for m in catalog])
+    arrays["keep"] = 1.0 - np.array([float(m.get("dr", 0.0)) for m in catalog])
+    if np.any(arrays["keep"] <= 0):
+        raise ValueError("a catalog entry with dr >= 1 would make EHP infinite")
+    return arrays
+
+def build_ehp(health, armor, energy, efficiency, keep):
+    """EHP from totals, keep = product of all (1 - DR) factors. Works on floats and arrays."""
+    return (health + energy * efficiency) * (armor + ARMOR_CONSTANT) / ARMOR_CONSTANT / keep
+
+def _suffix_tables(arrays, max_k):
+    """best[stat][i][k]: the k best values among entries i.. (positive part), keep[i][k]: product of the k smallest keeps,
+    extra[i][k]: how many stats the k most multi-purpose entries among i.. help beyond their first one."""
+    n = len(arrays["keep"])
+    best = {stat: np.zeros((n + 1, max_k + 1)) for stat in STATS}
+    keep = np.ones((n + 1, max_k + 1))
+    extra = np.zeros((n + 1, max_k + 1), dtype=int)
+    helps = sum((arrays[stat] > 0).astype(int) for stat in STATS) + (arrays["keep"] < 1).astype(int)
+    for i in range(n - 1, -1, -1):
+        for stat in STATS:
+            top = np.sort(np.maximum(arrays[stat][i:], 0.0))[::-1][:max_k]
+            best[stat][i, 1:len(top) + 1] = np.cumsum(top)
+            best[stat][i, len(top) + 1:] = best[stat][i, len(top)]
+        low = np.sort(np.minimum(arrays["keep"][i:], 1.0))[:max_k]
+        keep[i, 1:len(low) + 1] = np.cumprod(low)
+        keep[i, len(low) + 1:] = keep[i, len(low)]
+        multi = np.sort(np.maximum(helps[i:] - 1, 0))[::-1][:max_k]
+        extra[i, 1:len(multi) + 1] = np.cumsum(multi)
+        extra[i, len(multi) + 1:] = extra[i, len(multi)]
+    return best, keep, extra
+
+@lru_cache(maxsize=None)
+def _slot_splits(free, shares):
+    """Every way to hand out `shares` picks over the 5 stat groups (health, armor, energy, efficiency, dr), at most `free` each.
+
+    Handing out all of them is enough: the suffix tables never decrease, so a split that leaves a pick unused
+    is never better than one that uses it.
+    """
+    groups = len(STATS) + 1
+    shares = min(shares, groups * free)
+    grid = np.array(list(itertools.product(range(free + 1), repeat=groups)))
+    return grid[grid.sum(axis=1) == shares]
+
+class _Problem:
+    """Everything one search worker needs, built once and shipped to every process."""
+
+    def __init__(self, catalog, base, slots, min_stats=None, max_stats=None):
+        arrays = catalog_arrays(catalog)
+        self.slots = dict(slots)
+        self.min_stats = dict(min_stats or {})
+        self.max_stats = dict(max_stats or {})
+        for stat in list(self.min_stats) + list(self.max_stats):
+            if stat not in STATS:
+                raise KeyError(f"unknown stat constraint '{stat}', use one of {STATS}")
+        unknown = set(arrays["slot"]) - set(self.slots)
+        if unknown:
+            raise KeyError(f"catalog uses slot types without a budget: {sorted(unknown)}")
+
+        self.base = tuple(float(base.get(stat, 0.0)) for stat in STATS)
+        self.base_keep = float(np.prod(1.0 - np.asarray(base.get("dr", []), dtype=float)))
+
+        # Visit the entries that help most on their own first, good builds early = more pruning.
+        # Ties (efficiency with 0 base energy, ...) go by the entry's own values, which the cells below rely on.
+        h, a, e, eff = self.base
+        solo = build_ehp(h + arrays["health"], a + arrays["armor"], e + arrays["energy"],
+                         eff + arrays["efficiency"], self.base_keep * arrays["keep"])
+        own = sum(arrays[stat] for stat in STATS) + (1.0 - arrays["keep"])
+        order = np.lexsort((-own, -solo))
+        self.names = [arrays["name"][i] for i in order]
+        self.slot_of = [arrays["slot"][i] for i in order]
+        self.slot_types = sorted(self.slots)
+        self.slot_index = np.array([self.slot_types.index(s) for s in self.slot_of])
+        self.values = {stat: arrays[stat][order] for stat in STATS + ("keep",)}
+        self.rows = [tuple(float(self.values[stat][i]) for stat in STATS + ("keep",)) for i in range(len(order))]
+
+        # Entries that only help one stat and share a slot type are interchangeable apart from their value,
+        # so a build never needs the worse of two of them without the better one. Within such a cell the
+        # order above is by value (solo EHP never drops with the value, ties go by the value), better first.
+        # Not true for a stat with a max constraint, there a smaller value can be the one that fits.
+        groups = [stat for stat in STATS if stat not in self.max_stats]
+        self.prev_in_cell = np.full(len(order), -1)
+        last_in_cell = {}
+        for j in range(len(order)):
+            helped = [stat for stat in STATS if self.values[stat][j] != 0] + (["dr"] if self.values["keep"][j] != 1 else [])
+            if len(helped) != 1 or (helped[0] != "dr" and helped[0] not in groups):
+                continue
+            cell = (self.slot_of[j], helped[0])
+            self.prev_in_cell[j] = last_in_cell.get(cell, -1)
+            last_in_cell[cell] = j
+
+        self.total_slots = sum(self.slots.values())
+        self.best, self.best_keep, self.extra = _suffix_tables(self.values, self.total_slots)
+
+    def feasible(self, totals):
+        """Stat constraints, elementwise when totals holds arrays."""
+        ok = True
+        for stat, lo in self.min_stats.items():
+            ok = ok & (totals[STATS.index(stat)] >= lo)
+        for stat, hi in self.max_stats.items():
+            ok = ok & (totals[STATS.index(stat)] <= hi)
+        return ok
+
+    def can_beat(self, i, free, totals, keep, target):
+        """Can any build reachable from here (entries i.., `free` more slots) get above target EHP?"""
+        # Cheap check first: every stat gets its best `free` entries at the same time
+        h, a, e, eff = (totals[k] + self.best[stat][i, free] for k, stat in enumerate(STATS))
+        if build_ehp(h, a, e, eff, keep * self.best_keep[i, free]) <= target:
+            return False
+
+        # Tighter: the free slots are shared between the stats. An entry that helps several stats
+        # counts once per stat, so the picks to hand out are free + extra, not just free.
+        split = _slot_splits(free, free + int(self.extra[i, free]))
+        cand = [totals[k] + self.best[stat][i, split[:, k]] for k, stat in enumerate(STATS)]
+        ok = np.ones(len(split), dtype=bool)
+        for stat, lo in self.min_stats.items():
+            ok &= cand[STATS.index(stat)] >= lo
+        values = build_ehp(*cand, keep * self.best_keep[i, split[:, len(STATS)]])
+        return bool(np.any(ok & (values > target)))
+
+def _search(problem, start, first, incumbent):
+    """Depth-first branch and bound over builds whose lowest-index entry is `first` (None = empty build)."""
+    state = {"ehp": incumbent, "build": None, "nodes": 0}
+    free_by_type = dict(problem.slots)
+    n = len(problem.names)
+    picked = np.zeros(n + 1, dtype=bool)    # picked[-1] stays False, the "no previous entry" slot
+
+    def visit(i, chosen, totals, keep):
+        state["nodes"] += 1
+        if problem.feasible(totals):
+            value = build_ehp(*totals, keep)
+            if value > state["ehp"]:
+                state["ehp"], state["build"] = value, list(chosen)
+
+        free = sum(free_by_type.values())
+        if free == 0 or i >= n:
+            return
+        if not problem.can_beat(i, free, totals, keep, state["ehp"]):
+            return
+
+        if free == 1:
+            # Last slot: score every remaining entry in one vectorized step instead of recursing
+            open_types = [k for k, s in enumerate(problem.slot_types) if free_by_type[s] > 0]
+            prev = problem.prev_in_cell[i:]
+            allowed = np.isin(problem.slot_index[i:], open_types) & ((prev < 0) | picked[prev])
+            candidates = np.arange(i, n)[allowed]
+            if len(candidates):
+                v = problem.values
+                cand = [totals[k] + v[stat][candidates] for k, stat in enumerate(STATS)]
+                scores = np.where(problem.feasible(cand), build_ehp(*cand, keep * v["keep"][candidates]), -np.inf)
+                best = int(np.argmax(scores))
+                state["nodes"] += len(candidates)
+                if scores[best] > state["ehp"]:
+                    state["ehp"], state["build"] = float(scores[best]), list(chosen) + [int(candidates[best])]
+            return
+
+        for j in range(i, n):
+            slot = problem.slot_of[j]
+            if free_by_type[slot] == 0:
+                continue
+            prev = problem.prev_in_cell[j]
+            if prev >= 0 and not picked[prev]:
+                continue
+            row = problem.rows[j]
+            free_by_type[slot] -= 1
+            chosen.append(j)
+            picked[j] = True
+            visit(j + 1, chosen, tuple(t + r for t, r in zip(totals, row)), keep * row[4])
+            picked[j] = False
+            chosen.pop()
+            free_by_type[slot] += 1
+
+    if first is None:
+        # Only the empty build itself, every non-empty build belongs to some first entry
+        state["nodes"] += 1
+        if problem.feasible(start) and build_ehp(*start, problem.base_keep) > state["ehp"]:
+            state["ehp"], state["build"] = build_ehp(*start, problem.base_keep), []
+        return state
+
+    if problem.prev_in_cell[first] >= 0:
+        # A better interchangeable entry comes earlier, that build is covered by its branch
+        return state
+    row = problem.rows[first]
+    free_by_type[problem.slot_of[first]] -= 1
+    picked[first] = True
+    visit(first + 1, [first], tuple(t + r for t, r in zip(start, row)), problem.base_keep * row[4])
+    return state
+
+def _greedy(problem):
+    """Fill slots one at a time with whatever helps most, a quick lower bound for every worker."""
+    totals, keep, chosen = problem.base, problem.base_keep, []
+    free_by_type = dict(problem.slots)
+    while True:
+        best, best_j = -np.inf, None
+        for j, row in enumerate(problem.rows):
+            if j in chosen or free_by_type[problem.slot_of[j]] == 0:
+                continue
+            cand = tuple(t + r for t, r in zip(totals, row))
+            value = build_ehp(*cand, keep * row[4])
+            if value > best:
+                best, best_j = value, j
+        if best_j is None:
+            break
+        row = problem.rows[best_j]
+        totals, keep = tuple(t + r for t, r in zip(totals, row)), keep * row[4]
+        chosen.append(best_j)
+        free_by_type[problem.slot_of[best_j]] -= 1
+    if problem.feasible(totals):
+        return {"ehp": build_ehp(*totals, keep), "build": sorted(chosen), "nodes": 0}
+    return {"ehp": -np.inf, "build": None, "nodes": 0}
+
+_WORKER_PROBLEM = None
+
+def _init_worker(problem):
+    global _WORKER_PROBLEM
+    _WORKER_PROBLEM = problem
+
+def _run_branch(first, incumbent):
+    return _search(_WORKER_PROBLEM, _WORKER_PROBLEM.base, first, incumbent)
+
+def optimize_build(catalog, base, slots, min_stats=None, max_stats=None, workers=None):
+    """Exact max-EHP build. Returns dict(ehp, build, totals, nodes, seconds).
+
+    catalog   : list of dicts with name, slot and any of health/armor/energy/efficiency/dr
+    base      : frame stats before the catalog, dr is a list of always-on DR sources
+    slots     : free slots per slot type, e.g. {"mod": 8, "arcane": 2}
+    min_stats : e.g. {"energy": 300} to keep enough energy for casting
+    max_stats : e.g. {"efficiency": 1.75} for the in-game efficiency cap
+    workers   : processes to spread the top-level branches over (None = all cores, 1 = no pool)
+    """
+    t0 = time.perf_counter()
+    problem = _Problem(catalog, base, slots, min_stats, max_stats)
+    greedy = _greedy(problem)
+    incumbent = greedy["ehp"]
+    branches = [None] + list(range(len(problem.names)))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_search(problem, problem.base, first, incumbent) for first in branches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(problem,)) as pool:
+            results = list(pool.map(_run_branch, branches, [incumbent] * len(branches)))
+
+    # Workers only report builds strictly better than the greedy one, which stays the fallback
+    found = [r for r in results + [greedy] if r["build"] is not None]
+    if not found:
+        raise ValueError("no build satisfies the slot and stat constraints")
+    best = max(found, key=lambda r: r["ehp"])
+    totals = problem.base
+    for j in best["build"]:
+        totals = tuple(t + r for t, r in zip(totals, problem.rows[j]))
+    return {
+        "ehp": float(best["ehp"]),
+        "build": [problem.names[j] for j in best["build"]],
+        "totals": dict(zip(STATS, totals)),
+        "nodes": sum(r["nodes"] for r in results),
+        "seconds": time.perf_counter() - t0,
+    }
+
+def brute_force_build(catalog, base, slots, min_stats=None, max_stats=None):
+    """Max EHP over every build, for checking optimize_build on small catalogs. Returns (ehp, build names)."""
+    problem = _Problem(catalog, base, slots, min_stats, max_stats)
+    best, best_build = -np.inf, None
+    for size in range(problem.total_slots + 1):
+        for build in itertools.combinations(range(len(problem.rows)), size):
+            used = {}
+            for j in build:
+                used[problem.slot_of[j]] = used.get(problem.slot_of[j], 0) + 1
+            if any(count > problem.slots[slot] for slot, count in used.items()):
+                continue
+            totals, keep = problem.base, problem.base_keep
+            for j in build:
+                totals, keep = tuple(t + r for t, r in zip(totals, problem.rows[j])), keep * problem.rows[j][4]
+            if problem.feasible(totals) and build_ehp(*totals, keep) > best:
+                best, best_build = build_ehp(*totals, keep), [problem.names[j] for j in build]
+    return best, best_build
+
+def random_catalog(rng, n=9):
+    """Small random catalog of mostly one-stat entries (so cells of interchangeable entries form),
+    for check_against_brute_force."""
+    catalog = []
+    for k in range(n):
+        entry = {"name": f"m{k}", "slot": str(rng.choice(["mod", "mod", "arcane"]))}
+        for stat in rng.choice(list(STATS) + ["dr"], size=1 if rng.random() < 0.7 else 2, replace=False):
+            scale = {"health": 1500, "armor": 900, "energy": 400, "efficiency": 0.8, "dr": 0.9}[stat]
+            entry[str(stat)] = round(float(rng.uniform(0.05, 1.0) * scale), 2)
+        catalog.append(entry)
+    return catalog
+
+def check_against_brute_force(trials=300, seed=0, base_energy=0.0):
+    """optimize_build vs brute_force_build on random catalogs. base_energy=0 makes every efficiency-only
+    entry tie on solo EHP, the case the interchangeable-entry pruning has to get right. Returns the mismatches."""
+    rng = np.random.default_rng(seed)
+    base = {"health": 500, "armor": 200, "energy": base_energy, "efficiency": 1.0, "dr": []}
+    slots = {"mod": 3, "arcane": 1}
+    mismatches = []
+    for trial in range(trials):
+        catalog = random_catalog(rng)
+        fast = optimize_build(catalog, base, slots, workers=1)["ehp"]
+        exact, build = brute_force_build(catalog, base, slots)
+        if not np.isclose(fast, exact, rtol=1e-12):
+            mismatches.append({"trial": trial, "optimized": fast, "exact": exact, "build": build})
+    return mismatches
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Exact max-EHP build of the example catalog")
+    parser.add_argument("--check", type=int, metavar="TRIALS",
+                        help="compare against brute force on random catalogs with 0 base energy instead")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        mismatches = check_against_brute_force(args.check)
+        for m in mismatches:
+            print(f"trial {m['trial']}: {m['optimized']:,.0f} vs exact {m['exact']:,.0f} ({' + '.join(m['build'])})")
+        print(f"{args.check - len(mismatches)}/{args.check} random catalogs match brute force")
+        return 1 if mismatches else 0
+
+    result = optimize_build(EXAMPLE_CATALOG, EXAMPLE_BASE, EXAMPLE_SLOTS)
+    print(f"EHP {result['ehp']:,.0f}  ({result['nodes']:,} nodes, {result['seconds']:.2f}s)")
+    for name in result["build"]:
+        print(f"  {name}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,6 +3,9 @@ import numpy as np
 import math
 import random, numpy as np
 
+from Deterministic_Tex import OrderedTransformMatchingTex, build_tex
+from EHP_Build_Analysis import ehp_batch, rank_inputs
+
 config.pixel_width  = 2560   # or 2560
 config.pixel_height = 1440   # or 1440
 config.frame_rate   = 60     # optional
@@ -10,28 +13,28 @@ config.frame_rate   = 60     # optional
 #activate env .\manim-env\Scripts\Activate.ps1
 #render manim -pqh Warframe_Animations.py EnemyHealthAndDamage
 #render clean manim -pqh EHP_Formula_Animations.py EHPComputeExample --format=mov --transparent
+#render clean manim -pqh EHP_Formula_Animations.py EHPMarginalValue --format=mov --transparent
 
 class EHPFormula(Scene):
     def construct(self):
-        # --- Harden determinism
+        # --- Harden determinism (matching order: Deterministic_Tex)
         random.seed(0)
         np.random.seed(0)
-        config.threads = 1  # avoid nondeterministic submobject ordering
 
         # --- Formulas (unchanged layout)
-        formula_long = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{(\textbf{Modded Health} + \textbf{Total Energy} \cdot \textbf{Energy Efficiency})}"
-            r"{(\textbf{1} \cdot (\textbf{1} - \textbf{DR}_1) \cdot (1 - \textbf{DR}_2) \cdot "
-            r"\dfrac{\textbf{Net Armor}}{\textbf{Net Armor}+300} \cdot (1 - \textbf{DR}_4)\ldots)}"
-        ).scale_to_fit_width(config.frame_width - 1).move_to(ORIGIN)
+        formula_long, formula_dense = build_tex(
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{(\textbf{Modded Health} + \textbf{Total Energy} \cdot \textbf{Energy Efficiency})}"
+             r"{(\textbf{1} \cdot (\textbf{1} - \textbf{DR}_1) \cdot (1 - \textbf{DR}_2) \cdot "
+             r"\dfrac{\textbf{Net Armor}}{\textbf{Net Armor}+300} \cdot (1 - \textbf{DR}_4)\ldots)}"),
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{(\textbf{H} + \textbf{E} \cdot \textbf{Eff})}"
+             r"{\prod\limits_{\substack{i \\ \text{all DR}}} (1 - \mathbf{DR}_i)}"),
+        )
+        formula_long.scale_to_fit_width(config.frame_width - 1).move_to(ORIGIN)
         formula_long[0].set_color(RED)
 
-        formula_dense = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{(\textbf{H} + \textbf{E} \cdot \textbf{Eff})}"
-            r"{\prod\limits_{\substack{i \\ \text{all DR}}} (1 - \mathbf{DR}_i)}"
-        ).scale_to_fit_width(config.frame_width - 1).move_to(ORIGIN)
+        formula_dense.scale_to_fit_width(config.frame_width - 1).move_to(ORIGIN)
         formula_dense[0].set_color(RED)
 
         # --- Recommended explicit mapping
@@ -53,7 +56,7 @@ class EHPFormula(Scene):
 
         # Only morph explicitly mapped parts; fade/appear the rest for stability
         self.play(
-            TransformMatchingTex(
+            OrderedTransformMatchingTex(
                 formula_long, formula_dense,
                 key_map=key_map,
                 transform_mismatches=True,   # <- prevents "best-guess" pairing
@@ -68,7 +71,7 @@ class EHPFormula(Scene):
 class EHPComputeExample(Scene):
     def construct(self):
         # Repeatability
-        random.seed(0); np.random.seed(0); config.threads = 1
+        random.seed(0); np.random.seed(0)
 
         # --- Params (edit these) ---
         H   = 750
@@ -96,13 +99,30 @@ class EHPComputeExample(Scene):
             s = f"{x:.6g}"
             return s
 
-        # --- Step 1: Dense formula
-        step1 = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{(\textbf{H} + \textbf{E}\cdot\textbf{Eff})}"
-            r"{\prod\limits_{\substack{i \\ \text{all DR}}} (1 - \mathbf{DR}_i)}"
+        # --- TeX of every step, pre-compiled in parallel up front
+        labels = [rf"\mathbf{{DR}}_{i+1}" for i in range(len(dr_factors))]
+        denom_expanded_tex = "".join([rf"\left(1-{lab}\right)" for lab in labels])
+        numerator_numbers = rf"\left({f(H)} + {f(E)}\cdot{f(Eff)}\right)"
+        denom_numbers = "".join([rf"\left(1-{f(d)}\right)" for d in dr_factors])
+        value_str  = f"{ehp_value:,.2f}".replace(",", r"\,")  # e.g. 2\,864\,000\,000.00
+        value_bold = rf"\mathbf{{{value_str}}}"
+
+        step1, step2, step3, step4, step5, step6 = build_tex(
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{(\textbf{H} + \textbf{E}\cdot\textbf{Eff})}"
+             r"{\prod\limits_{\substack{i \\ \text{all DR}}} (1 - \mathbf{DR}_i)}"),
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{(\textbf{H} + \textbf{E}\cdot\textbf{Eff})}{" + denom_expanded_tex + r"}"),
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{" + numerator_numbers + r"}{" + denom_numbers + r"}"),
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{" + f(numerator_value) + r"}{" + denom_numbers + r"}"),
+            (r"\mathbf{EHP}", r"\boldsymbol{=}",
+             r"\frac{" + f(numerator_value) + r"}{" + f(denom_value) + r"}"),
+            (r"\mathbf{EHP}", r"\boldsymbol{=}", value_bold),
         )
-        
+
+        # --- Step 1: Dense formula
         center_fit(step1)
         step1.scale_to_fit_width(config.frame_width - 1)
         step1[0].set_color(RED)
@@ -113,17 +133,10 @@ class EHPComputeExample(Scene):
         self.wait(0.2)
 
         # --- Step 2: Expand product to explicit factors (matches dr_factors length)
-        labels = [rf"\mathbf{{DR}}_{i+1}" for i in range(len(dr_factors))]
-        denom_expanded_tex = "".join([rf"\left(1-{lab}\right)" for lab in labels])
-
-        step2 = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{(\textbf{H} + \textbf{E}\cdot\textbf{Eff})}{" + denom_expanded_tex + r"}"
-        )
         center_fit(step2)
         step2[0].set_color(RED)
 
-        self.play(TransformMatchingTex(
+        self.play(OrderedTransformMatchingTex(
             step1, step2,
             key_map={r"\prod\limits_{\substack{i \\ \text{all DR}}} (1 - \mathbf{DR}_i)": denom_expanded_tex},
             transform_mismatches=False, path_arc=PI/16, lag_ratio=0.05
@@ -131,13 +144,6 @@ class EHPComputeExample(Scene):
         self.wait(0.15)
 
         # --- Step 3: Substitute numbers
-        numerator_numbers = rf"\left({f(H)} + {f(E)}\cdot{f(Eff)}\right)"
-        denom_numbers = "".join([rf"\left(1-{f(d)}\right)" for d in dr_factors])
-
-        step3 = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{" + numerator_numbers + r"}{" + denom_numbers + r"}"
-        )
         center_fit(step3)
         step3[0].set_color(RED)
 
@@ -145,21 +151,17 @@ class EHPComputeExample(Scene):
         for lab, val in zip(labels, dr_factors):
             key_map_subs[lab] = f"{f(val)}"
 
-        self.play(TransformMatchingTex(
+        self.play(OrderedTransformMatchingTex(
             step2, step3, key_map=key_map_subs, transform_mismatches=True,
             path_arc=PI/20, lag_ratio=0.04
         ), run_time=1.3)
         self.wait(0.15)
 
         # --- Step 4: Evaluate numerator only
-        step4 = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{" + f(numerator_value) + r"}{" + denom_numbers + r"}"
-        )
         center_fit(step4)
         step4[0].set_color(RED)
 
-        self.play(TransformMatchingTex(
+        self.play(OrderedTransformMatchingTex(
             step3, step4, key_map={numerator_numbers: f(numerator_value)},
             transform_mismatches=False
         ), run_time=0.9)
@@ -168,16 +170,12 @@ class EHPComputeExample(Scene):
        # --- Step 5: Evaluate (1 - DR) factors, but instead of showing each,
         # jump straight to the multiplied value
 
-        # First create the direct fraction with multiplied denominator
-        step5 = MathTex(
-            r"\mathbf{EHP}", r"\boldsymbol{=}",
-            r"\frac{" + f(numerator_value) + r"}{" + f(denom_value) + r"}"
-        )
+        # The direct fraction with multiplied denominator
         center_fit(step5)
         step5[0].set_color(RED)
 
         # Transform from the full factor form directly to the single decimal denominator
-        self.play(TransformMatchingTex(
+        self.play(OrderedTransformMatchingTex(
             step4, step5,
             key_map={denom_numbers: f(denom_value)},
             transform_mismatches=False
@@ -185,16 +183,11 @@ class EHPComputeExample(Scene):
         self.wait(0.2)
 
         # --- Step 6: Final numeric EHP
-        value_str  = f"{ehp_value:,.2f}".replace(",", r"\,")  # e.g. 2\,864\,000\,000.00
-        value_bold = rf"\mathbf{{{value_str}}}"
-
-        step6 = MathTex(r"\mathbf{EHP}", r"\boldsymbol{=}", value_bold
-        )
         center_fit(step6)
         step6[0].set_color(RED)
 
 
-        self.play(TransformMatchingTex(
+        self.play(OrderedTransformMatchingTex(
             step5, step6,
             transform_mismatches=True
         ), run_time=0.8)
@@ -264,4 +257,48 @@ class ArmorDamageReduction(Scene):
         self.wait(3)
 
         # Clean finish
-        self.play(*[FadeOut(mobj) for mobj in self.mobjects])
\ No newline at end of file
+        self.play(*[FadeOut(mobj) for mobj in self.mobjects])
+
+class EHPMarginalValue(Scene):
+    def construct(self):
+        # --- Params (edit these, same build as EHPComputeExample) ---
+        H   = 750
+        E   = 0
+        Eff = 0
+        A   = 300
+        DRs = [0.90, 0.90]
+
+        names, gains, order = rank_inputs([H], [E], [Eff], [A], [DRs])
+        ehp_value = float(ehp_batch(H, E, Eff, A, DRs))
+
+        unit_text = {
+            "health": "+1 Health", "energy": "+1 Energy",
+            "efficiency": "+1% Efficiency", "armor": "+1 Armor",
+        }
+        def label(name):
+            return unit_text.get(name, "+1% " + name.replace("_", " "))
+
+        title = Text("What is one more point worth?", weight=BOLD).to_edge(UP)
+        subtitle = MathTex(
+            r"\mathbf{EHP}", r"\boldsymbol{=}", rf"\mathbf{{{ehp_value:,.0f}}}".replace(",", r"\,"),
+            font_size=40
+        ).next_to(title, DOWN, buff=0.3)
+        subtitle[0].set_color(RED)
+
+        self.play(FadeIn(title, shift=UP*0.2))
+        self.play(Write(subtitle))
+
+        rows = VGroup()
+        for rank, idx in enumerate(order[0], start=1):
+            gain = gains[0, idx]
+            color = YELLOW if rank == 1 else WHITE
+            rows.add(VGroup(
+                Text(f"{rank}.", font_size=30, color=color),
+                Text(label(names[idx]), font_size=30, color=color),
+                Text(f"+{gain:,.1f} EHP" if np.isfinite(gain) else "capped", font_size=30, color=color),
+            ).arrange(RIGHT, buff=0.4))
+        rows.arrange(DOWN, aligned_edge=LEFT, buff=0.25).next_to(subtitle, DOWN, buff=0.6)
+
+        self.play(LaggedStart(*[FadeIn(r, shift=RIGHT*0.2) for r in rows], lag_ratio=0.15, run_time=1.5))
+        self.play(Indicate(rows[0], color=YELLOW))
+        self.wait(2)
@@ -0,0 +1,274 @@
+import argparse
+import csv
+import sys
+from pathlib import Path
+from statistics import NormalDist
+import numpy as np
+
+from Enemy_Registry import load_registry
+from Level_Scaling_Tables import BLEND_A1, BLEND_A2, BLEND_B1, BLEND_B2, DAMAGE_K, DAMAGE_P, health_blend
+
+## ---------- Fit damage / health scaling constants to in-game measurements, all enemies at once (no manim import) ----------#
+#
+#run python Enemy_Fit.py damage damage_samples.csv                         # fits base_damage, base_level, K, P
+#run python Enemy_Fit.py health health_samples.csv --fix base_level --out health_fit.csv
+#
+# Samples are one measurement per row (several rows per enemy, any order):
+#
+#   name,level,value
+#   Corrupted Bombard,100,12034
+#
+# Every enemy is fitted by Levenberg-Marquardt least squares on log(value), i.e. on relative errors, so a
+# 2% misread counts the same at level 10 and at level 9000, and over log(parameters). All enemies run as one batch: samples are padded
+# to (n_enemies, max_samples) and every iteration is a handful of array operations plus one batched
+# (n_params x n_params) solve, for 3 enemies or 3000. Confidence intervals come from the covariance
+# s^2 (J^T J)^-1 at the optimum and Student's t, they need more samples than fitted parameters.
+#
+# Start values come from the enemy registry when the name is in it, otherwise from the samples.
+
+# ===================== CONFIG: =====================
+MAX_ITERATIONS = 1000       # per enemy, an iteration only runs the enemies that are still active
+TOLERANCE = 1e-10           # relative change of the cost that counts as converged
+GRADIENT_TOLERANCE = 1e-8   # relative cost decrease a full Gauss-Newton step still promises that counts as converged
+STEP_TOLERANCE = 1e-8       # change of every log(parameter) in an accepted step that counts as converged
+CONFIDENCE = 0.95
+
+# ================================================================================
+
+def _damage(L, base_damage, base_level, K, P):
+    return base_damage * (1 + K * np.maximum(L - base_level, 0.0) ** P)
+
+def _health(L, base_health, base_level, a1, b1, a2, b2):
+    return base_health * health_blend(L, base_level, a1=a1, b1=b1, a2=a2, b2=b2)
+
+# name -> parameters in order, model(L, *params), lower and upper bounds
+MODELS = {
+    "damage": {
+        "params": ("base_damage", "base_level", "K", "P"),
+        "model":  _damage,
+        "lower":  (1e-9, 1.0, 1e-9, 0.1),
+        "upper":  (np.inf, 9999.0, np.inf, 6.0),
+    },
+    "health": {
+        "params": ("base_health", "base_level", "a1", "b1", "a2", "b2"),
+        "model":  _health,
+        "lower":  (1e-9, 1.0, 1e-9, 0.1, 1e-9, 0.1),
+        "upper":  (np.inf, 9999.0, np.inf, 6.0, np.inf, 6.0),
+    },
+}
+
+def load_samples(path):
+    """{name: (levels, values)} from a name,level,value CSV."""
+    samples = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            levels, values = samples.setdefault(row["name"].strip(), ([], []))
+            levels.append(float(row["level"]))
+            values.append(float(row["value"]))
+    return {name: (np.array(L), np.array(v)) for name, (L, v) in samples.items()}
+
+def pack_samples(samples):
+    """names, levels, values and mask, padded to (n_enemies, max_samples)."""
+    names = list(samples)
+    n = max((len(L) for L, _ in samples.values()), default=0)
+    levels = np.ones((len(names), n))
+    values = np.ones((len(names), n))
+    mask = np.zeros((len(names), n), dtype=bool)
+    for i, name in enumerate(names):
+        L, v = samples[name]
+        levels[i, :len(L)], values[i, :len(v)], mask[i, :len(L)] = L, v, True
+    if np.any(values[mask] <= 0):
+        raise ValueError("values must be positive, the fit works on log(value)")
+    return names, levels, values, mask
+
+def _lowest_samples(levels, values, mask):
+    lowest = np.argmin(np.where(mask, levels, np.inf), axis=1)
+    rows = np.arange(len(levels))
+    return levels[rows, lowest], values[rows, lowest]
+
+def start_values(kind, names, levels, values, mask, registry=None):
+    """(n_enemies, n_params) start values: registry rows where known, else base level 1, the wiki
+    constants and the base value that puts the curve through the lowest sample."""
+    registry = load_registry() if registry is None else registry
+    first_level, first_value = _lowest_samples(levels, values, mask)
+    ones = np.ones(len(names))
+    if kind == "damage":
+        theta = np.column_stack([ones, ones, DAMAGE_K * ones, DAMAGE_P * ones])
+    else:
+        theta = np.column_stack([ones, ones, np.tile([BLEND_A1, BLEND_B1, BLEND_A2, BLEND_B2], (len(names), 1))])
+    known_names = set(registry.name)
+    known_rows = np.array([name in known_names for name in names], dtype=bool)
+    for i in np.flatnonzero(known_rows):
+        j = registry.index(names[i])
+        known = {"base_damage": registry.base_damage[j], "base_health": registry.base_health[j],
+                 "base_level": registry.base_level[j], "K": registry.K[j], "P": registry.P[j]}
+        for k, param in enumerate(MODELS[kind]["params"]):
+            theta[i, k] = known.get(param, theta[i, k])
+    theta[:, 1] = np.minimum(theta[:, 1], first_level)
+    unit = MODELS[kind]["model"](first_level[:, None], *theta.T[:, :, None])[:, 0] / theta[:, 0]
+    theta[:, 0] = np.where(known_rows, theta[:, 0], first_value / unit)
+    return theta
+
+def _t_quantile(q, dof):
+    # Closed forms for 1 and 2 dof, above that the Cornish-Fisher expansion of Student's t around the normal
+    # quantile: at q = 0.975 it is 4e-3 low at 3 dof, within 1e-3 from 4 dof and 1e-4 from 6 dof on
+    z = NormalDist().inv_cdf(q)
+    v = np.asarray(dof, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (z + (z**3 + z) / (4 * v)
+             + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2)
+             + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3)
+             + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * v**4))
+    t = np.where(v == 1, np.tan(np.pi * (q - 0.5)), t)
+    t = np.where(v == 2, (2 * q - 1) / np.sqrt(2 * q * (1 - q)), t)
+    return np.where(v > 0, t, np.nan)
+
+def _residuals(model, levels, log_values, mask, theta):
+    # theta (..., n_params) against levels (..., n_samples): one column per parameter
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        r = np.log(model(levels, *np.moveaxis(theta[..., None], -2, 0))) - log_values
+    return np.where(mask, np.nan_to_num(r, nan=1e6, posinf=1e6, neginf=-1e6), 0.0)
+
+def _jacobian(model, levels, log_values, mask, phi, free, r):
+    # d residuals / d log(params) by forward differences, all enemies and parameters in one model call:
+    # (n_enemies, n_free, n_samples)
+    idx = np.flatnonzero(free)
+    h = 1e-7 * np.maximum(np.abs(phi[:, idx]), 1.0)
+    stepped = np.repeat(phi[:, None, :], len(idx), axis=1)
+    stepped[:, np.arange(len(idx)), idx] += h
+    r_step = _residuals(model, levels[:, None, :], log_values[:, None, :], mask[:, None, :], np.exp(stepped))
+    return (r_step - r[:, None, :]) / h[:, :, None]
+
+def fit_batch(kind, levels, values, mask, theta0, fixed=(), max_iterations=MAX_ITERATIONS, tol=TOLERANCE,
+              gtol=GRADIENT_TOLERANCE, xtol=STEP_TOLERANCE, confidence=CONFIDENCE):
+    """Fit MODELS[kind] to every row of (levels, values, mask) at once, fixed parameters keep theta0.
+
+    Every parameter is positive and is searched as log(parameter): that is where the model's scales
+    multiply (base_damage * K) and their valleys are straight. The confidence interval is symmetric in
+    log(parameter) as well, stderr is the matching first-order standard error of the parameter itself.
+
+    Returns a dict of arrays: params, stderr, ci_low, ci_high (n_enemies, n_params), rms (rms log error),
+    n_samples, iterations and converged (n_enemies,).
+    """
+    spec = MODELS[kind]
+    model = spec["model"]
+    lower, upper = np.array(spec["lower"]), np.tile(spec["upper"], (len(levels), 1))
+    # No base level above the lowest sample: the samples below it would only see a flat curve
+    upper[:, 1] = np.minimum(upper[:, 1], _lowest_samples(levels, values, mask)[0])
+    lower, upper = np.log(lower), np.log(upper)
+    free = np.array([p not in fixed for p in spec["params"]])
+    phi = np.clip(np.log(np.array(theta0, dtype=float)), lower, upper)
+    log_values = np.log(values)
+    n_enemies, n_free = len(phi), int(free.sum())
+
+    r = _residuals(model, levels, log_values, mask, np.exp(phi))
+    cost = np.sum(r * r, axis=1)
+    damping = np.full(n_enemies, 1e-3)
+    active = np.ones(n_enemies, dtype=bool)
+    iterations = np.zeros(n_enemies, dtype=int)
+    eye = np.eye(n_free)
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        a = np.flatnonzero(active)
+        J = _jacobian(model, levels[a], log_values[a], mask[a], phi[a], free, r[a])
+        # Parameters on a bound that the gradient pushes further out sit this step out
+        Jtr = np.einsum("eps,es->ep", J, r[a])
+        on_bound = ((phi[a][:, free] <= lower[free]) & (Jtr > 0)) | ((phi[a][:, free] >= upper[a][:, free]) & (Jtr < 0))
+        J[on_bound] = 0.0
+        Jtr[on_bound] = 0.0
+        JtJ = np.einsum("eps,eqs->epq", J, J)
+        diag = np.einsum("epp->ep", JtJ)
+        # Gradient test: g^T (J^T J)^+ g is what an undamped Gauss-Newton step would still take off the cost.
+        # Near the optimum LM alternates accepted and rejected steps, and the cost test only sees the accepted ones
+        flat = np.einsum("ep,epq,eq->e", Jtr, np.linalg.pinv(JtJ), Jtr) <= gtol * cost[a]
+        A = JtJ + damping[a, None, None] * (eye * np.maximum(diag, 1e-12)[:, :, None])
+        step = -np.linalg.solve(A, Jtr[..., None])[..., 0]
+
+        trial = phi[a].copy()
+        trial[:, free] = np.clip(trial[:, free] + step, lower[free], upper[a][:, free])
+        with np.errstate(over="ignore"):
+            r_trial = _residuals(model, levels[a], log_values[a], mask[a], np.exp(trial))
+        cost_trial = np.sum(r_trial * r_trial, axis=1)
+
+        better = cost_trial < cost[a]
+        done = flat | (better & ((cost[a] - cost_trial) <= tol * np.maximum(cost[a], 1e-300)))
+        done |= better & np.all(np.abs(trial - phi[a]) <= xtol, axis=1)
+        done |= ~better & (damping[a] > 1e10)     # no step helps any more: at the optimum (or stuck on a bound)
+        phi[a[better]], r[a[better]], cost[a[better]] = trial[better], r_trial[better], cost_trial[better]
+        damping[a] = np.where(better, damping[a] / 10, damping[a] * 10)
+        iterations[a] += 1
+        active[a[done]] = False
+
+    # Covariance at the optimum
+    n_samples = mask.sum(axis=1)
+    dof = n_samples - n_free
+    J = _jacobian(model, levels, log_values, mask, phi, free, r)
+    JtJ = np.einsum("eps,eqs->epq", J, J)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s2 = np.where(dof > 0, cost / dof, np.nan)
+    cov = np.linalg.pinv(JtJ) * s2[:, None, None]
+    se_log = np.zeros_like(phi)
+    se_log[:, free] = np.sqrt(np.clip(np.einsum("epp->ep", cov), 0, None))
+    half = se_log * _t_quantile(0.5 + confidence / 2, dof)[:, None]
+    with np.errstate(over="ignore"):
+        theta, ci_low, ci_high = np.exp(phi), np.exp(phi - half), np.exp(phi + half)
+    # Fixed parameters exactly as given, not through log and exp
+    theta[:, ~free] = ci_low[:, ~free] = ci_high[:, ~free] = np.asarray(theta0, dtype=float)[:, ~free]
+    return {
+        "params": theta, "stderr": theta * se_log, "ci_low": ci_low, "ci_high": ci_high,
+        "rms": np.sqrt(cost / np.maximum(n_samples, 1)), "n_samples": n_samples,
+        "iterations": iterations, "converged": ~active,
+    }
+
+def fit_samples(kind, samples, fixed=(), registry=None, **kwargs):
+    """fit_batch on {name: (levels, values)}, start values from start_values. Returns (names, result)."""
+    names, levels, values, mask = pack_samples(samples)
+    theta0 = start_values(kind, names, levels, values, mask, registry)
+    return names, fit_batch(kind, levels, values, mask, theta0, fixed=fixed, **kwargs)
+
+def write_fits(path, kind, names, result):
+    params = MODELS[kind]["params"]
+    header = ["name"] + [f"{p}{suffix}" for p in params for suffix in ("", "_ci_low", "_ci_high")]
+    header += ["rms_log_error", "n_samples", "converged"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        for i, name in enumerate(names):
+            row = [name]
+            for k in range(len(params)):
+                row += [f"{result[key][i, k]:.10g}" for key in ("params", "ci_low", "ci_high")]
+            row += [f"{result['rms'][i]:.4g}", int(result["n_samples"][i]), bool(result["converged"][i])]
+            w.writerow(row)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit enemy damage/health scaling constants to measurements")
+    parser.add_argument("kind", choices=sorted(MODELS))
+    parser.add_argument("samples", type=Path, help="CSV with name,level,value rows")
+    parser.add_argument("--fix", nargs="*", default=[], help="parameters to keep at their start value")
+    parser.add_argument("--out", type=Path, help="write the fits as CSV")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.fix) - set(MODELS[args.kind]["params"])
+    if unknown:
+        parser.error(f"unknown parameters {sorted(unknown)}, {args.kind} has {MODELS[args.kind]['params']}")
+    names, result = fit_samples(args.kind, load_samples(args.samples), fixed=args.fix)
+
+    pct = round(CONFIDENCE * 100)
+    for i, name in enumerate(names):
+        state = "" if result["converged"][i] else "  (not converged)"
+        print(f"{name}: {result['n_samples'][i]} samples, rms log error {result['rms'][i]:.3g}{state}")
+        for k, param in enumerate(MODELS[args.kind]["params"]):
+            if param in args.fix:
+                print(f"    {param:12s} {result['params'][i, k]:.6g}  (fixed)")
+            else:
+                print(f"    {param:12s} {result['params'][i, k]:.6g}  "
+                      f"{pct}% CI [{result['ci_low'][i, k]:.6g}, {result['ci_high'][i, k]:.6g}]")
+    if args.out:
+        write_fits(args.out, args.kind, names, result)
+        print(f"wrote {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from Axis_Label_Atlas import AtlasAxes
+from Zoomable_Axes import ZoomableAxes, nice_step
+from Level_Scaling_Tables import health_blend, HEALTH_S1
+from Layer_Cache import LayeredScene
+
 config.pixel_width  = 2560   # or 2560
 config.pixel_height = 1440   # or 1440
 config.frame_rate   = 60     # optional
@@ -8,7 +13,7 @@ config.frame_rate   = 60     # optional
 #activate env .\manim-env\Scripts\Activate.ps1
 #render clean manim -pqh Enemy_Health_Scaling.py EnemyHealthPlotSimple --format=mov --transparent
 
-class EnemyHealthPlotFull(Scene):
+class EnemyHealthPlotFull(LayeredScene):
     def construct(self):
         # ---------------------------
         # Tunables
@@ -20,40 +25,15 @@ class EnemyHealthPlotFull(Scene):
         # ---------------------------
 
         # --- Formulas from the screenshots ---
-        # T(x) = (x - BaseLevel - 70)/10
-        def T(x):
-            return (x - BASE_LEVEL - 70.0)/10.0
-
-        # Smoothstep S1(x) over offset in [70, 80]
-        # S1(x) = 0, offset<70 ; = 3t^2 - 2t^3, 70<=offset<=80 ; = 1, offset>80
-        def S1(x):
-            offset = x - BASE_LEVEL
-            if offset < 70:
-                return 0.0
-            if offset > 80:
-                return 1.0
-            t = T(x)
-            return 3*t**2 - 2*t**3
-
-        # f1(x) = 1 + 0.015 (x - BaseLevel)^{2.12}, for offset < 70
-        def f1(x):
-            offset = max(x - BASE_LEVEL, 0.0)
-            return 1.0 + 0.015 * (offset**2.12)
-
-        # f2(x) = 1 + (24*sqrt(5)/5) (x - BaseLevel)^{0.72}, for offset > 80
-        def f2(x):
-            offset = max(x - BASE_LEVEL, 0.0)
-            return 1.0 + (24.0*np.sqrt(5.0)/5.0) * (offset**0.72)
-
-        # Smoothly blended scale factor
-        # scale(x) = (1 - S1) f1 + S1 f2
-        def scale(x):
-            s = S1(x)
-            return (1.0 - s)*f1(x) + s*f2(x)
+        # scale(x) = (1 - S1) f1 + S1 f2 with
+        #   f1(x) = 1 + 0.015 (x - BaseLevel)^{2.12},            for offset < 70
+        #   f2(x) = 1 + (24*sqrt(5)/5) (x - BaseLevel)^{0.72},   for offset > 80
+        #   S1(x) = smoothstep of T(x) = (x - BaseLevel - 70)/10 over offset in [70, 80]
+        # written once as piecewise curves in Level_Scaling_Tables (health_blend, HEALTH_S1)
 
         # Enemy Health = BaseHealth * scale(x)
         def health(x):
-            return BASE_HEALTH * scale(x)
+            return BASE_HEALTH * float(health_blend(x, BASE_LEVEL))
 
         # ---------------------------
         # Axes
@@ -73,7 +53,7 @@ class EnemyHealthPlotFull(Scene):
         if y_step == 0:
             y_step = magnitude
 
-        ax = Axes(
+        ax = ZoomableAxes(
             x_range=[x_min, x_max, max(10, (x_max-x_min)//8)],
             y_range=[0, y_max_guess, y_step],
             x_length=10.5, y_length=5.8,
@@ -109,11 +89,8 @@ class EnemyHealthPlotFull(Scene):
         
         # Smoothstep formula badge
         smooth_lbl = MathTex(
-            r"S_1(x)=\begin{cases}"
-            r"0,& x-\mathrm{BL }<70\\"
-            r"3T(x)^2-2T(x)^3,& 70\le x-\mathrm{BL}\le 80\\"
-            r"1,& x-\mathrm{BL}>80"
-            r"\end{cases}\!,\quad T(x)=\dfrac{x-\mathrm{BL}-70}{10}",
+            r"S_1(x)=" + HEALTH_S1.cases_tex() +
+            r"\!,\quad T(x)=\dfrac{x-\mathrm{BL}-70}{10}",
             font_size=28
         ).next_to(lbl_f2, DOWN)
         self.play(FadeIn(smooth_lbl, shift=DOWN*0.4))
@@ -130,8 +107,16 @@ class EnemyHealthPlotFull(Scene):
         # ---------------------------
         # Curves
         # ---------------------------
-        # Final (blended) health curve
-        health_graph = ax.plot(health, x_range=[x_min, x_max, 0.25], use_smoothing=True)
+        # Final (blended) health curve, plotted up to 10000 for the zoom at the end (only x_max is visible until then):
+        # every 0.25 levels up to x_max, every 10 levels beyond, ~1.8k samples instead of 40k
+        FINE, COARSE, X_END = 0.25, 10, 10000
+        n_fine = (x_max - x_min) / FINE
+        def level_at(t):
+            return x_min + FINE * t if t <= n_fine else min(x_max + COARSE * (t - n_fine), X_END)
+        health_graph = ax.track(ParametricFunction(
+            lambda t: ax.c2p(level_at(t), health(level_at(t))),
+            t_range=[0, n_fine + np.ceil((X_END - x_max) / COARSE), 1], use_smoothing=True,
+        ))
         health_graph.set_stroke(width=5)
         self.play(Create(health_graph), run_time=2)
 
@@ -158,45 +143,12 @@ class EnemyHealthPlotFull(Scene):
         self.wait(1)
         self.play(FadeOut(highlight))
 
-        # 1) Build long-range axes aligned & styled like the first
-        def nice_step(max_val, nticks=6):
-            if max_val <= 0: return 1
-            raw = max_val/nticks
-            m = 10**int(np.floor(np.log10(raw)))
-            for k in (1, 2, 2.5, 5, 10):
-                if raw <= k*m:
-                    return k*m
-            return 10*m
-        
+        # Zoom out to level 9999: ax only changes its ranges, the curve was plotted that far already
         y_final = health(9999)*1.08
-        y_step_final = nice_step(y_final)
-
-        ax_long = Axes(
-            x_range=[x_min, 9999, 1000],                 # final x-range + tick step
-            y_range=[0, y_final, y_step_final],            # keep your y range (or recompute)
-            x_length=10.5, y_length=5.8,
-            tips=False,
-            axis_config={"include_numbers": True, "font_size": 28, "color": GREY_B},
-        ).to_edge(DOWN).scale(0.9).move_to(ax)           # align with the existing axes
-
-        # 2) Build the long-range curve on the long axes
-        long_curve = ax_long.plot(
-            health, x_range=[x_min, 10000, 0.25], use_smoothing=True
-        ).set_stroke(width=5)
-
-        xmax_tr = ValueTracker(x_max)  # start where your first plot ends
-
-        long_curve = always_redraw(
-            lambda: ax_long.plot(
-                health, x_range=[x_min, xmax_tr.get_value(), 0.25], use_smoothing=True
-            ).set_stroke(width=5)
-        )
-
-        self.play(FadeTransform(health_graph,long_curve), run_time=1)
+        y_step_final = nice_step(y_final/6)
 
         self.play(
-            Transform(ax, ax_long),          
-            xmax_tr.animate.set_value(10000),
+            ax.zoom_to(x_range=[x_min, 9999, 1000], y_range=[0, y_final, y_step_final]),
             run_time=2
         )
 
@@ -225,40 +177,15 @@ class EnemyHealthPlotSimple(Scene):
         # ---------------------------
 
         # --- Formulas from the screenshots ---
-        # T(x) = (x - BaseLevel - 70)/10
-        def T(x):
-            return (x - BASE_LEVEL - 70.0)/10.0
-
-        # Smoothstep S1(x) over offset in [70, 80]
-        # S1(x) = 0, offset<70 ; = 3t^2 - 2t^3, 70<=offset<=80 ; = 1, offset>80
-        def S1(x):
-            offset = x - BASE_LEVEL
-            if offset < 70:
-                return 0.0
-            if offset > 80:
-                return 1.0
-            t = T(x)
-            return 3*t**2 - 2*t**3
-
-        # f1(x) = 1 + 0.015 (x - BaseLevel)^{2.12}, for offset < 70
-        def f1(x):
-            offset = max(x - BASE_LEVEL, 0.0)
-            return 1.0 + 0.015 * (offset**2.12)
-
-        # f2(x) = 1 + (24*sqrt(5)/5) (x - BaseLevel)^{0.72}, for offset > 80
-        def f2(x):
-            offset = max(x - BASE_LEVEL, 0.0)
-            return 1.0 + (24.0*np.sqrt(5.0)/5.0) * (offset**0.72)
-
-        # Smoothly blended scale factor
-        # scale(x) = (1 - S1) f1 + S1 f2
-        def scale(x):
-            s = S1(x)
-            return (1.0 - s)*f1(x) + s*f2(x)
+        # scale(x) = (1 - S1) f1 + S1 f2 with
+        #   f1(x) = 1 + 0.015 (x - BaseLevel)^{2.12},            for offset < 70
+        #   f2(x) = 1 + (24*sqrt(5)/5) (x - BaseLevel)^{0.72},   for offset > 80
+        #   S1(x) = smoothstep of T(x) = (x - BaseLevel - 70)/10 over offset in [70, 80]
+        # written once as piecewise curves in Level_Scaling_Tables (health_blend, HEALTH_S1)
 
         # Enemy Health = BaseHealth * scale(x)
         def health(x):
-            return BASE_HEALTH * scale(x)
+            return BASE_HEALTH * float(health_blend(x, BASE_LEVEL))
 
         # ---------------------------
         # Axes
@@ -278,7 +205,7 @@ class EnemyHealthPlotSimple(Scene):
         if y_step == 0:
             y_step = magnitude
 
-        ax = Axes(
+        ax = AtlasAxes(
             x_range=[x_min, x_max, max(10, (x_max-x_min)//8)],
             y_range=[0, y_max_guess, y_step],
             x_length=10.5, y_length=5.8,
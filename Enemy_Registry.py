@@ -0,0 +1,148 @@
+import csv
+from pathlib import Path
+import numpy as np
+
+from Level_Scaling_Tables import DAMAGE_K, DAMAGE_P, VARIANTS
+
+## ---------- Enemy archetypes as one array per column (no manim import) ----------#
+#
+# Every enemy is a row of enemy_archetypes.csv:
+#
+#   name,faction,base_damage,base_level,K,P,base_health,armor
+#   Corrupted Bombard,Corrupted,65,4,0.015,1.55,300,500
+#
+# K and P may be left empty for the wiki defaults, armor (base armor) for 0. Without the file SAMPLE_ENEMIES is used.
+# The registry keeps one numpy array per column, so every function below evaluates all enemies
+# at all levels in one broadcast, shape levels.shape + (n_enemies,):
+#
+#   enemies = load_registry()
+#   enemy_damage(np.arange(1, 10000), enemies)                       # (9999, n_enemies)
+#   enemy_damage(levels, enemies.select(faction="Corrupted"))
+
+# Next to this file, so rendering from another working directory still finds it
+ENEMY_CSV_PATH = Path(__file__).resolve().parent / "enemy_archetypes.csv"
+
+COLUMNS = ("name", "faction", "base_damage", "base_level", "K", "P", "base_health", "armor")
+NUMERIC_COLUMNS = COLUMNS[2:]
+
+# base_health is the example value of Enemy_Health_Scaling and armor an example value, measure them like the base damage
+SAMPLE_ENEMIES = [
+    ["Corrupted Bombard",      "Corrupted", 65, 4, 0.015, 1.55, 300, 500],
+    ["Corrupted Heavy Gunner", "Corrupted", 8,  8, 0.015, 1.55, 300, 500],
+]
+
+def _plain(v):
+    # 4.0 -> 4 so values print like the old module constants in MathTex
+    v = float(v)
+    return int(v) if v.is_integer() else v
+
+class EnemyRegistry:
+    """Struct of arrays over enemy archetypes, one attribute per column in COLUMNS."""
+
+    def __init__(self, columns):
+        sizes = {len(columns[c]) for c in COLUMNS}
+        if len(sizes) != 1:
+            raise ValueError(f"enemy registry columns have different lengths: {sorted(sizes)}")
+        self.name = np.asarray(columns["name"], dtype=object)
+        self.faction = np.asarray(columns["faction"], dtype=object)
+        for col in NUMERIC_COLUMNS:
+            setattr(self, col, np.asarray(columns[col], dtype=float))
+        self._index = {n: i for i, n in enumerate(self.name)}
+
+    @classmethod
+    def from_rows(cls, rows):
+        columns = {c: [] for c in COLUMNS}
+        defaults = {"K": DAMAGE_K, "P": DAMAGE_P, "armor": 0.0}
+        for row in rows:
+            row = dict(zip(COLUMNS, row)) if not isinstance(row, dict) else row
+            for c in COLUMNS:
+                value = row.get(c, "")
+                if isinstance(value, str):
+                    value = value.strip()
+                if value == "" and c in defaults:
+                    value = defaults[c]
+                elif value == "" or value is None:
+                    raise ValueError(f"enemy '{row.get('name')}' has no '{c}'")
+                columns[c].append(value)
+        return cls(columns)
+
+    def __len__(self):
+        return len(self.name)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def index(self, names):
+        """Row index of one name or an array of indices for a list of names."""
+        if isinstance(names, str):
+            if names not in self._index:
+                raise KeyError(f"unknown enemy '{names}'")
+            return self._index[names]
+        return np.array([self.index(n) for n in names], dtype=np.intp)
+
+    def take(self, rows):
+        """Registry with only the given rows (indices or boolean mask), in that order."""
+        return EnemyRegistry({c: getattr(self, c)[rows] for c in COLUMNS})
+
+    def select(self, names=None, faction=None):
+        rows = np.arange(len(self)) if names is None else self.index(list(names))
+        if faction is not None:
+            rows = rows[self.faction[rows] == faction]
+        return self.take(rows)
+
+    def params(self, name):
+        """(base_damage, base_level, K, P) of one enemy, in the argument order of damage()."""
+        i = self.index(name)
+        return tuple(_plain(getattr(self, c)[i]) for c in ("base_damage", "base_level", "K", "P"))
+
+def enemy_params(registry, name):
+    """registry.params(name), or the SAMPLE_ENEMIES values when the registry does not list that enemy."""
+    if name in registry:
+        return registry.params(name)
+    return EnemyRegistry.from_rows(SAMPLE_ENEMIES).params(name)
+
+def load_registry(path=ENEMY_CSV_PATH):
+    path = Path(path)
+    if not path.exists():
+        return EnemyRegistry.from_rows(SAMPLE_ENEMIES)
+    with open(path, newline="", encoding="utf-8") as f:
+        return EnemyRegistry.from_rows(list(csv.DictReader(f)))
+
+def _levels(levels, registry):
+    # (..., 1) against (n_enemies,), enemies never scale below their own base level
+    L = np.asarray(levels, dtype=float)[..., None]
+    return np.maximum(L, registry.base_level)
+
+def enemy_damage_multiplier(levels, registry, tables=None):
+    """1 + K (L - L0)^P for every enemy at every level.
+
+    With tables, the enemies whose K and P are the ones the table was built with are read from it."""
+    L = _levels(levels, registry)
+    if tables is None:
+        return 1 + registry.K * (L - registry.base_level) ** registry.P
+    in_table = (registry.K == tables.damage_K) & (registry.P == tables.damage_P)
+    out = np.empty(L.shape)
+    out[..., in_table] = tables.scaling("damage", L[..., in_table], registry.base_level[in_table])
+    rest = ~in_table
+    out[..., rest] = 1 + registry.K[rest] * (L[..., rest] - registry.base_level[rest]) ** registry.P[rest]
+    return out
+
+def enemy_damage(levels, registry, tables=None):
+    return registry.base_damage * enemy_damage_multiplier(levels, registry, tables)
+
+def enemy_health(levels, registry, variant="health_blend", tables=None):
+    """base_health times a Level_Scaling_Tables model, read from the mapped table when one is given."""
+    L = np.asarray(levels, dtype=float)[..., None]
+    if tables is not None:
+        return registry.base_health * tables.scaling(variant, L, registry.base_level)
+    return registry.base_health * VARIANTS[variant](L, registry.base_level)
+
+def levels_for_damage(target_damage, registry):
+    """Level at which each enemy's hit reaches target_damage (closed form of solve_level_for_damage).
+
+    An enemy with K = 0 never scales: base level if its base damage already reaches it, inf otherwise."""
+    target = np.asarray(target_damage, dtype=float)[..., None]
+    need = target / registry.base_damage - 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rhs = np.maximum(need, 0) / registry.K
+        return np.where(need <= 0, registry.base_level, registry.base_level + rhs ** (1.0 / registry.P))
@@ -0,0 +1,135 @@
+import numpy as np
+
+from Enemy_Registry import enemy_health
+from Piecewise_Curves import BLENDS, PiecewiseCurve, piece
+
+## ---------- Time to kill: weapon profiles against scaled enemy health and armor DR (no manim import) ----------#
+#
+# Per weapon, shot and enemy at level L:
+#   damage per shot = damage * multishot * (1 + crit_chance * (crit_multiplier - 1)) * (1 - DR(armor))
+#   shots           = ceil(health(L) / damage per shot)
+#   TTK             = (shots - 1) / fire_rate + reloads * reload_time,   reloads = (shots - 1) // magazine
+#
+# The first shot lands at t = 0, crits are averaged. Every function broadcasts weapons x levels x enemies,
+# ttk_grid fills a (n_weapons, n_levels, n_enemies) table in level chunks so 200 weapons x 9999 levels stays small.
+#
+#   ttk_grid(WEAPONS, np.arange(1, 10000), load_registry(), armor_model="proposed")
+
+# ===================== CONFIG: =====================
+# Armor DR models of TennoDRComparison (Armor_Changes.py)
+C_ARMOR = 300.0
+A1, A2 = 500.0, 750.0
+C1, C2, C3 = 0.50, 0.75, 0.90
+HL_ARMOR = 300
+LAMBDA = np.log(2) / HL_ARMOR
+
+# One column entry per weapon (example values)
+WEAPONS = {
+    "name":            ["Rifle",   "Shotgun"],
+    "damage":          [60.0,      30.0],     # per projectile
+    "multishot":       [1.0,       8.0],      # projectiles per shot
+    "fire_rate":       [8.0,       2.0],      # shots per second
+    "crit_chance":     [0.25,      0.10],
+    "crit_multiplier": [2.0,       2.0],
+    "magazine":        [60,        8],
+    "reload_time":     [2.0,       2.5],      # seconds
+}
+
+# Levels per chunk in ttk_grid, keeps the float64 temporaries at a few MB per weapon
+CHUNK_LEVELS = 1024
+
+# ================================================================================
+
+WEAPON_COLUMNS = ("damage", "multishot", "fire_rate", "crit_chance", "crit_multiplier", "magazine", "reload_time")
+
+def dr_vanilla(a):
+    a = np.asarray(a, dtype=float)
+    return a / (a + C_ARMOR)
+
+# c1, c2, c3 default to C1, C2, C3 and may be arrays (one curve per value, see Curve_Family)
+def _remaining_s1(A, c1=C1, c2=C2, c3=C3):
+    return 1 - c1 * BLENDS["smoothstep"](A / A1)
+
+def _remaining_s2(A, c1=C1, c2=C2, c3=C3):
+    return (1 - c1) * (1 - c2 * BLENDS["smoothstep"]((A - A1) / (A2 - A1)))
+
+def _remaining_s3(A, c1=C1, c2=C2, c3=C3):
+    return (1 - c1) * (1 - c2) * (1 - c3 * (1.0 - np.exp(-LAMBDA * (A - A2))))
+
+# Proposed DR: smoothstep to 50% at A1, to 75% more at A2, then 90% more approached with half-life HL_ARMOR
+DR_PROPOSED = PiecewiseCurve(
+    edges=[0, A1, A2],
+    segments=[
+        piece(0),
+        piece(lambda A, **c: 1 - _remaining_s1(A, **c), tex=r"C_1 S\!\left(\tfrac{A}{A_1}\right)"),
+        piece(lambda A, **c: 1 - _remaining_s2(A, **c), tex=r"1-(1-C_1)\left(1-C_2 S\!\left(\tfrac{A-A_1}{A_2-A_1}\right)\right)"),
+        piece(lambda A, **c: 1 - _remaining_s3(A, **c), tex=r"1-(1-C_1)(1-C_2)\left(1-C_3\left(1-e^{-\lambda (A-A_2)}\right)\right)"),
+    ],
+    variable_tex="A",
+)
+
+def dr_proposed_array(A, c1=C1, c2=C2, c3=C3):
+    """Proposed DR at armor A, see DR_PROPOSED. Everything broadcasts."""
+    return DR_PROPOSED(A, c1=c1, c2=c2, c3=c3)
+
+ARMOR_MODELS = {
+    "vanilla":  dr_vanilla,
+    "proposed": dr_proposed_array,
+    "none":     lambda a: np.zeros_like(np.asarray(a, dtype=float)),
+}
+
+def weapon_arrays(weapons):
+    """Weapon dict of per-weapon lists -> one float array per column, shape (n_weapons,)."""
+    arrays = {}
+    for col in WEAPON_COLUMNS:
+        if col not in weapons:
+            raise KeyError(f"weapon table is missing the '{col}' column")
+        arrays[col] = np.asarray(weapons[col], dtype=float).ravel()
+    sizes = {len(a) for a in arrays.values()}
+    if len(sizes) != 1:
+        raise ValueError(f"weapon columns have different lengths: {sorted(sizes)}")
+    return arrays
+
+def damage_per_shot(weapons):
+    """Average (crit-weighted) damage of one shot before armor, shape (n_weapons,)."""
+    w = weapon_arrays(weapons)
+    return w["damage"] * w["multishot"] * (1 + w["crit_chance"] * (w["crit_multiplier"] - 1))
+
+def time_to_kill(health, shot_damage, fire_rate, magazine, reload_time):
+    """TTK for health points against shot_damage per shot, everything broadcasts."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shots = np.ceil(np.divide(health, shot_damage))
+    extra = np.maximum(shots - 1, 0)
+    # No damage per shot never kills: inf shots, and floor_divide(inf, magazine) would be nan, not inf
+    finite = np.isfinite(extra)
+    reloads = np.floor_divide(np.where(finite, extra, 0), magazine)
+    return np.where(finite, extra / fire_rate + reloads * reload_time, np.inf)
+
+def ttk_grid(weapons, levels, registry, armor_model="vanilla", variant="health_blend", tables=None,
+             dtype=np.float32, chunk=CHUNK_LEVELS):
+    """TTK of every weapon against every enemy at every level, shape (n_weapons, n_levels, n_enemies).
+
+    Enemy health follows Level_Scaling_Tables `variant` (read from `tables` when given), armor stays at the
+    registry's base armor and reduces every shot by ARMOR_MODELS[armor_model]. Computed in float64 per
+    level chunk and stored as dtype.
+    """
+    w = weapon_arrays(weapons)
+    per_shot = damage_per_shot(weapons)[:, None, None]
+    # (1, 1, n_enemies): armor does not depend on level or weapon
+    per_shot = per_shot * (1.0 - ARMOR_MODELS[armor_model](registry.armor))[None, None, :]
+    fire_rate, magazine, reload_time = (w[c][:, None, None] for c in ("fire_rate", "magazine", "reload_time"))
+
+    levels = np.asarray(levels, dtype=float).ravel()
+    out = np.empty((len(per_shot), len(levels), len(registry)), dtype=dtype)
+    for lo in range(0, len(levels), chunk):
+        hi = lo + chunk
+        health = enemy_health(levels[lo:hi], registry, variant, tables)[None, :, :]
+        out[:, lo:hi] = time_to_kill(health, per_shot, fire_rate, magazine, reload_time)
+    return out
+
+def ttk_curve(weapons, weapon, registry, enemy, levels, **kwargs):
+    """(levels, seconds) of one weapon against one enemy, ready for plot_line_graph."""
+    w = list(weapons["name"]).index(weapon)
+    single = {col: [weapons[col][w]] for col in weapons}
+    levels = np.asarray(levels, dtype=float)
+    return levels, ttk_grid(single, levels, registry.select([enemy]), dtype=np.float64, **kwargs)[0, :, 0]
@@ -0,0 +1,135 @@
+from manim import *
+import numpy as np
+
+from Axis_Label_Atlas import AtlasAxes
+from Enemy_Registry import enemy_damage
+from Scene_Shared import TARGET_DAMAGE, enemies, nice_number
+
+# Setting output resolution of the manim animation
+config.pixel_width  = 2560
+config.pixel_height = 1440
+config.frame_rate   = 60
+
+#activate env .\manim-env\Scripts\Activate.ps1
+#render manim -pqh Enemy_Wave_DPS.py WaveDPSSweep
+#render clean manim -pqh Enemy_Wave_DPS.py WaveDPSSweep --format=mov --transparent
+
+## ---------- Total incoming damage per second of a mixed enemy spawn, swept over enemy level ----------#
+
+# ===================== CONFIG: =====================
+# One column entry per enemy type, names from the enemy registry (Enemy_Registry). count = how many of them
+# are shooting at you at the same time, fire_rate = hits per second of a single enemy
+# (example values, measure them in game like the base damage)
+SPAWN_MIX = {
+    "name":        ["Corrupted Bombard", "Corrupted Heavy Gunner"],
+    "count":       [2,                   4],
+    "fire_rate":   [0.5,                 6.0],
+}
+
+# Level sweep shown in the scene
+LEVEL_MIN = 1
+LEVEL_MAX = 9999
+
+# ================================================================================
+
+MIX_COLUMNS = ("name", "count", "fire_rate")
+
+def spawn_mix_arrays(mix):
+    """Turn a spawn-mix dict of per-enemy lists into one array per column."""
+    arrays = {}
+    for col in MIX_COLUMNS:
+        if col not in mix:
+            raise KeyError(f"spawn mix is missing the '{col}' column")
+        arrays[col] = np.asarray(mix[col], dtype=object if col == "name" else float).ravel()
+    sizes = {len(a) for a in arrays.values()}
+    if len(sizes) != 1:
+        raise ValueError(f"spawn mix columns have different lengths: {sorted(sizes)}")
+    return arrays
+
+def enemy_dps(levels, mix, registry=None):
+    """DPS of every enemy type at every level, shape levels.shape + (n_types,). registry defaults to enemies()."""
+    m = spawn_mix_arrays(mix)
+    registry = enemies() if registry is None else registry
+    per_hit = enemy_damage(levels, registry.select(m["name"]))
+    return per_hit * (m["count"] * m["fire_rate"])
+
+def wave_dps(levels, mix, registry=None):
+    """Total incoming DPS of the whole spawn mix at each level."""
+    return enemy_dps(levels, mix, registry).sum(axis=-1)
+
+def time_to_deplete(ehp, levels, mix, registry=None):
+    """Seconds the spawn mix needs to burn through ehp, shape ehp.shape + levels.shape."""
+    ehp = np.asarray(ehp, dtype=float)
+    dps = wave_dps(levels, mix, registry)
+    return ehp.reshape(ehp.shape + (1,) * dps.ndim) / dps
+
+def level_for_depletion_time(ehp, seconds, mix, levels=None, registry=None):
+    """Lowest level at which the mix strips ehp within `seconds` (nan if never reached).
+
+    Wave DPS only grows with level, so the answer is a searchsorted on the sweep
+    instead of a root solve per build. ehp and seconds broadcast against each other.
+    """
+    if levels is None:
+        levels = np.arange(LEVEL_MIN, LEVEL_MAX + 1)
+    levels = np.asarray(levels, dtype=float)
+    dps = wave_dps(levels, mix, registry)
+    needed = np.asarray(ehp, dtype=float) / np.asarray(seconds, dtype=float)
+    idx = np.searchsorted(dps, needed, side="left")
+    out = levels[np.minimum(idx, len(levels) - 1)]
+    return np.where(idx < len(levels), out, np.nan)
+
+class WaveDPSSweep(Scene):
+    def construct(self):
+        cTotal, cDot = RED, YELLOW
+        enemy_colors = [BLUE, GREEN, PURPLE, ORANGE]
+
+        # Data
+        levels = np.linspace(LEVEL_MIN, LEVEL_MAX, 200)
+        per_enemy = enemy_dps(levels, SPAWN_MIX)
+        total = per_enemy.sum(axis=-1)
+        L_one_second = level_for_depletion_time(TARGET_DAMAGE, 1.0, SPAWN_MIX)
+
+        title = Tex("Incoming DPS of the Spawn Mix", font_size=48).to_edge(UP)
+        self.play(FadeIn(title, shift=0.2*UP), run_time=0.6)
+
+        ax = AtlasAxes(
+            x_range=[0, LEVEL_MAX + 1, 1000],
+            y_range=[0, float(total.max()) * 1.1],
+            x_length=10.5, y_length=5.8,
+            axis_config={"include_ticks": False, "include_numbers": False, "color": GREY_B},
+            x_axis_config={"include_ticks": True, "include_numbers": True, "font_size": 24},
+            tips=False,
+        ).to_edge(DOWN)
+        x_label = ax.get_x_axis_label(Tex("Level $L$", font_size=32))
+        y_label = ax.get_y_axis_label(Tex("Damage per second", font_size=32))
+        self.play(Create(ax), FadeIn(x_label, y_label), run_time=1.0)
+
+        # One line per enemy type, then the aggregate on top
+        legend = VGroup()
+        for i, name in enumerate(SPAWN_MIX["name"]):
+            color = enemy_colors[i % len(enemy_colors)]
+            graph = ax.plot_line_graph(levels, per_enemy[:, i], add_vertex_dots=False, line_color=color, stroke_width=4)
+            count = SPAWN_MIX["count"][i]
+            legend.add(Text(f"{count}x {name}", font_size=22, color=color))
+            self.play(Create(graph), run_time=1.0)
+
+        total_graph = ax.plot_line_graph(levels, total, add_vertex_dots=False, line_color=cTotal, stroke_width=6)
+        legend.add(Text("Total", font_size=22, color=cTotal))
+        legend.arrange(DOWN, aligned_edge=LEFT, buff=0.12).next_to(ax.c2p(0, float(total.max())), RIGHT, buff=0.4)
+        self.play(Create(total_graph), FadeIn(legend), run_time=1.4)
+
+        # Where the whole EHP pool is gone within one second
+        if not np.isnan(L_one_second):
+            p = ax.c2p(L_one_second, TARGET_DAMAGE)
+            y_line = ax.get_horizontal_line(p, color=cTotal, stroke_width=4)
+            dot = Dot(p, color=cDot, radius=0.07)
+            readout = MathTex(
+                rf"\text{{{nice_number(TARGET_DAMAGE)} EHP gone in 1s at }} L \approx {int(L_one_second)}",
+                font_size=36, color=cDot,
+            )
+            readout_bg = BackgroundRectangle(readout, fill_opacity=0.8, buff=0.15)
+            readout_grp = VGroup(readout_bg, readout).next_to(p, UP, buff=0.3)
+            self.play(Create(y_line), GrowFromCenter(dot), run_time=0.8)
+            self.play(FadeIn(readout_grp, scale=0.9), run_time=0.6)
+
+        self.wait(2)
@@ -0,0 +1,109 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+import numpy as np
+
+## ---------- Static overlay layer: mobjects drawn above the animated ones are rasterized once per play ----------#
+#
+# manim already draws everything *below* the first animated mobject once per play() (the static image),
+# but everything after it in drawing order counts as moving and is rasterized again on every frame:
+# labels, titles and dots added after the axes, or the axes themselves when an earlier curve is animated.
+# LayeredScene splits that tail: mobjects after the last animated one are rasterized once into a transparent
+# overlay and alpha-composited over each frame, only in the tiles where the overlay has any pixels.
+#
+# Only an updater can change a mobject that no animation touches, so a play() in which any mobject of the
+# scene has an updater gets no overlay and is drawn like before. That is decided once per play(), nothing
+# is compared per frame.
+#
+#   class TennoDRComparison(LayeredScene):      # instead of Scene, nothing else changes
+
+OVERLAY_TILE = 16           # pixels, compositing works on tiles with any overlay alpha
+
+def _tile_view(array, tile):
+    h, w = array.shape[:2]
+    return array[:h - h % tile, :w - w % tile].reshape(h // tile, tile, w // tile, tile, *array.shape[2:])
+
+def _over(src, dst):
+    """Premultiplied alpha-over of uint8 RGBA: src + dst * (1 - src_alpha)."""
+    keep = 255 - src[..., 3:4].astype(np.uint16)
+    return (src + (dst.astype(np.uint16) * keep + 127) // 255).clip(0, 255).astype(np.uint8)
+
+class _Overlay:
+    def __init__(self, camera, mobjects):
+        self.mobjects = mobjects
+        self.rasterize(camera)
+
+    def rasterize(self, camera):
+        camera.set_pixel_array(np.zeros_like(camera.pixel_array))
+        camera.capture_mobjects(self.mobjects)
+        image = camera.pixel_array.copy()
+
+        t = OVERLAY_TILE
+        alpha = image[..., 3] > 0
+        self.tiles = np.nonzero(_tile_view(alpha, t).any(axis=(1, 3)))
+        self.tile_pixels = _tile_view(image, t)[self.tiles[0], :, self.tiles[1]]
+        h, w = alpha.shape
+        # Rows/columns that do not fill a whole tile are composited as plain strips
+        self.strips = [
+            (s, image[s]) for s in (np.s_[h - h % t:, :], np.s_[:h - h % t, w - w % t:])
+            if alpha[s].any()
+        ]
+
+    def composite(self, frame):
+        if len(self.tiles[0]):
+            view = _tile_view(frame, OVERLAY_TILE)
+            view[self.tiles[0], :, self.tiles[1]] = _over(self.tile_pixels, view[self.tiles[0], :, self.tiles[1]])
+        for s, pixels in self.strips:
+            frame[s] = _over(pixels, frame[s])
+
+class LayerCacheRenderer(CairoRenderer):
+    """CairoRenderer that composites the scene's overlay_mobjects from a cached raster."""
+
+    overlay = None
+
+    def play(self, scene, *args, **kwargs):
+        try:
+            return super().play(scene, *args, **kwargs)
+        finally:
+            self.overlay = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.overlay = None
+        image = super().save_static_frame_data(scene, static_mobjects)
+        overlay_mobjects = getattr(scene, "overlay_mobjects", [])
+        if overlay_mobjects:
+            self.overlay = _Overlay(self.camera, overlay_mobjects)
+        return image
+
+    def update_frame(self, scene, mobjects=None, *args, **kwargs):
+        super().update_frame(scene, mobjects, *args, **kwargs)
+        if self.overlay is not None and mobjects:
+            self.overlay.composite(self.camera.pixel_array)
+
+class LayeredScene(Scene):
+    """Scene rendered with LayerCacheRenderer, see the module comment."""
+
+    def __init__(self, renderer=None, camera_class=Camera, skip_animations=False, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = LayerCacheRenderer(camera_class=camera_class, skip_animations=skip_animations)
+        self.overlay_mobjects = []
+        super().__init__(renderer=renderer, camera_class=camera_class, skip_animations=skip_animations, **kwargs)
+
+    def compile_animation_data(self, *args, **kwargs):
+        # A frozen wait returns before get_moving_and_static_mobjects, it must not reuse the last play's overlay
+        self.overlay_mobjects = []
+        return super().compile_animation_data(*args, **kwargs)
+
+    def get_moving_and_static_mobjects(self, animations):
+        moving, static = super().get_moving_and_static_mobjects(animations)
+        if any(mob.updaters for mob in self.get_mobject_family_members()):
+            return moving, static
+        # manim's moving list is everything from the first animated mobject on, in drawing order.
+        # Whatever comes after the last one that is animated or in the foreground stays still.
+        active = set()
+        for anim in animations:
+            active.update(anim.mobject.get_family())
+        for mob in self.foreground_mobjects:
+            active.update(mob.get_family())
+        last = max((i for i, mob in enumerate(moving) if mob in active), default=len(moving) - 1)
+        self.overlay_mobjects = moving[last + 1:]
+        return moving[:last + 1], static
@@ -0,0 +1,213 @@
+import json
+import os
+import sys
+import numpy as np
+
+from Piecewise_Curves import BLENDS, PiecewiseCurve, blend, piece, ramp
+
+## ---------- Precomputed per-level scaling tables, memory-mapped read-only (no manim import) ----------#
+#
+# Enemy health and damage scaling only depend on (level, base level), so they are computed once for every
+# integer level and base level and written to one .npy file. Loading it with mmap_mode="r" costs nothing:
+# every render worker reads the same pages from the OS page cache instead of recomputing or unpickling.
+#
+#   python Level_Scaling_Tables.py                  # (re)build level_tables.npy + level_tables.json
+#
+#   tables = load_level_tables()
+#   tables.scaling("health_blend", levels, base_level=4)    # same values as health(x) / BASE_HEALTH
+#   enemy_damage(levels, registry, tables)                  # Enemy_Registry, also enemy_health
+#
+# Levels or base levels outside the table (or not integers) are computed directly, so callers never
+# have to care whether a table exists.
+
+# ===================== CONFIG: =====================
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLE_NAME = "level_tables"
+
+LEVEL_MIN = 1
+LEVEL_MAX = 9999
+BASE_LEVEL_MIN = 1
+BASE_LEVEL_MAX = 200
+
+# Damage scaling constants, K_WIKI and P_WIKI in Warframe_Animations
+DAMAGE_K = 0.015
+DAMAGE_P = 1.55
+
+# Health blend of EnemyHealthPlotFull: f1 = 1 + A1 d^B1, f2 = 1 + A2 d^B2
+BLEND_A1, BLEND_B1 = 0.015, 2.12
+BLEND_A2, BLEND_B2 = 24.0 * np.sqrt(5.0) / 5.0, 0.72
+
+# ================================================================================
+
+def _offset(x, base_level, **_):
+    return np.maximum(x - base_level, 0.0)
+
+def _f1_blend(d, a1=BLEND_A1, b1=BLEND_B1, **_):
+    return 1.0 + a1 * d**b1
+
+def _f2_blend(d, a2=BLEND_A2, b2=BLEND_B2, **_):
+    return 1.0 + a2 * d**b2
+
+# S1 of EnemyHealthPlotFull, also the source of its LaTeX label
+HEALTH_S1 = PiecewiseCurve(
+    edges=[70, 80],
+    segments=[piece(0), ramp("smoothstep", tex=r"3T(x)^2-2T(x)^3"), piece(1)],
+    variable=lambda x, base_level: x - base_level,
+    variable_tex=r"x-\mathrm{BL}",
+)
+
+_HEALTH_BLEND = PiecewiseCurve(
+    edges=[70, 80],
+    segments=[
+        piece(_f1_blend, tex=r"f_1(x)"),
+        blend(_f1_blend, _f2_blend, "smoothstep", left_tex=r"f_1(x)", right_tex=r"f_2(x)"),
+        piece(_f2_blend, tex=r"f_2(x)"),
+    ],
+    variable=_offset,
+    variable_tex=r"x-\mathrm{BL}",
+)
+
+def health_blend(L, base_level, a1=BLEND_A1, b1=BLEND_B1, a2=BLEND_A2, b2=BLEND_B2):
+    """Health multiplier of EnemyHealthPlotFull (Enemy_Health_Scaling.py), vectorized.
+
+    (1 - S1) * f1 + S1 * f2 with f1 = 1 + 0.015 d^2.12, f2 = 1 + 24*sqrt(5)/5 d^0.72
+    and S1 a smoothstep over d = L - base_level in [70, 80]. a1, b1, a2, b2 replace the
+    constants of f1/f2 (Enemy_Fit fits them), everything broadcasts.
+    """
+    return _HEALTH_BLEND(L, base_level=base_level, a1=a1, b1=b1, a2=a2, b2=b2)
+
+# Band edges of EnemyHealthAndDamage are absolute levels, f1/f2 use L - base_level
+def _f1_bands(x, base_level):
+    return (1 + 0.015 * (x - base_level))**2
+
+def _f2_bands(x, base_level):
+    return 1 + (24 * np.sqrt(5) / 5) * np.sqrt(np.maximum(x - base_level, 0.0))
+
+def _blend_band(x, base_level):
+    s = BLENDS["smoothstep"]((x - 50) / 50)
+    blend_value = (1 - s) * _f1_bands(x, base_level) + s * _f2_bands(x, base_level)
+    return (4.5 + 0.03 * (x - 50)) * blend_value
+
+_HEALTH_BANDS = PiecewiseCurve(
+    edges=[15, 25, 35, 50, 100],
+    segments=[
+        piece(_f1_bands, tex=r"f_1(x)"),
+        piece(lambda x, base_level: (1 + 0.025 * (x - 15)) * _f1_bands(x, base_level), tex=r"(1+0.025(x-15))\,f_1(x)"),
+        piece(lambda x, base_level: (1.25 + 0.125 * (x - 25)) * _f1_bands(x, base_level), tex=r"(1.25+0.125(x-25))\,f_1(x)"),
+        piece(lambda x, base_level: (2.5 + 2 / 15 * (x - 35)) * _f1_bands(x, base_level), tex=r"(2.5+\tfrac{2}{15}(x-35))\,f_1(x)"),
+        piece(_blend_band, tex=r"(4.5+0.03(x-50))\,\big((1-s_1)f_1(x)+s_1 f_2(x)\big)"),
+        piece(lambda x, base_level: 6 * _f2_bands(x, base_level), tex=r"6\,f_2(x)"),
+    ],
+)
+
+def health_bands(L, base_level):
+    """health_multiplier of EnemyHealthAndDamage (Warframe_Animations.py), vectorized.
+
+    The band edges (15, 25, 35, 50, 100) are absolute levels like in the scene, f1/f2 use L - base_level.
+    Below the base level f2 uses an offset of 0 instead of a complex square root.
+    """
+    return _HEALTH_BANDS(L, base_level=base_level)
+
+def damage_scaling(L, base_level, K=DAMAGE_K, P=DAMAGE_P):
+    """damage_multiplier of Warframe_Animations, 1 + K (L - L0)^P, held at 1 below the base level."""
+    offset = np.maximum(np.asarray(L, dtype=float) - base_level, 0.0)
+    return 1 + K * offset**P
+
+# One table slice per model, in file order. "damage" holds the wiki DAMAGE_K / DAMAGE_P only,
+# enemy_damage reads it for the enemies with those constants and computes the others directly
+VARIANTS = {
+    "health_blend": health_blend,
+    "health_bands": health_bands,
+    "damage":       damage_scaling,
+}
+
+def _paths(table_dir, name):
+    base = os.path.join(table_dir, name)
+    return base + ".npy", base + ".json"
+
+def _metadata():
+    # Everything the table values depend on, a table built with different settings is rebuilt/ignored
+    return {
+        "variants": list(VARIANTS),
+        "levels": [LEVEL_MIN, LEVEL_MAX],
+        "base_levels": [BASE_LEVEL_MIN, BASE_LEVEL_MAX],
+        "damage_K": DAMAGE_K,
+        "damage_P": DAMAGE_P,
+        "version": 1,
+    }
+
+def build_level_tables(table_dir=TABLE_DIR, name=TABLE_NAME):
+    """Write the (variant, base level, level) float64 table and its metadata, returns the .npy path.
+
+    The file is written under a temporary name and renamed over the old one, so workers that still
+    have the previous table mapped keep reading a complete file.
+    """
+    npy_path, json_path = _paths(table_dir, name)
+    levels = np.arange(LEVEL_MIN, LEVEL_MAX + 1, dtype=float)
+    base_levels = np.arange(BASE_LEVEL_MIN, BASE_LEVEL_MAX + 1, dtype=float)
+    shape = (len(VARIANTS), len(base_levels), len(levels))
+
+    tmp_path = npy_path + ".tmp"
+    table = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float64, shape=shape)
+    for v, func in enumerate(VARIANTS.values()):
+        # One base level per row keeps the temporaries at a single row
+        for b, base_level in enumerate(base_levels):
+            table[v, b] = func(levels, base_level)
+    table.flush()
+    del table
+    os.replace(tmp_path, npy_path)
+
+    with open(json_path + ".tmp", "w") as f:
+        json.dump(_metadata(), f, indent=2)
+    os.replace(json_path + ".tmp", json_path)
+    return npy_path
+
+class LevelTables:
+    """Read-only view on a built table, see load_level_tables."""
+
+    def __init__(self, table, metadata):
+        self.table = table
+        self.variants = {name: i for i, name in enumerate(metadata["variants"])}
+        self.level_min, self.level_max = metadata["levels"]
+        self.base_level_min, self.base_level_max = metadata["base_levels"]
+        self.damage_K, self.damage_P = metadata["damage_K"], metadata["damage_P"]
+
+    def scaling(self, variant, levels, base_level):
+        """Multiplier of `variant` at every level, levels and base_level broadcast against each other."""
+        L = np.asarray(levels, dtype=float)
+        B = np.asarray(base_level, dtype=float)
+        in_table = (
+            self.table is not None
+            and np.all(L == np.round(L)) and np.all(B == np.round(B))
+            and L.min(initial=self.level_min) >= self.level_min and L.max(initial=self.level_max) <= self.level_max
+            and B.min(initial=self.base_level_min) >= self.base_level_min
+            and B.max(initial=self.base_level_max) <= self.base_level_max
+        )
+        if not in_table:
+            return VARIANTS[variant](L, B)
+        rows = self.table[self.variants[variant]]
+        return rows[B.astype(np.intp) - self.base_level_min, L.astype(np.intp) - self.level_min]
+
+def load_level_tables(table_dir=TABLE_DIR, name=TABLE_NAME, build=False):
+    """Memory-map the table read-only.
+
+    A missing or outdated table gives a LevelTables that computes everything directly,
+    unless build=True, which builds it first.
+    """
+    npy_path, json_path = _paths(table_dir, name)
+    try:
+        with open(json_path) as f:
+            metadata = json.load(f)
+        current = metadata == _metadata()
+    except (OSError, ValueError):
+        current = False
+    if not current:
+        if not build:
+            return LevelTables(None, _metadata())
+        build_level_tables(table_dir, name)
+        metadata = _metadata()
+    return LevelTables(np.load(npy_path, mmap_mode="r"), metadata)
+
+if __name__ == "__main__":
+    path = build_level_tables(*sys.argv[1:2])
+    print(f"wrote {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
@@ -0,0 +1,96 @@
+from manim import *
+import numpy as np
+
+## ---------- always_redraw that only rebuilds when something it reads changed ----------#
+#
+# always_redraw(func) calls func() and become()s the result on every single frame. memo_redraw(func, *inputs)
+# keeps the last result as long as its inputs look the same as at the last build:
+#   - mobjects given as inputs are compared by their points and colors (whole family)
+#   - ValueTrackers are compared by value, and every ValueTracker func reads through get_value()
+#     is recorded during the build, so trackers never have to be listed
+#
+#   underline = memo_redraw(lambda: Underline(result[1], buff=0.06), result[1])
+#
+# REDRAW_COUNTS counts executed and skipped rebuilds over the whole render, log_redraw_counts() prints them.
+# snapshot_state / same_state are the comparison on their own, for anything else that needs to notice changes.
+
+REDRAW_COUNTS = {"executed": 0, "skipped": 0}
+
+_RECORDING = []     # stack of sets, the innermost build records into the last one
+_original_get_value = ValueTracker.get_value
+
+def _recording_get_value(self):
+    _RECORDING[-1].add(self)
+    return _original_get_value(self)
+
+def _build(func):
+    # get_value only records while a build runs, everywhere else ValueTracker is left as manim has it
+    if not _RECORDING:
+        ValueTracker.get_value = _recording_get_value
+    _RECORDING.append(set())
+    try:
+        mob = func()
+    finally:
+        trackers = _RECORDING.pop()
+        if not _RECORDING:
+            ValueTracker.get_value = _original_get_value
+    return mob, trackers
+
+def snapshot_state(inputs):
+    """Values of ValueTrackers and copies of points and colors (whole family) of mobjects, in order."""
+    state = []
+    for inp in inputs:
+        if isinstance(inp, ValueTracker):
+            state.append(_original_get_value(inp))
+            continue
+        for m in inp.get_family():
+            state.append(m.points.copy())
+            for attr in ("fill_rgbas", "stroke_rgbas", "stroke_width"):
+                value = getattr(m, attr, None)
+                if value is not None:
+                    state.append(np.array(value, copy=True))
+    return state
+
+def same_state(a, b):
+    """True when two snapshot_state() results are equal."""
+    if len(a) != len(b):
+        return False
+    for x, y in zip(a, b):
+        if isinstance(x, np.ndarray):
+            if not isinstance(y, np.ndarray) or x.shape != y.shape or not np.array_equal(x, y):
+                return False
+        elif x != y:
+            return False
+    return True
+
+def memo_redraw(func, *inputs):
+    """Like always_redraw(func), but func only runs again once one of its inputs changed.
+
+    inputs are the mobjects (and optionally ValueTrackers) func reads, ValueTrackers read through
+    get_value() are added automatically. The returned mobject has .executed and .skipped counters.
+    """
+    mob, trackers = _build(func)
+    declared = tuple(inputs)
+    memo = {"inputs": declared + tuple(t for t in trackers if t not in declared)}
+    memo["state"] = snapshot_state(memo["inputs"])
+    mob.executed, mob.skipped = 1, 0
+    REDRAW_COUNTS["executed"] += 1
+
+    def update(m):
+        state = snapshot_state(memo["inputs"])
+        if same_state(state, memo["state"]):
+            m.skipped += 1
+            REDRAW_COUNTS["skipped"] += 1
+            return
+        new, trackers = _build(func)
+        m.become(new)
+        memo["inputs"] = declared + tuple(t for t in trackers if t not in declared)
+        memo["state"] = snapshot_state(memo["inputs"])
+        m.executed += 1
+        REDRAW_COUNTS["executed"] += 1
+
+    mob.add_updater(update)
+    return mob
+
+def log_redraw_counts():
+    logger.info(f"memo_redraw: {REDRAW_COUNTS['executed']} rebuilds executed, {REDRAW_COUNTS['skipped']} skipped")
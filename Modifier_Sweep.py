@@ -0,0 +1,139 @@
+import argparse
+import sys
+import time
+import numpy as np
+
+from Level_Scaling_Tables import health_bands
+
+## ---------- Damage output of EnemyHealthAndDamage over every modifier combination (no manim import) ----------#
+#
+#   python Modifier_Sweep.py 5000                           # min strength for 5000 damage, levels 100..2000
+#   python Modifier_Sweep.py 5000 --levels 100 9999 100
+#
+# EnemyHealthAndDamage multiplies the enemy health multiplier at a level with one modifier factor
+#   leech * (1 + strength) * (1 + viral) * (1 + ability_damage) * (1 + vulnerability * (1 + strength))
+# Every function here takes each modifier as a scalar or a 1D array of values to sweep, and lays the
+# result out on a Cartesian grid, axes in the order (level,) + MODIFIERS, length 1 for a scalar:
+#
+#   out = sweep(levels, strength=np.linspace(0, 4, 41), viral=np.linspace(0, 4, 41))  # (n_levels, 1, 41, 41, 1, 1)
+#   s = min_strength(5000, levels, leech=np.linspace(0.1, 0.5, 9))                    # (n_levels, 9, 1, 1, 1)
+#
+# The level part and the modifier part are evaluated on their own axes and only meet in one broadcast
+# multiply into the output, so the only full-size array is the result. min_strength and reach_fraction
+# never build the full grid at all.
+
+# ===================== CONFIG: =====================
+MODIFIERS = ("leech", "strength", "viral", "ability_damage", "vulnerability")
+# The example values of EnemyHealthAndDamage, used for every modifier that is not swept
+SCENE_MODIFIERS = {"leech": 0.25, "strength": 2.0, "viral": 3.25, "ability_damage": 0.0, "vulnerability": 0.0}
+BASE_LEVEL = 100
+
+# ================================================================================
+
+def modifier_factor(leech, strength, viral, ability_damage, vulnerability):
+    """The modifier part of the damage output, same operation order as the scene (broadcasts)."""
+    return (
+        (leech * (1 + strength)) *
+        (1 + viral) *
+        (1 + ability_damage) *
+        (1 + vulnerability * (1 + strength))
+    )
+
+def health_multiplier(levels, base_level=BASE_LEVEL):
+    return health_bands(np.asarray(levels, dtype=float), base_level)
+
+def _grid(names, values):
+    # Every modifier on its own axis (after the level axis), scene value when not given
+    unknown = set(values) - set(MODIFIERS)
+    if unknown:
+        raise TypeError(f"unknown modifiers: {sorted(unknown)}")
+    ndim = len(names) + 1
+    axes = {}
+    for i, name in enumerate(names, 1):
+        v = np.atleast_1d(np.asarray(values.get(name, SCENE_MODIFIERS[name]), dtype=float))
+        if v.ndim != 1:
+            raise ValueError(f"{name} must be a scalar or a 1D array")
+        shape = [1] * ndim
+        shape[i] = len(v)
+        axes[name] = v.reshape(shape)
+    return axes
+
+def _levels(levels, ndim):
+    L = np.atleast_1d(np.asarray(levels, dtype=float))
+    return L.reshape((len(L),) + (1,) * (ndim - 1))
+
+def sweep(levels, base_level=BASE_LEVEL, out=None, **modifiers):
+    """Damage output on the whole grid, shape (n_levels, n_leech, n_strength, n_viral, n_ability, n_vuln).
+
+    out may be a preallocated float64 array (or np.memmap) of that shape."""
+    axes = _grid(MODIFIERS, modifiers)
+    factor = modifier_factor(**axes)     # modifier axes only, grows one axis at a time
+    hp = health_multiplier(_levels(levels, len(MODIFIERS) + 1), base_level)
+    shape = np.broadcast_shapes(hp.shape, factor.shape)
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, the grid is {shape}")
+    return np.multiply(hp, factor, out=out)
+
+def min_strength(threshold, levels, base_level=BASE_LEVEL, strength=None, **modifiers):
+    """Smallest strength whose damage output reaches threshold, for every level and the other modifiers,
+    shape (n_levels, n_leech, n_viral, n_ability, n_vuln).
+
+    Without a strength grid this is the exact value (below 0 when no strength is needed). With one, the
+    smallest grid value that reaches it, nan where none does."""
+    if "strength" in modifiers:
+        raise TypeError("pass the strength grid as strength=")
+    names = tuple(m for m in MODIFIERS if m != "strength")
+    axes = _grid(names, modifiers)
+    hp = health_multiplier(_levels(levels, len(names) + 1), base_level)
+    # threshold = hp * leech * (1 + viral) * (1 + ability) * u * (1 + vuln * u) with u = 1 + strength
+    v = axes["vulnerability"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = threshold / (hp * (axes["leech"] * (1 + axes["viral"]) * (1 + axes["ability_damage"])))
+        u = np.where(v > 0, (np.sqrt(1 + 4 * v * c) - 1) / (2 * v), c)
+    exact = u - 1
+    if strength is None:
+        return exact
+    grid = np.sort(np.atleast_1d(np.asarray(strength, dtype=float)))
+    i = np.searchsorted(grid, exact, side="left")
+    return np.where(i < len(grid), grid[np.minimum(i, len(grid) - 1)], np.nan)
+
+def reach_fraction(threshold, levels, base_level=BASE_LEVEL, **modifiers):
+    """Fraction of the modifier combinations whose damage output reaches threshold, one value per level.
+
+    The modifier factors are sorted once and every level is a binary search, the level x modifier grid
+    is never built."""
+    factor = np.sort(modifier_factor(**_grid(MODIFIERS, modifiers)).ravel())
+    hp = health_multiplier(np.atleast_1d(np.asarray(levels, dtype=float)), base_level)
+    with np.errstate(divide="ignore"):
+        needed = threshold / hp
+    return (len(factor) - np.searchsorted(factor, needed, side="left")) / len(factor)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Minimum strength and share of modifier combinations reaching a damage output")
+    parser.add_argument("threshold", type=float)
+    parser.add_argument("--levels", type=float, nargs=3, metavar=("START", "STOP", "STEP"), default=[100, 2000, 100])
+    parser.add_argument("--base-level", type=float, default=BASE_LEVEL)
+    parser.add_argument("--points", type=int, default=21, help="values per swept modifier")
+    args = parser.parse_args(argv)
+
+    start, stop, step = args.levels
+    levels = np.arange(start, stop + step / 2, step)
+    n = args.points
+    grid = {"leech": np.linspace(0.05, 0.5, n), "strength": np.linspace(0, 4, n), "viral": np.linspace(0, 4.5, n),
+            "ability_damage": np.linspace(0, 2, n), "vulnerability": np.linspace(0, 1, n)}
+
+    t0 = time.perf_counter()
+    fraction = reach_fraction(args.threshold, levels, args.base_level, **grid)
+    t1 = time.perf_counter()
+    scene = {k: v for k, v in SCENE_MODIFIERS.items() if k != "strength"}
+    needed = min_strength(args.threshold, levels, args.base_level, **scene).reshape(len(levels))
+    print(f"{n ** 5:,} modifier combinations sorted once, {len(levels)} level searches, {t1 - t0:.2f}s")
+    print(f"{'level':>8} {'min strength':>13} {'combos reaching':>16}")
+    for L, s, f in zip(levels, needed, fraction):
+        print(f"{L:8g} {max(s, 0):13.3f} {f:16.1%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
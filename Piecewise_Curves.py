@@ -0,0 +1,140 @@
+from bisect import bisect_left
+import numpy as np
+
+## ---------- Piecewise curves with smoothstep blends, written once, evaluated vectorized and as LaTeX (no manim import) ----------#
+#
+# A curve is a list of segments between sorted edges of a band variable u (len(segments) == len(edges) + 1):
+#
+#   S1 = PiecewiseCurve(
+#       edges=[70, 80],
+#       segments=[piece(0), ramp("smoothstep", tex=r"3T(x)^2-2T(x)^3"), piece(1)],
+#       variable=lambda x, base_level: x - base_level, variable_tex=r"x-\mathrm{BL}",
+#   )
+#   S1(levels, base_level=4)        # any shapes that broadcast
+#   S1.cases_tex()                  # \begin{cases}0,& x-\mathrm{BL}<70\\ ... \end{cases}
+#
+# Segment values are functions value(u, **params) or constants, blend(left, right) is
+# (1 - s(t)) * left + s(t) * right with t running 0 -> 1 across the segment.
+# Evaluation finds the band of every point once and evaluates each segment only on its own points,
+# instead of evaluating every band on every point and selecting afterwards. Points sorted by band are
+# evaluated slice by slice in place, unsorted ones are gathered per band and scattered back.
+# A point exactly on an edge belongs to the segment below it (like `if x <= 15` chains).
+
+BLENDS = {
+    "linear":       lambda t: t,
+    "smoothstep":   lambda t: 3*t**2 - 2*t**3,
+    "smootherstep": lambda t: t**3 * (t * (6*t - 15) + 10),
+}
+
+def _tex_number(v):
+    return f"{v:g}"
+
+def piece(value, tex=None):
+    """Segment equal to value(u, **params), or to a constant."""
+    if tex is None and not callable(value):
+        tex = _tex_number(value)
+    return {"kind": "piece", "value": value, "tex": tex}
+
+def ramp(kind="smoothstep", tex=None):
+    """Segment going 0 -> 1 across its band with the blend `kind`."""
+    return {"kind": "ramp", "blend": kind, "tex": tex}
+
+def blend(left, right, kind="smoothstep", tex=None, left_tex=None, right_tex=None):
+    """Segment (1 - s(t)) * left + s(t) * right, left/right like piece values."""
+    if tex is None and left_tex is not None and right_tex is not None:
+        tex = rf"(1-S)\,{left_tex}+S\,{right_tex}"
+    return {"kind": "blend", "left": left, "right": right, "blend": kind, "tex": tex}
+
+def _value(value, u, params):
+    if callable(value):
+        return value(u, **params)
+    return np.full(u.shape, float(value))
+
+def _is_scalar(v):
+    # Cheaper than np.ndim(v) == 0, which converts lists and floats to arrays first
+    return isinstance(v, (float, int, np.generic)) or (isinstance(v, np.ndarray) and v.ndim == 0)
+
+class PiecewiseCurve:
+    """Compiled piecewise curve, see the module comment."""
+
+    def __init__(self, edges, segments, variable=None, variable_tex="x"):
+        self.edges = np.asarray(edges, dtype=float)
+        self._edge_list = self.edges.tolist()
+        self.segments = list(segments)
+        self.variable = variable
+        self.variable_tex = variable_tex
+        if len(self.segments) != len(self.edges) + 1:
+            raise ValueError(f"{len(self.edges)} edges need {len(self.edges) + 1} segments, got {len(self.segments)}")
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError("edges must be strictly increasing")
+        for k, seg in enumerate(self.segments):
+            if seg["kind"] in ("ramp", "blend") and not 0 < k < len(self.edges):
+                raise ValueError("ramp/blend segments need an edge on both sides")
+            if seg["kind"] != "piece" and seg["blend"] not in BLENDS:
+                raise ValueError(f"unknown blend '{seg['blend']}', use one of {sorted(BLENDS)}")
+
+    def __call__(self, x, **params):
+        if _is_scalar(x) and all(_is_scalar(v) for v in params.values()):
+            return self._scalar(x, params)
+        names = list(params)
+        arrays = np.broadcast_arrays(np.asarray(x, dtype=float), *(np.asarray(params[n], dtype=float) for n in names))
+        shape = arrays[0].shape
+        x_flat = arrays[0].reshape(-1)
+        p_flat = {n: a.reshape(-1) for n, a in zip(names, arrays[1:])}
+
+        u = self.variable(x_flat, **p_flat) if self.variable is not None else x_flat
+        band = np.searchsorted(self.edges, u, side="left")
+        out = np.empty(u.shape)
+        if not np.any(band[1:] < band[:-1]):
+            # Points already ordered by band (level ranges, plot samples): every segment is one slice,
+            # evaluated and written through views, no gathered copies
+            bounds = np.searchsorted(band, np.arange(len(self.segments) + 1), side="left").tolist()
+            for k, seg in enumerate(self.segments):
+                lo, hi = bounds[k], bounds[k + 1]
+                if lo < hi:
+                    out[lo:hi] = self._segment(k, seg, u[lo:hi], {n: v[lo:hi] for n, v in p_flat.items()})
+            return out.reshape(shape)
+        for k, seg in enumerate(self.segments):
+            rows = np.flatnonzero(band == k)
+            if not len(rows):
+                continue
+            if len(rows) == len(u):
+                uk, pk = u, p_flat
+            else:
+                uk, pk = u[rows], {n: v[rows] for n, v in p_flat.items()}
+            out[rows] = self._segment(k, seg, uk, pk)
+        return out.reshape(shape)
+
+    def _scalar(self, x, params):
+        # One point (the per-frame plot callbacks): same segment functions on float64 scalars, without the
+        # broadcast / flatten / searchsorted / scatter round trip that costs ~50x the arithmetic here
+        x = np.float64(x)
+        params = {n: np.float64(v) for n, v in params.items()}
+        u = self.variable(x, **params) if self.variable is not None else x
+        band = bisect_left(self._edge_list, u) if u == u else len(self._edge_list)     # nan sorts last
+        return np.float64(self._segment(band, self.segments[band], u, params))
+
+    def _segment(self, k, seg, u, params):
+        if seg["kind"] == "piece":
+            return _value(seg["value"], u, params)
+        lo, hi = self.edges[k - 1], self.edges[k]
+        s = BLENDS[seg["blend"]]((u - lo) / (hi - lo))
+        if seg["kind"] == "ramp":
+            return s
+        return (1 - s) * _value(seg["left"], u, params) + s * _value(seg["right"], u, params)
+
+    def cases_tex(self):
+        """LaTeX cases block of the curve, conditions written on variable_tex."""
+        v = self.variable_tex
+        rows = []
+        for k, seg in enumerate(self.segments):
+            if seg["tex"] is None:
+                raise ValueError(f"segment {k} has no tex")
+            if k == 0:
+                cond = rf"{v}<{_tex_number(self.edges[0])}"
+            elif k == len(self.edges):
+                cond = rf"{v}>{_tex_number(self.edges[-1])}"
+            else:
+                cond = rf"{_tex_number(self.edges[k - 1])}\le {v}\le {_tex_number(self.edges[k])}"
+            rows.append(rf"{seg['tex']},& {cond}")
+        return r"\begin{cases}" + r"\\".join(rows) + r"\end{cases}"
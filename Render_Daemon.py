@@ -0,0 +1,223 @@
+import argparse
+import importlib
+import json
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+## ---------- Warm render daemon: import manim once, then render scene after scene without cold starts ----------#
+#
+#activate env .\manim-env\Scripts\Activate.ps1
+#run   python Render_Daemon.py serve
+#render python Render_Daemon.py render EHP_Formula_Animations.py EHPFormula -q h
+#render clean python Render_Daemon.py render Armor_Changes.py TennoDRComparison -q h --format=mov --transparent
+#stop  python Render_Daemon.py stop
+#
+# The daemon keeps manim, cairo, pango and numpy imported. Every job runs in its own tempconfig, like one
+# `manim` call would. The scene files themselves are only re-imported when one of them changed on disk,
+# and the config they set at import time (pixel_width, frame_rate, ...) is replayed for cached imports.
+
+HOST = "127.0.0.1"      # local only, the daemon renders whatever file it is told to
+PORT = 54321
+PROJECT_DIR = Path(__file__).resolve().parent
+
+# Same letters as manim's -ql / -qm / -qh / -qp / -qk
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+class SceneModuleCache:
+    """Imported scene files plus the config each one sets at import, re-imported only when changed."""
+
+    def __init__(self, project_dir):
+        self.project_dir = Path(project_dir).resolve()
+        self.stamps = {}        # module name -> (mtime_ns, size) at import
+        self.config_diff = {}   # module name -> (job settings at import, config keys it changed at import)
+        if str(self.project_dir) not in sys.path:
+            sys.path.insert(0, str(self.project_dir))
+
+    def _project_modules(self):
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if not path or name in ("__main__", __name__):
+                continue
+            path = Path(path).resolve()
+            if path.parent == self.project_dir and path != Path(__file__).resolve():
+                yield name, path
+
+    @staticmethod
+    def _stamp(path):
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+
+    def _stale(self):
+        for name, path in self._project_modules():
+            if not path.exists() or self.stamps.get(name) != self._stamp(path):
+                return True
+        return False
+
+    def _purge(self):
+        # Scene files import each other (Enemy_Wave_DPS -> Warframe_Animations), so one change
+        # drops all of them. They are cheap, manim itself stays imported.
+        for name, _ in list(self._project_modules()):
+            del sys.modules[name]
+        self.stamps.clear()
+        self.config_diff.clear()
+
+    def load(self, file, settings=()):
+        """Import (or reuse) a scene file. Must run inside the job's tempconfig.
+
+        settings identifies the job's quality/format: a diff recorded under other settings can miss
+        keys (frame_rate = 60 changes nothing under -qh but does under -ql), so those re-import.
+        """
+        from manim import config
+
+        path = (self.project_dir / file).resolve()
+        if path.parent != self.project_dir or path.suffix != ".py":
+            raise ValueError(f"{file} is not a scene file in {self.project_dir}")
+        name = path.stem
+
+        if self._stale():
+            self._purge()
+
+        recorded = self.config_diff.get(name)
+        if name in sys.modules and (recorded is None or recorded[0] != settings):
+            # Imported as a dependency of another scene file, or under other settings: diff unknown
+            del sys.modules[name]
+
+        if name in sys.modules:
+            for key, value in recorded[1].items():
+                config[key] = value
+            return sys.modules[name], False
+
+        before = config.copy()
+        module = importlib.import_module(name)
+        diff = {}
+        for key in config:
+            try:
+                changed = bool(config[key] != before[key])
+            except (ValueError, TypeError):
+                changed = True
+            if changed:
+                diff[key] = config[key]
+        self.config_diff[name] = (settings, diff)
+        for mod_name, mod_path in self._project_modules():
+            self.stamps.setdefault(mod_name, self._stamp(mod_path))
+        return module, True
+
+def render_job(cache, job, around_render=None):
+    """Render one scene like `manim -q<quality> <file> <scene> [--format ...] [--transparent]`.
+
+    around_render(scene) may return a context manager that wraps scene.render() (see Watch_Render.py).
+    """
+    from manim import tempconfig
+
+    t0 = time.perf_counter()
+    options = {
+        "quality": QUALITIES[job.get("quality", "h")],
+        "preview": bool(job.get("preview", False)),
+        "input_file": str((cache.project_dir / job["file"]).resolve()),
+        "scene_names": [job["scene"]],
+    }
+    if job.get("format"):
+        options["format"] = job["format"]
+    if job.get("transparent"):
+        options["transparent"] = True
+
+    with tempconfig(options):
+        settings = (options["quality"], options.get("format"), options.get("transparent", False))
+        module, reloaded = cache.load(job["file"], settings)
+        scene_cls = getattr(module, job["scene"], None)
+        if scene_cls is None:
+            raise ValueError(f"{job['file']} has no scene {job['scene']}")
+        scene = scene_cls()
+        if around_render is None:
+            scene.render()
+        else:
+            with around_render(scene):
+                scene.render()
+        writer = scene.renderer.file_writer
+        output = getattr(writer, "movie_file_path", None) or getattr(writer, "image_file_path", None)
+
+    return {"ok": True, "output": str(output), "reloaded": reloaded, "seconds": time.perf_counter() - t0}
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            job = json.loads(line)
+            if job.get("command") == "stop":
+                reply = {"ok": True, "stopping": True}
+                # shutdown() blocks until serve_forever returns, which can't happen while this handler runs
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                reply = render_job(self.server.cache, job)
+        except Exception as exc:
+            reply = {"ok": False, "error": repr(exc), "traceback": traceback.format_exc()}
+        self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+class RenderDaemon(socketserver.TCPServer):
+    """One job at a time, manim's config is global."""
+
+    allow_reuse_address = True
+
+    def __init__(self, host=HOST, port=PORT, project_dir=PROJECT_DIR):
+        super().__init__((host, port), _JobHandler)
+        self.cache = SceneModuleCache(project_dir)
+
+def serve(host=HOST, port=PORT):
+    t0 = time.perf_counter()
+    import manim  # noqa: F401  the whole point: pay for this once
+    import numpy  # noqa: F401
+    print(f"manim loaded in {time.perf_counter() - t0:.1f}s, listening on {host}:{port}")
+    with RenderDaemon(host, port) as server:
+        server.serve_forever(poll_interval=0.2)
+
+def send_job(job, host=HOST, port=PORT):
+    """Send one job to a running daemon and wait for its reply."""
+    with socket.create_connection((host, port)) as sock:
+        sock.sendall((json.dumps(job) + "\n").encode("utf-8"))
+        reply = sock.makefile("r", encoding="utf-8").readline()
+    return json.loads(reply)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm manim render daemon")
+    parser.add_argument("--port", type=int, default=PORT)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("serve", help="start the daemon")
+    sub.add_parser("stop", help="stop a running daemon")
+    render = sub.add_parser("render", help="render one scene through the daemon")
+    render.add_argument("file")
+    render.add_argument("scene")
+    render.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    render.add_argument("-p", "--preview", action="store_true")
+    render.add_argument("--format")
+    render.add_argument("-t", "--transparent", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(port=args.port)
+        return 0
+    if args.command == "stop":
+        job = {"command": "stop"}
+    else:
+        job = {"file": args.file, "scene": args.scene, "quality": args.quality,
+               "preview": args.preview, "format": args.format, "transparent": args.transparent}
+    reply = send_job(job, port=args.port)
+    if not reply["ok"]:
+        print(reply["traceback"], file=sys.stderr)
+        return 1
+    if "output" in reply:
+        print(f"{reply['output']}  ({reply['seconds']:.1f}s{', reloaded' if reply['reloaded'] else ''})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+import argparse
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from Render_Daemon import PROJECT_DIR, QUALITIES, SceneModuleCache, render_job, send_job
+
+## ---------- Scene-level output cache: unchanged scenes are not even constructed ----------#
+#
+#activate env .\manim-env\Scripts\Activate.ps1
+#render python Scene_Cache.py render Armor_Changes.py TennoDRComparison -q h
+#render python Scene_Cache.py all -q h --format=mov --transparent
+#
+# Every scene gets a key from everything its output can depend on:
+#   - the scene class and the module-level code of its file it can reach (tunables, helpers, imports),
+#     other scene classes of the same file are left out
+#   - every project file it imports, transitively
+#   - data files named in that code (warframe_table.csv, enemy_archetypes.csv, ...), by content
+#   - the render profile (quality, format, transparent) and the manim version
+# Code is compared as syntax trees, so comments and formatting do not count. On a hit the stored output
+# is returned straight away, on a miss the scene is rendered (through a running Render_Daemon if there is
+# one) and its output stored under the key.
+
+CACHE_DIR = PROJECT_DIR / "media" / "scene_cache"
+DATA_SUFFIXES = (".csv", ".json", ".jsonl", ".npy", ".txt", ".png", ".jpg", ".svg")
+
+def _defined_names(stmt):
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {stmt.name}
+    names = set()
+    for node in ast.walk(stmt):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+    return names
+
+def _used_names(stmt):
+    return {node.id for node in ast.walk(stmt) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)}
+
+def scene_statements(tree, scene):
+    """Module-level statements of a scene file that `scene` can depend on, in file order."""
+    body = tree.body
+    scene_stmt = next((s for s in body if isinstance(s, ast.ClassDef) and s.name == scene), None)
+    if scene_stmt is None:
+        raise ValueError(f"no class {scene}")
+    # Imports and statements that define no plain name (config.pixel_width = ...) always run
+    keep = {i for i, s in enumerate(body)
+            if s is scene_stmt or isinstance(s, (ast.Import, ast.ImportFrom)) or not _defined_names(s)}
+    needed = set()
+    while True:
+        for i in keep:
+            needed |= _used_names(body[i])
+        grown = {i for i, s in enumerate(body) if i not in keep and _defined_names(s) & needed}
+        if not grown:
+            return [body[i] for i in sorted(keep)]
+        keep |= grown
+
+def _imported_project_files(stmts, project_dir):
+    for stmt in stmts:
+        if isinstance(stmt, ast.Import):
+            modules = [alias.name for alias in stmt.names]
+        elif isinstance(stmt, ast.ImportFrom) and stmt.level == 0 and stmt.module:
+            modules = [stmt.module]
+        else:
+            continue
+        for module in modules:
+            path = project_dir / (module.split(".")[0] + ".py")
+            if path.exists():
+                yield path
+
+def _data_files(stmts, project_dir):
+    for stmt in stmts:
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.lower().endswith(DATA_SUFFIXES):
+                yield project_dir / node.value
+
+def _file_digest(path):
+    if not path.exists():
+        return "missing"
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _manim_version():
+    try:
+        from importlib.metadata import version
+        return version("manim")
+    except Exception:
+        return "unknown"
+
+def scene_key(file, scene, settings, project_dir=PROJECT_DIR):
+    """Content hash of everything the output of `scene` in `file` depends on."""
+    project_dir = Path(project_dir).resolve()
+    path = (project_dir / file).resolve()
+    stmts = scene_statements(ast.parse(path.read_text(encoding="utf-8")), scene)
+
+    parts = {"scene": [path.name, scene, [ast.dump(s) for s in stmts]], "modules": {}, "data": {}}
+    data = set(_data_files(stmts, project_dir))
+    todo = list(_imported_project_files(stmts, project_dir))
+    while todo:
+        dep = todo.pop()
+        if dep.name in parts["modules"] or dep == path:
+            continue
+        tree = ast.parse(dep.read_text(encoding="utf-8"))
+        parts["modules"][dep.name] = ast.dump(tree)
+        todo.extend(_imported_project_files(tree.body, project_dir))
+        data.update(_data_files(tree.body, project_dir))
+    for data_path in sorted(data):
+        parts["data"][data_path.name] = _file_digest(data_path)
+    parts["profile"] = [list(settings), _manim_version()]
+
+    blob = json.dumps(parts, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+def _settings(job):
+    return QUALITIES[job.get("quality", "h")], job.get("format"), bool(job.get("transparent", False))
+
+def lookup(key, cache_dir=CACHE_DIR):
+    """Stored output for key, or None."""
+    meta = Path(cache_dir) / f"{key}.json"
+    if not meta.exists():
+        return None
+    output = Path(cache_dir) / json.loads(meta.read_text(encoding="utf-8"))["output"]
+    return output if output.exists() else None
+
+def store(key, output, job, cache_dir=CACHE_DIR):
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    output = Path(output)
+    target = cache_dir / f"{key}{output.suffix}"
+    tmp = target.with_name(target.name + ".tmp")
+    # A copy, not a hard link: ffmpeg rewrites manim's output file in place on the next render
+    shutil.copy2(output, tmp)
+    os.replace(tmp, target)
+    meta = {"output": target.name, "file": job["file"], "scene": job["scene"],
+            "settings": list(_settings(job)), "stored": time.time()}
+    (cache_dir / f"{key}.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return target
+
+def cached_render(job, render=None, project_dir=PROJECT_DIR, cache_dir=CACHE_DIR):
+    """Reply like render_job, with "cached": True when the scene was not rendered at all.
+
+    render(job) does the actual render on a miss, by default through a running daemon or in this process.
+    """
+    t0 = time.perf_counter()
+    key = scene_key(job["file"], job["scene"], _settings(job), project_dir)
+    hit = lookup(key, cache_dir)
+    if hit is not None:
+        return {"ok": True, "output": str(hit), "cached": True, "key": key, "seconds": time.perf_counter() - t0}
+    reply = (render or _render)(job)
+    if reply.get("ok"):
+        reply["output"] = str(store(key, reply["output"], job, cache_dir))
+        reply.update(cached=False, key=key)
+    return reply
+
+_local_cache = None
+
+def _render(job):
+    global _local_cache
+    try:
+        return send_job(job)
+    except OSError:
+        pass
+    if _local_cache is None:
+        _local_cache = SceneModuleCache(PROJECT_DIR)
+    return render_job(_local_cache, job)
+
+def scene_classes(file, project_dir=PROJECT_DIR):
+    """Names of the Scene subclasses defined in a file, by syntax (nothing is imported).
+
+    Only classes with a construct of their own (or a scene of the same file as base) count, so base
+    classes that only add hooks, like LayeredScene, are not rendered as empty scenes."""
+    tree = ast.parse((Path(project_dir) / file).read_text(encoding="utf-8"))
+    out = []
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ClassDef):
+            bases = [b.id if isinstance(b, ast.Name) else getattr(b, "attr", "") for b in stmt.bases]
+            constructs = any(isinstance(f, ast.FunctionDef) and f.name == "construct" for f in stmt.body)
+            if any(base in out for base in bases) or (constructs and any(base.endswith("Scene") for base in bases)):
+                out.append(stmt.name)
+    return out
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render scenes, skipping those whose output is cached")
+    sub = parser.add_subparsers(dest="command", required=True)
+    one = sub.add_parser("render", help="render one scene")
+    one.add_argument("file")
+    one.add_argument("scene")
+    everything = sub.add_parser("all", help="render every scene of every project file")
+    for p in (one, everything):
+        p.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+        p.add_argument("--format")
+        p.add_argument("-t", "--transparent", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "render":
+        targets = [(args.file, args.scene)]
+    else:
+        targets = [(path.name, scene) for path in sorted(PROJECT_DIR.glob("*.py")) for scene in scene_classes(path.name)]
+
+    failed = 0
+    for file, scene in targets:
+        job = {"file": file, "scene": scene, "quality": args.quality,
+               "format": args.format, "transparent": args.transparent}
+        try:
+            reply = cached_render(job)
+        except Exception as exc:
+            reply = {"ok": False, "error": repr(exc)}
+        if not reply["ok"]:
+            print(f"{file} {scene}: failed\n{reply.get('traceback', reply.get('error'))}", file=sys.stderr)
+            failed += 1
+            continue
+        state = "cached" if reply["cached"] else f"rendered in {reply['seconds']:.1f}s"
+        print(f"{file} {scene}: {reply['output']}  ({state})")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
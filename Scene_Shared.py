@@ -0,0 +1,26 @@
+import functools
+
+from Enemy_Registry import load_registry
+
+## ---------- Values and helpers used by several scene files (no manim import) ----------#
+#
+# Scene files import these from here and never from each other: importing a scene file runs its config
+# assignments again, and every edit to it would invalidate the importing file in Scene_Cache / Watch_Render.
+
+# ===================== CONFIG: =====================
+# Enter your frame's EHP in the line below
+TARGET_DAMAGE = 7836050
+
+# ================================================================================
+
+@functools.lru_cache(maxsize=1)
+def enemies():
+    """The enemy registry (enemy_archetypes.csv), read on first use and shared after that."""
+    return load_registry()
+
+def nice_number(x):
+    if x >= 1_000_000:
+        return f"{x/1_000_000:.3g}M"
+    if x >= 1_000:
+        return f"{x/1_000:.3g}k"
+    return f"{x:g}"
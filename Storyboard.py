@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from Render_Daemon import PROJECT_DIR, QUALITIES, SceneModuleCache
+
+## ---------- Storyboard: only the start / middle / end frame of every play(), tiled into a contact sheet ----------#
+#
+#activate env .\manim-env\Scripts\Activate.ps1
+#render python Storyboard.py EHP_Formula_Animations.py EHPComputeExample
+#render python Storyboard.py Warframe_Tank_Table.py FramesTable -q l --workers 4
+#
+# Every worker runs the scene's construct() with manim's skip mode (each play() jumps straight to its end),
+# and only rasterizes the key frames of the plays it was given (play index % workers). Nothing else is drawn
+# and no video is written, so a layout review costs a few frames per play instead of the whole render.
+# Output in media/storyboard/<Scene>/:
+#   play_007_mid.png, ...       key frames at full resolution
+#   <Scene>_storyboard.png      contact sheet, one row per play with its start time, run time and animations
+#   <Scene>_storyboard.json     the same timings
+#
+# Static waits show one frame. Random numbers are seeded with STORYBOARD_SEED, so all workers build the same scene.
+
+# ===================== CONFIG: =====================
+KEY_FRACTIONS = {"start": 0.0, "mid": 0.5, "end": 1.0}
+STORYBOARD_DIR = PROJECT_DIR / "media" / "storyboard"
+STORYBOARD_SEED = 0
+THUMB_WIDTH = 480                   # pixels per frame on the contact sheet
+ROW_HEADER = 28                     # pixels of text above every row
+SHEET_BACKGROUND = (24, 24, 24)
+
+# ================================================================================
+
+class _StoryboardMixin:
+    """Put in front of a Scene class: skip every play(), rasterize only the key frames of the wanted ones."""
+
+    def __init__(self, wanted, **kwargs):
+        self.wanted = wanted
+        self.segments = []
+        self._capture = False
+        # Own clock: in skip mode renderer.time only moves in add_frame, which returns before it gets there
+        self.clock = 0.0
+        super().__init__(skip_animations=True, **kwargs)
+        # Everything (static image, frames, Layer_Cache overlays) is drawn through the camera
+        camera = self.renderer.camera
+        capture_mobjects = camera.capture_mobjects
+        def maybe_capture(*args, **kw):
+            if self._capture:
+                capture_mobjects(*args, **kw)
+        camera.capture_mobjects = maybe_capture
+
+    def play(self, *args, **kwargs):
+        index = len(self.segments)
+        self._capture = self.wanted(index)
+        self._frames = {}
+        try:
+            super().play(*args, **kwargs)
+        finally:
+            capture, self._capture = self._capture, False
+        if capture and not self._frames:
+            # Static wait: the frozen frame is already drawn
+            self._frames["start"] = self.renderer.get_frame()
+        label = ", ".join(type(anim).__name__ for anim in self.animations or [])
+        duration = self.get_run_time(self.animations)     # waits are a Wait animation, so this covers them
+        self.segments.append({"index": index, "start": self.clock, "duration": duration,
+                              "label": label, "frames": self._frames})
+        self.clock += duration
+
+    def play_internal(self, skip_rendering=False):
+        if self._capture:
+            duration = self.get_run_time(self.animations)
+            for name, fraction in KEY_FRACTIONS.items():
+                self.update_to_time(fraction * duration)
+                self.renderer.update_frame(self, self.moving_mobjects)
+                self._frames[name] = self.renderer.get_frame()
+        # Jump to the end, finish and clean up the animations like a skipped play()
+        super().play_internal(skip_rendering=True)
+
+def _thumbnail(frame):
+    from PIL import Image
+    image = Image.fromarray(frame, mode="RGBA")
+    height = round(image.height * THUMB_WIDTH / image.width)
+    return image.resize((THUMB_WIDTH, height), Image.LANCZOS)
+
+def _run_scene(file, scene, quality, wanted):
+    """construct() of the scene in skip mode, capturing the plays wanted(index) is true for."""
+    from manim import tempconfig
+
+    cache = SceneModuleCache(PROJECT_DIR)
+    options = {"quality": QUALITIES[quality], "dry_run": True, "disable_caching": True,
+               "input_file": str(PROJECT_DIR / file), "scene_names": [scene]}
+    with tempconfig(options):
+        module, _ = cache.load(file, (options["quality"], None, False))
+        scene_cls = getattr(module, scene)
+        story_cls = type(scene_cls.__name__, (_StoryboardMixin, scene_cls), {})
+        story = story_cls(wanted=wanted, random_seed=STORYBOARD_SEED)
+        story.setup()
+        story.construct()
+        story.tear_down()
+    return story
+
+def _worker(file, scene, quality, worker, workers, out_dir):
+    """Run the scene once, write the key frames of plays index % workers == worker. Returns the segments."""
+    from PIL import Image
+
+    story = _run_scene(file, scene, quality, lambda index: index % workers == worker)
+    segments = []
+    for seg in story.segments:
+        thumbs = {}
+        for name, frame in seg.pop("frames").items():
+            Image.fromarray(frame, mode="RGBA").save(out_dir / f"play_{seg['index']:03d}_{name}.png")
+            _thumbnail(frame).save(out_dir / f"{seg['index']:03d}_{name}.thumb.png")
+            thumbs[name] = f"{seg['index']:03d}_{name}.thumb.png"
+        seg["thumbs"] = thumbs
+        segments.append(seg)
+    return segments
+
+def contact_sheet(segments, out_dir, path):
+    """Tile the thumbnails row by row (one row per play) with each play's timing above it."""
+    from PIL import Image, ImageDraw
+
+    columns = list(KEY_FRACTIONS)
+    thumbs = [{name: Image.open(out_dir / file) for name, file in seg["thumbs"].items()} for seg in segments]
+    height = max((im.height for row in thumbs for im in row.values()), default=0)
+    gap = 8
+    sheet = Image.new("RGB", (len(columns) * (THUMB_WIDTH + gap) + gap,
+                              len(segments) * (height + ROW_HEADER + gap) + gap), SHEET_BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    for row, (seg, images) in enumerate(zip(segments, thumbs)):
+        y = gap + row * (height + ROW_HEADER + gap)
+        draw.text((gap, y + 6), f"#{seg['index']}  {seg['start']:.2f}s + {seg['duration']:.2f}s   {seg['label']}",
+                  fill=(230, 230, 230))
+        for col, name in enumerate(columns):
+            if name in images:
+                frame = images[name]
+                sheet.paste(frame, (gap + col * (THUMB_WIDTH + gap), y + ROW_HEADER), frame)
+    sheet.save(path)
+    for images in thumbs:
+        for im in images.values():
+            im.close()
+    return path
+
+def storyboard(file, scene, quality="h", workers=None):
+    """Key frames + contact sheet of one scene, see the module comment. Returns (sheet path, segments)."""
+    workers = workers or os.cpu_count() or 1
+    out_dir = STORYBOARD_DIR / scene
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for old in out_dir.glob("*.png"):
+        old.unlink()
+
+    # One pass without frames first: it compiles every formula into media/Tex, so the workers only read
+    # the cache instead of all writing the same .tex / .svg files at once on a cold cache
+    if workers > 1:
+        _run_scene(file, scene, quality, lambda index: False)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_worker, file, scene, quality, w, workers, out_dir) for w in range(workers)]
+        parts = [f.result() for f in futures]
+
+    # Every worker sees every play (for the timings) but only has the frames of its own
+    segments = []
+    for index, seg in enumerate(parts[0]):
+        owner = parts[index % workers][index]
+        segments.append(dict(seg, thumbs=owner["thumbs"]))
+
+    sheet = contact_sheet(segments, out_dir, out_dir / f"{scene}_storyboard.png")
+    for thumb in out_dir.glob("*.thumb.png"):
+        thumb.unlink()
+    timings = [{k: seg[k] for k in ("index", "start", "duration", "label")} for seg in segments]
+    (out_dir / f"{scene}_storyboard.json").write_text(json.dumps(timings, indent=2), encoding="utf-8")
+    return sheet, segments
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render only the key frames of every play() into a contact sheet")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    sheet, segments = storyboard(args.file, args.scene, args.quality, args.workers)
+    for seg in segments:
+        print(f"#{seg['index']:<3d} {seg['start']:8.2f}s  +{seg['duration']:6.2f}s  {seg['label']}")
+    print(f"{sheet}  ({len(segments)} plays, {time.perf_counter() - t0:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
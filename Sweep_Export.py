@@ -0,0 +1,159 @@
+import argparse
+import csv
+import functools
+import io
+import json
+import os
+import numpy as np
+
+from Enemy_Registry import load_registry, enemy_damage
+from Enemy_TTK import dr_vanilla, dr_proposed_array
+from Level_Scaling_Tables import load_level_tables
+
+## ---------- Export the numbers behind the curves as CSV / NPY / JSON Lines (no manim import) ----------#
+#
+#   python Sweep_Export.py enemy_health health.csv                          # levels 1..9999
+#   python Sweep_Export.py armor_dr dr.npy --start 0 --stop 5000 --step 0.5
+#   python Sweep_Export.py enemy_damage damage.jsonl
+#
+# The sweep is generated in CHUNK_ROWS pieces and every piece is written before the next one exists,
+# so memory stays the same for 10^4 or 10^8 rows. The format follows the file extension.
+
+# ===================== CONFIG: =====================
+CHUNK_ROWS = 1 << 16
+WRITE_BUFFER = 1 << 20      # bytes of file buffering
+
+# Enemy of EnemyHealthPlotFull
+HEALTH_BASE_LEVEL = 4
+HEALTH_BASE_HEALTH = 300
+
+# ================================================================================
+
+# Map the level tables once, every sweep over whole levels reads them (other x are computed directly)
+_tables = functools.lru_cache(maxsize=1)(load_level_tables)
+
+def _enemy_health(x):
+    return {"health": HEALTH_BASE_HEALTH * _tables().scaling("health_blend", x, HEALTH_BASE_LEVEL)}
+
+def _health_multiplier(x):
+    return {"health_multiplier": _tables().scaling("health_bands", x, 100)}
+
+def _armor_dr(x):
+    return {"dr_vanilla": dr_vanilla(x), "dr_proposed": dr_proposed_array(x)}
+
+# Read the registry once, not once per chunk
+_registry = functools.lru_cache(maxsize=1)(load_registry)
+
+def _enemy_damage(x):
+    enemies = _registry()
+    dmg = enemy_damage(x, enemies, _tables())
+    return {name: dmg[:, i] for i, name in enumerate(enemies.name)}
+
+# name -> (x column, function of the x chunk returning {column: values}, default start, stop, step)
+SWEEPS = {
+    "enemy_health":      ("level", _enemy_health,      1, 9999, 1),
+    "health_multiplier": ("level", _health_multiplier, 100, 2000, 1),
+    "armor_dr":          ("armor", _armor_dr,          0, 5000, 1),
+    "enemy_damage":      ("level", _enemy_damage,      1, 9999, 1),
+}
+
+def sweep_rows(start, stop, step):
+    """Number of x values in start, start + step, ... <= stop."""
+    if not step > 0:
+        raise ValueError(f"step must be > 0, got {step}")
+    return max(int(np.floor((stop - start) / step + 1e-9)) + 1, 0)
+
+def sweep_chunks(name, start=None, stop=None, step=None, chunk=CHUNK_ROWS):
+    """Yield (columns, (n_rows, n_columns) float64 array) per chunk of the sweep `name`.
+
+    x is start + i * step for integer i, so long sweeps do not drift like repeated additions would.
+    """
+    x_name, func, d_start, d_stop, d_step = SWEEPS[name]
+    start = d_start if start is None else start
+    stop = d_stop if stop is None else stop
+    step = d_step if step is None else step
+    n = sweep_rows(start, stop, step)
+    # An empty sweep still yields one (empty) chunk, so every writer gets the columns for its header
+    for lo in range(0, max(n, 1), chunk):
+        x = start + np.arange(lo, min(lo + chunk, n), dtype=float) * step
+        values = func(x)
+        columns = [x_name] + list(values)
+        yield columns, np.column_stack([x] + [np.asarray(v, dtype=float) for v in values.values()])
+
+def _write_text(chunks, path, header, row_format):
+    with open(path, "w", buffering=WRITE_BUFFER, newline="\n") as f:
+        for columns, block in chunks:
+            if header is not None:
+                f.write(header(columns))
+                header = None
+            np.savetxt(f, block, fmt=row_format(columns))
+
+def _csv_header(columns):
+    # Quoted by csv when an enemy name has a comma or quote in it
+    with io.StringIO() as buf:
+        csv.writer(buf, lineterminator="\n").writerow(columns)
+        return buf.getvalue()
+
+def write_csv(chunks, path):
+    _write_text(chunks, path, _csv_header, lambda cols: ",".join(["%.17g"] * len(cols)))
+
+def _json_number(v):
+    # Python's json reads NaN / Infinity / -Infinity (what json.dumps writes), not %g's nan / inf
+    return "%.17g" % v if np.isfinite(v) else json.dumps(float(v))
+
+def write_jsonl(chunks, path):
+    with open(path, "w", buffering=WRITE_BUFFER, newline="\n") as f:
+        for columns, block in chunks:
+            keys = [json.dumps(c) for c in columns]
+            if np.isfinite(block).all():
+                fmt = "{" + ", ".join(k.replace("%", "%%") + ": %.17g" for k in keys) + "}"
+                np.savetxt(f, block, fmt=fmt)
+                continue
+            for row in block:
+                f.write("{" + ", ".join(f"{k}: {_json_number(v)}" for k, v in zip(keys, row)) + "}\n")
+
+def write_npy(chunks, path, n_rows):
+    """Structured .npy with one float64 field per column, header first, then every chunk's bytes."""
+    with open(path, "wb", buffering=WRITE_BUFFER) as f:
+        written = 0
+        for k, (columns, block) in enumerate(chunks):
+            if k == 0:
+                dtype = np.dtype([(c, "<f8") for c in columns])
+                header = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (n_rows,)}
+                np.lib.format.write_array_header_2_0(f, header)
+            f.write(np.ascontiguousarray(block, dtype="<f8").tobytes())
+            written += len(block)
+    if written != n_rows:
+        raise RuntimeError(f"{path}: wrote {written} rows, header says {n_rows}")
+
+WRITERS = {".csv": write_csv, ".jsonl": write_jsonl, ".npy": write_npy}
+
+def export_sweep(name, path, start=None, stop=None, step=None, chunk=CHUNK_ROWS):
+    """Stream sweep `name` into path, the format follows the extension. Returns the number of rows."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in WRITERS:
+        raise ValueError(f"unknown export format '{ext}', use one of {sorted(WRITERS)}")
+    _, _, d_start, d_stop, d_step = SWEEPS[name]
+    n = sweep_rows(d_start if start is None else start, d_stop if stop is None else stop,
+                   d_step if step is None else step)
+    chunks = sweep_chunks(name, start, stop, step, chunk)
+    if ext == ".npy":
+        write_npy(chunks, path, n)
+    else:
+        WRITERS[ext](chunks, path)
+    return n
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export model sweeps as CSV, NPY or JSON Lines.")
+    parser.add_argument("sweep", choices=sorted(SWEEPS))
+    parser.add_argument("path", help="output file, .csv / .npy / .jsonl")
+    parser.add_argument("--start", type=float)
+    parser.add_argument("--stop", type=float)
+    parser.add_argument("--step", type=float)
+    parser.add_argument("--chunk", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+    n = export_sweep(args.sweep, args.path, args.start, args.stop, args.step, args.chunk)
+    print(f"wrote {n} rows to {args.path}")
+
+if __name__ == "__main__":
+    main()
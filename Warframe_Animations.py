@@ -2,6 +2,14 @@ from manim import *
 import numpy as np
 import math
 
+from Axis_Label_Atlas import AtlasAxes
+from Enemy_Registry import enemy_params
+from Layer_Cache import LayeredScene
+from Level_Scaling_Tables import health_bands
+from Memo_Redraw import memo_redraw, log_redraw_counts
+from Modifier_Sweep import modifier_factor
+from Scene_Shared import TARGET_DAMAGE, enemies, nice_number
+
 # Setting output resolution of the manim animation
 config.pixel_width  = 2560
 config.pixel_height = 1440 
@@ -13,7 +21,7 @@ config.frame_rate   = 60
 
 ## ---------- This is the animation for plotting the intersection between enemy damage and Warframe EHP ----------#
 
-class EnemyHealthAndDamage(Scene):
+class EnemyHealthAndDamage(LayeredScene):
     def construct(self):
         # Config
         base_level = 100
@@ -28,45 +36,15 @@ class EnemyHealthAndDamage(Scene):
         ability_damage = 0
         vulnerability = 0
 
-        # f1 and f2 definitions
-        def f1(x):
-            return (1 + 0.015 * (x - base_level))**2
-
-        def f2(x):
-            return (1 + (24 * np.sqrt(5) / 5) * ((x - base_level) ** 0.5))
-
-        def s1(x):
-            if x <= 50:
-                return 0
-            elif x >= 100:
-                return 1
-            else:
-                t = (x - 50) / 50
-                return 3 * t**2 - 2 * t**3
-
+        # Six level bands with f1/f2 and the s1 smoothstep between levels 50 and 100,
+        # written once as a piecewise curve in Level_Scaling_Tables (health_bands)
         def health_multiplier(x):
-            if x <= 15:
-                return f1(x)
-            elif x <= 25:
-                return (1 + 0.025 * (x - 15)) * f1(x)
-            elif x <= 35:
-                return (1.25 + 0.125 * (x - 25)) * f1(x)
-            elif x <= 50:
-                return (2.5 + 2/15 * (x - 35)) * f1(x)
-            elif x <= 100:
-                blend = (1 - s1(x)) * f1(x) + s1(x) * f2(x)
-                return (4.5 + 0.03 * (x - 50)) * blend
-            else:
-                return 6 * f2(x)
+            return float(health_bands(x, base_level))
 
+        # The modifier part lives in Modifier_Sweep, which sweeps it over every combination
         def damage(x):
             hp = health_multiplier(x)
-            return hp * (
-                (leech * (1 + strength)) *
-                (1 + viral) *
-                (1 + ability_damage) *
-                (1 + vulnerability * (1 + strength))
-            )
+            return hp * modifier_factor(leech, strength, viral, ability_damage, vulnerability)
 
         # Data
         levels = np.arange(x_min, x_max + 1, step)
@@ -117,20 +95,13 @@ class EnemyHealthAndDamage(Scene):
 K_WIKI = 0.015
 P_WIKI = 1.55
 
-# Bombard parameters
-BOMBARD_BASE_DAMAGE = 65    # In game testing at level 1 against overguard
-BOMBARD_BASE_LEVEL  = 4     # Found on wiki or via ingame testing with Trinity's EV
-BOMBARD_K = 0.015
-BOMBARD_P = 1.55
-
-# Heavy Gunner parameters
-HEAVY_BASE_DAMAGE = 8       # See bombard above
-HEAVY_BASE_LEVEL  = 8       # See bombard above
-HEAVY_K = 0.015
-HEAVY_P = 1.55
+# Enemy parameters come from enemy_archetypes.csv (see Enemy_Registry), base damage from in game testing
+# at level 1 against overguard, base level from the wiki or in game testing with Trinity's EV
+# (built-in values for an enemy the csv does not list, so a custom csv never breaks the scene).
+# The csv is read when WarframeDamageScalingOraxia is constructed, not when this file is imported
 
-# Enter your frame's EHP in the line below
-TARGET_DAMAGE = 7836050
+# Enemies that get a plot + intersection in WarframeDamageScalingOraxia, in order
+INTERSECT_ENEMIES = ["Corrupted Bombard", "Corrupted Heavy Gunner"]
 
 # ================================================================================
 
@@ -147,16 +118,11 @@ def solve_level_for_damage(target_damage, base_damage, base_level, K, P):
         return base_level
     return base_level + rhs ** (1.0 / P)
 
-def nice_number(x):
-    if x >= 1_000_000:
-        return f"{x/1_000_000:.3g}M"
-    if x >= 1_000:
-        return f"{x/1_000:.3g}k"
-    return f"{x:g}"
-
-class WarframeDamageScalingOraxia(Scene):
+class WarframeDamageScalingOraxia(LayeredScene):
     def construct(self):
         cL, cBase, cMul, cDmg, cConst = YELLOW, BLUE, GREEN, RED, PURPLE
+        BOMBARD_BASE_DAMAGE, BOMBARD_BASE_LEVEL, BOMBARD_K, BOMBARD_P = enemy_params(enemies(), "Corrupted Bombard")
+        HEAVY_BASE_DAMAGE, HEAVY_BASE_LEVEL, HEAVY_K, HEAVY_P = enemy_params(enemies(), "Corrupted Heavy Gunner")
 
         # ---------- Titles ----------
         title_wiki    = Tex("Wiki Generic", font_size=52).to_edge(UP)
@@ -255,29 +221,19 @@ class WarframeDamageScalingOraxia(Scene):
         self.wait(0.4)
         self.play(FadeOut(group_heavy, title_heavy), run_time=0.7)
 
-        # ---------- Plot & intersection (Bombard) ----------
-        self._plot_and_intersect(
-            scene_title="Corrupted Bombard",
-            base_damage=BOMBARD_BASE_DAMAGE,
-            base_level=BOMBARD_BASE_LEVEL,
-            K=BOMBARD_K,
-            P=BOMBARD_P,
-            target_damage=TARGET_DAMAGE,
-            curve_color=cBase,
-            dot_color=YELLOW
-        )
-
-        # ---------- Plot & intersection (Heavy) ----------
-        self._plot_and_intersect(
-            scene_title="Corrupted Heavy Gunner",
-            base_damage=HEAVY_BASE_DAMAGE,
-            base_level=HEAVY_BASE_LEVEL,
-            K=HEAVY_K,
-            P=HEAVY_P,
-            target_damage=TARGET_DAMAGE,
-            curve_color=cBase,
-            dot_color=YELLOW
-        )
+        # ---------- Plot & intersection, one per enemy ----------
+        for name in INTERSECT_ENEMIES:
+            base_damage, base_level, K, P = enemy_params(enemies(), name)
+            self._plot_and_intersect(
+                scene_title=name,
+                base_damage=base_damage,
+                base_level=base_level,
+                K=K,
+                P=P,
+                target_damage=TARGET_DAMAGE,
+                curve_color=cBase,
+                dot_color=YELLOW
+            )
 
     # ---------- Plot + horizontal line + drop to X-axis ----------
     def _plot_and_intersect(self, scene_title, base_damage, base_level, K, P, target_damage, curve_color, dot_color):
@@ -332,7 +288,7 @@ class WarframeDamageScalingOraxia(Scene):
         x_nums = np.arange(x_lo, x_hi + x_step/2, x_step)
         y_nums = np.arange(y_lo, y_hi + y_step/2, y_step)
 
-        ax = Axes(
+        ax = AtlasAxes(
             x_range=[x_lo, x_hi, x_step],
             y_range=[y_lo, y_hi, y_step],
             x_length=10.5, y_length=5.8,
@@ -428,6 +384,19 @@ class WarframeDamageScalingOraxia(Scene):
 
 
 
+
+# ===================== CONFIG: =====================
+# Example build for EHPFormula2, the color slices of the numeric step assume these digit counts
+NOMINAL_HEALTH = 12000
+NET_ARMOR = 90
+NET_DAMAGE_REDUCTION = 0.75
+DAMAGE_TYPE_MOD = 0.5
+RESULT_DECIMALS = 0
+
+# ================================================================================
+
+def fmt(x):
+    return f"{x:g}"
 
 class EHPFormula2(Scene):
 
@@ -500,8 +469,9 @@ class EHPFormula2(Scene):
 
         result[0][0].set_color(RED)
 
-        underline = always_redraw(
-            lambda: Underline(result[1], buff=0.06).set_color(WHITE)
+        # Rebuilt only when result[1] changes, not on every frame
+        underline = memo_redraw(
+            lambda: Underline(result[1], buff=0.06).set_color(WHITE), result[1]
         )
 
         result_group = VGroup(result, underline)
@@ -510,8 +480,8 @@ class EHPFormula2(Scene):
 
         # Clean end frame
         end_result = result.copy()
-        end_underline = always_redraw(
-            lambda: Underline(end_result[1], buff=0.06).set_color(WHITE)
+        end_underline = memo_redraw(
+            lambda: Underline(end_result[1], buff=0.06).set_color(WHITE), end_result[1]
         )
         end_group = VGroup(nums.copy(), VGroup(end_result, end_underline)).arrange(DOWN, buff=0.4)
         end_group.move_to(ORIGIN)
@@ -524,4 +494,5 @@ class EHPFormula2(Scene):
             )
         )
 
-        self.wait(1)
\ No newline at end of file
+        self.wait(1)
+        log_redraw_counts()
\ No newline at end of file
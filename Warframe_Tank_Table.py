@@ -1,8 +1,14 @@
 from manim import *
 import csv
+import numpy as np
 from pathlib import Path
 from manim import config
 
+from Axis_Label_Atlas import AtlasAxes
+from Enemy_Registry import enemy_damage, levels_for_damage, load_registry
+from Layer_Cache import LayeredScene
+from Level_Scaling_Tables import LEVEL_MAX, LEVEL_MIN, load_level_tables
+
 # Setting output resolution of the manim animation
 config.pixel_width  = 2560
 config.pixel_height = 1440
@@ -11,10 +17,13 @@ config.frame_rate   = 60
 #activate env .\manim-env\Scripts\Activate.ps1
 #render manim -pqh Warframe_Animations.py EnemyHealthAndDamage
 #render clean manim -pqh Warframe_Tank_Table.py FramesTable --format=mov --transparent
+#render clean manim -pqh Warframe_Tank_Table.py FramesTableUpdate --format=mov --transparent
+#render manim -pqh Warframe_Tank_Table.py OneShotHeatmap
 
 ## ---------- This is the animation for plotting the table of all my evaluated Health Tanks ----------#
 
 CSV_PATH = Path("warframe_table.csv")
+PREVIOUS_CSV_PATH = Path("warframe_table_previous.csv")     # the table before the patch, for FramesTableUpdate
 FONT_SIZE = 26
 MAYBE_COLOR = ManimColor("#FFA500")
 
@@ -55,10 +64,10 @@ SAMPLE_ROWS = [
     ["23","Oberon","993,042","YES","NO","YES","NO","F"],
 ]
 
-def load_rows():
-    if CSV_PATH.exists():
+def load_rows(path=CSV_PATH):
+    if path.exists():
         rows = []
-        with open(CSV_PATH, newline="", encoding="utf-8") as f:
+        with open(path, newline="", encoding="utf-8") as f:
             rdr = csv.reader(f)
             first = next(rdr)
             is_header = len(first) == len(HEADERS) and any(s.upper()=="RANK" for s in first)
@@ -77,43 +86,133 @@ def convert_symbol(text: str):
             return glyph, color, suffix
     return raw, WHITE, ""
 
+class BatchedReveal(Animation):
+    """LaggedStart(*[FadeIn(m, scale=start_scale) for m in cells], lag_ratio=...) as one animation.
+
+    The separate FadeIns each keep a starting copy and a target copy of their cell and interpolate them one
+    by one. Here the points and colors of every cell are views into a few shared arrays, so a frame is one
+    per-cell alpha array (lag offsets + cell_rate_func) applied to all cells at once and nothing is copied.
+    """
+
+    _RGBA_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+    def __init__(self, cells, lag_ratio=0.008, start_scale=0.98, cell_rate_func=smooth, **kwargs):
+        self.cells = list(cells)
+        self.start_scale = start_scale
+        self.cell_rate_func = cell_rate_func
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(VGroup(*self.cells), lag_ratio=lag_ratio, introducer=True, **kwargs)
+
+    def create_starting_mobject(self):
+        # Nothing to interpolate from, the targets are kept in _offsets and the alpha arrays
+        return Mobject()
+
+    def begin(self):
+        members = [(i, m) for i, cell in enumerate(self.cells) for m in cell.family_members_with_points()]
+        self._members = [m for _, m in members]
+        cell_index = np.array([i for i, _ in members], dtype=np.intp)
+        centers = np.array([cell.get_center() for cell in self.cells]).reshape(-1, 3)
+
+        # One point buffer for all cells, every mobject's points become a slice of it
+        self._points, point_cell = self._share("points", cell_index)
+        self._centers = centers[point_cell]
+        self._offsets = self._points - self._centers
+        self._point_cell = point_cell
+        self._rgbas = []
+        for attr in self._RGBA_ATTRS:
+            buffer, rgba_cell = self._share(attr, cell_index)
+            self._rgbas.append((buffer, buffer[:, 3].copy(), rgba_cell))
+
+        t = np.array([0.25, 0.75])    # two values: scalar-only code like min(max(...)) fails on these
+        try:
+            vectorized = np.shape(self.cell_rate_func(t)) == t.shape
+        except (TypeError, ValueError):
+            vectorized = False
+        self._cell_rate = self.cell_rate_func if vectorized else np.vectorize(self.cell_rate_func, otypes=[float])
+        super().begin()
+
+    def _share(self, attr, cell_index):
+        arrays = [np.asarray(getattr(m, attr, np.zeros((0, 4)))) for m in self._members]
+        width = 3 if attr == "points" else 4
+        counts = [len(a) for a in arrays]
+        buffer = np.concatenate(arrays).astype(float) if arrays else np.zeros((0, width))
+        start = 0
+        for m, count in zip(self._members, counts):
+            setattr(m, attr, buffer[start:start + count])
+            start += count
+        return buffer, np.repeat(cell_index, counts)
+
+    def interpolate_mobject(self, alpha):
+        n = len(self.cells)
+        total = (n - 1) * self.lag_ratio + 1
+        local = np.clip(alpha * total - np.arange(n) * self.lag_ratio, 0.0, 1.0)
+        a = np.asarray(self._cell_rate(local), dtype=float)
+
+        scale = self.start_scale + (1.0 - self.start_scale) * a
+        np.multiply(self._offsets, scale[self._point_cell, None], out=self._points)
+        self._points += self._centers
+        for buffer, opacity, rgba_cell in self._rgbas:
+            buffer[:, 3] = opacity * a[rgba_cell]
+
+    def finish(self):
+        super().finish()
+        # Give every mobject its own arrays again
+        for m in self._members:
+            for attr in ("points",) + self._RGBA_ATTRS:
+                if hasattr(m, attr):
+                    setattr(m, attr, np.array(getattr(m, attr)))
+        self._members = []
+
+def cell_mobject(cell):
+    """Mobject of one table cell: YES/NO/MAYBE become colored icons (plus any suffix), the rest is text."""
+    glyph, color, suffix = convert_symbol(cell)
+    if glyph in ("✓","✗","~"):
+        icon = Text(glyph, font_size=FONT_SIZE, color=color)
+        if suffix.strip():
+            extra = Text(suffix, font_size=int(FONT_SIZE*0.85), color=GRAY_B)\
+                .next_to(icon, RIGHT, buff=0.15, aligned_edge=DOWN)
+            return VGroup(icon, extra)
+        return icon
+    return Text(str(cell), font_size=FONT_SIZE)
+
+COL_ALIGNMENTS = "lccccccc"
+
+def frames_table_title():
+    return Text("Warframe Health Tank Rankings", weight=BOLD).to_edge(UP)
+
+def build_table(rows, title):
+    """The rankings Table below title. cell_scale is the factor its cells were scaled by to fit."""
+    table = Table(
+        [HEADERS] + [[cell_mobject(cell) for cell in row] for row in rows],
+        include_outer_lines=True,
+        element_to_mobject=lambda s: Text(str(s), font_size=FONT_SIZE) if isinstance(s,str) else s,
+        h_buff=0.6,
+        v_buff=0.28,
+        arrange_in_grid_config={"col_alignments":COL_ALIGNMENTS},
+    )
+    
+    width = table.width
+    table.scale_to_fit_width(config.frame_width - 2)   
+    table.scale_to_fit_height(config.frame_height - 2)  
+    table.next_to(title, DOWN, buff=0.2)
+    table.cell_scale = table.width / width
+    return table
+
+def frames_table_legend():
+    legend = VGroup(
+        Text("Legend:", font_size=24, weight=BOLD),
+        Text("✓  = YES", font_size=22, color=GREEN),
+        Text("✗  = NO", font_size=22, color=RED),
+        Text("~  = MAYBE", font_size=22, color=ORANGE),
+    ).arrange(DOWN, aligned_edge=LEFT, buff=0.12).scale(0.9)
+    return legend.to_edge(DOWN+LEFT).shift(RIGHT*0.3+UP*0.2)
+
 class FramesTable(Scene):
     def construct(self):
-        title = Text("Warframe Health Tank Rankings", weight=BOLD).to_edge(UP)
+        title = frames_table_title()
         self.play(FadeIn(title, shift=UP, run_time=0.6))
 
-        rows = load_rows()
-
-        # Preprocess rows into symbols
-        processed = []
-        for row in rows:
-            new_row = []
-            for cell in row:
-                glyph, color, suffix = convert_symbol(cell)
-                if glyph in ("✓","✗","~"):
-                    icon = Text(glyph, font_size=FONT_SIZE, color=color)
-                    if suffix.strip():
-                        extra = Text(suffix, font_size=int(FONT_SIZE*0.85), color=GRAY_B)\
-                            .next_to(icon, RIGHT, buff=0.15, aligned_edge=DOWN)
-                        new_row.append(VGroup(icon, extra))
-                    else:
-                        new_row.append(icon)
-                else:
-                    new_row.append(str(cell))
-            processed.append(new_row)
-
-        table = Table(
-            [HEADERS] + processed,
-            include_outer_lines=True,
-            element_to_mobject=lambda s: Text(str(s), font_size=FONT_SIZE) if isinstance(s,str) else s,
-            h_buff=0.6,
-            v_buff=0.28,
-            arrange_in_grid_config={"col_alignments":"lccccccc"},
-        )
-        
-        table.scale_to_fit_width(config.frame_width - 2)   
-        table.scale_to_fit_height(config.frame_height - 2)  
-        table.next_to(title, DOWN, buff=0.2)
+        table = build_table(load_rows(), title)
 
         # Draw table
         self.play(Create(table.get_horizontal_lines()), Create(table.get_vertical_lines()), run_time=0.8)
@@ -121,22 +220,245 @@ class FramesTable(Scene):
         # Labels
         labels = list(table.get_labels().submobjects)
         if labels:
-            self.play(LaggedStart(*[FadeIn(m, scale=0.95) for m in labels],
-                                  lag_ratio=0.06, run_time=1))
+            self.play(BatchedReveal(labels, lag_ratio=0.06, start_scale=0.95, run_time=1))
 
         # Entries
         entries = list(table.get_entries_without_labels().submobjects)
         if entries:
-            self.play(LaggedStart(*[FadeIn(m, scale=0.98) for m in entries],
-                                  lag_ratio=0.008, run_time=1.5))
+            self.play(BatchedReveal(entries, lag_ratio=0.008, start_scale=0.98, run_time=1.5))
 
-        legend = VGroup(
-            Text("Legend:", font_size=24, weight=BOLD),
-            Text("✓  = YES", font_size=22, color=GREEN),
-            Text("✗  = NO", font_size=22, color=RED),
-            Text("~  = MAYBE", font_size=22, color=ORANGE),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.12).scale(0.9)
-        legend.to_edge(DOWN+LEFT).shift(RIGHT*0.3+UP*0.2)
+        legend = frames_table_legend()
 
         self.play(FadeIn(legend, shift=UP, run_time=1))
         self.wait(1)
+
+## ---------- Patch update: only the rows that changed are rebuilt and animated ----------#
+#
+# FramesTableUpdate starts from the table of PREVIOUS_CSV_PATH as FramesTable leaves it, then
+#   1. cross-fades the cells whose value changed (built new, nothing else is)
+#   2. slides the frames whose rank changed to their new row
+# Rows are matched by FRAME, the RANK column belongs to the row position and stays. Everything that does
+# not change is never touched again and stays in the static background of every play().
+# When rows are added or removed the grid is rescaled to fit, so regrid() does it differently: the new
+# table is built for its layout, the old cells that still show the same text move and scale into it,
+# and only the removed / changed cells fade out and the new ones are revealed.
+
+FRAME_COLUMN = HEADERS.index("FRAME")
+
+def diff_rows(old, new):
+    """What changes from the old rows to the new ones.
+
+    Returns {"moves": {frame: (old_index, new_index)}, "changed": {frame: [column, ...]},
+             "ranks": [index, ...], "added": [frame, ...], "removed": [frame, ...]}.
+    changed uses the new rows' columns (RANK excluded), ranks lists row positions whose RANK text changed.
+    """
+    old_index = {row[FRAME_COLUMN].strip(): i for i, row in enumerate(old)}
+    new_index = {row[FRAME_COLUMN].strip(): i for i, row in enumerate(new)}
+    moves, changed = {}, {}
+    for frame, j in new_index.items():
+        i = old_index.get(frame)
+        if i is None:
+            continue
+        if i != j:
+            moves[frame] = (i, j)
+        cols = [c for c in range(len(HEADERS))
+                if c != 0 and c != FRAME_COLUMN and old[i][c].strip() != new[j][c].strip()]
+        if cols:
+            changed[frame] = cols
+    return {
+        "moves": moves,
+        "changed": changed,
+        "ranks": [i for i in range(min(len(old), len(new))) if old[i][0].strip() != new[i][0].strip()],
+        "added": [frame for frame in new_index if frame not in old_index],
+        "removed": [frame for frame in old_index if frame not in new_index],
+    }
+
+def _place(cell, column, ref, y):
+    """Put cell in its column like the Table does (left or centered on ref's column) at height y."""
+    if COL_ALIGNMENTS[column] == "l":
+        cell.move_to([0, y, 0]).align_to(ref, LEFT)
+    else:
+        cell.move_to([ref.get_x(), y, 0])
+    return cell
+
+class FramesTableUpdate(LayeredScene):
+    def construct(self):
+        old_rows, new_rows = load_rows(PREVIOUS_CSV_PATH), load_rows()
+        title = frames_table_title()
+        table = build_table(old_rows, title)
+        legend = frames_table_legend()
+        self.add(title, table, legend)
+
+        if len(old_rows) != len(new_rows):
+            self.regrid(table, old_rows, new_rows, title)
+            self.wait(1)
+            return
+
+        diff = diff_rows(old_rows, new_rows)
+        grid = table.get_rows()                 # grid[0] is the header row
+        slots = [grid[i + 1].get_y() for i in range(len(old_rows))]
+        refs = grid[1]
+        scale = table.cell_scale
+        old_index = {row[FRAME_COLUMN].strip(): i for i, row in enumerate(old_rows)}
+        new_index = {row[FRAME_COLUMN].strip(): i for i, row in enumerate(new_rows)}
+        cells = {i: list(grid[i + 1]) for i in range(len(old_rows))}    # old row index -> its cells
+
+        # ---------- 1. changed values, in the old rows ----------
+        fade_out, fade_in = [], []
+        def swap(i, c, value):
+            new_cell = _place(cell_mobject(value).scale(scale), c, refs[c], slots[i])
+            fade_out.append(cells[i][c])
+            fade_in.append(new_cell)
+            cells[i][c] = new_cell
+        for frame, cols in diff["changed"].items():
+            for c in cols:
+                swap(old_index[frame], c, new_rows[new_index[frame]][c])
+        for i in diff["ranks"]:
+            swap(i, 0, new_rows[i][0])
+        # A frame replaced by another one at the same count: its whole row is new
+        for removed, added in zip(diff["removed"], diff["added"]):
+            i, j = old_index[removed], new_index[added]
+            for c in range(1, len(HEADERS)):
+                swap(i, c, new_rows[j][c])
+            if i != j:
+                diff["moves"][added] = (i, j)
+        if fade_in:
+            self.play(*[FadeOut(m) for m in fade_out], *[FadeIn(m) for m in fade_in], run_time=1.0)
+
+        # ---------- 2. rank moves ----------
+        slides = []
+        for frame, (i, j) in diff["moves"].items():
+            row = VGroup(*cells[i][1:])     # RANK stays with the row position
+            if j < i:
+                row.set_z_index(1)          # frames moving up pass over the others
+            slides.append(row.animate.shift(UP * (slots[j] - slots[i])))
+        if slides:
+            self.play(*slides, run_time=1.5)
+        self.wait(1)
+
+    def regrid(self, table, old_rows, new_rows, title):
+        """Rows added or removed: unchanged cells move into the new grid, only the others fade."""
+        new_table = build_table(new_rows, title)
+        old_grid, new_grid = table.get_rows(), new_table.get_rows()
+        ratio = new_table.cell_scale / table.cell_scale
+        old_index = {row[FRAME_COLUMN].strip(): i for i, row in enumerate(old_rows)}
+
+        # (old grid row, new grid row, column) of cells with the same text: header and RANK by position,
+        # the other columns by FRAME
+        pairs = [(0, 0, c) for c in range(len(HEADERS))]
+        pairs += [(i + 1, i + 1, 0) for i in range(min(len(old_rows), len(new_rows)))
+                  if old_rows[i][0].strip() == new_rows[i][0].strip()]
+        for j, row in enumerate(new_rows):
+            i = old_index.get(row[FRAME_COLUMN].strip())
+            if i is not None:
+                pairs += [(i + 1, j + 1, c) for c in range(1, len(HEADERS)) if old_rows[i][c].strip() == row[c].strip()]
+        kept_old = {(i, c) for i, _, c in pairs}
+        kept_new = {(j, c) for _, j, c in pairs}
+
+        # Take the old table apart, so its lines and cells can each leave the scene on their own
+        old_lines = VGroup(*table.get_horizontal_lines(), *table.get_vertical_lines())
+        new_lines = VGroup(*new_table.get_horizontal_lines(), *new_table.get_vertical_lines())
+        self.remove(table)
+        self.add(old_lines, *[cell for row in old_grid for cell in row])
+
+        moves = [old_grid[i][c].animate.scale(ratio).move_to(new_grid[j][c]) for i, j, c in pairs]
+        gone = [FadeOut(cell) for i, row in enumerate(old_grid) for c, cell in enumerate(row)
+                if (i, c) not in kept_old]
+        self.play(ReplacementTransform(old_lines, new_lines), *moves, *gone, run_time=1.5)
+
+        fresh = [cell for j, row in enumerate(new_grid) for c, cell in enumerate(row) if (j, c) not in kept_new]
+        if fresh:
+            self.play(BatchedReveal(fresh, lag_ratio=0.02, start_scale=0.95, run_time=1.0))
+
+## ---------- One-shot heatmap: every frame of the table against every enemy level at once ----------#
+#
+# Each row is a frame of the table, each column an enemy level from 1 to LEVEL_MAX. A cell is red when one
+# hit of HEATMAP_ENEMY at that level does at least the frame's EHP, otherwise it shades from dark to yellow
+# with the fraction of the EHP one hit takes (log scale over HEATMAP_DECADES). The grid is one numpy
+# evaluation and one ImageMobject, the axes, frame names and the one-shot edge are drawn on top of it.
+
+# ===================== CONFIG: =====================
+HEATMAP_ENEMY = "Corrupted Bombard"     # name in the enemy registry
+HEATMAP_DECADES = 3                     # hits below 10^-3 of the EHP are fully dark
+HEATMAP_LOW_COLOR = ManimColor("#1B1B2F")
+HEATMAP_HIGH_COLOR = YELLOW
+HEATMAP_ONE_SHOT_COLOR = RED
+
+# ================================================================================
+
+def frame_ehp(rows):
+    """EHP column of the table rows as floats ("136,489,305" -> 136489305.0)."""
+    col = HEADERS.index("EHP")
+    return np.array([float(str(row[col]).replace(",", "")) for row in rows])
+
+def one_shot_ratio(ehp, levels, registry):
+    """Damage of one hit over EHP for every frame at every level, shape (n_frames, n_levels)."""
+    hit = enemy_damage(levels, registry, load_level_tables())[..., 0]
+    return hit[None, :] / np.asarray(ehp, dtype=float)[:, None]
+
+def heatmap_pixels(ratio):
+    """uint8 RGBA image of a ratio grid, one pixel per cell."""
+    low = np.array(HEATMAP_LOW_COLOR.to_rgb()) * 255
+    high = np.array(ManimColor(HEATMAP_HIGH_COLOR).to_rgb()) * 255
+    with np.errstate(divide="ignore"):
+        t = np.clip(1 + np.log10(ratio) / HEATMAP_DECADES, 0, 1)[..., None]
+    rgb = low + (high - low) * t
+    rgb[ratio >= 1] = np.array(ManimColor(HEATMAP_ONE_SHOT_COLOR).to_rgb()) * 255
+    alpha = np.full(ratio.shape + (1,), 255.0)
+    return np.concatenate([rgb, alpha], axis=-1).round().astype(np.uint8)
+
+class OneShotHeatmap(LayeredScene):
+    def construct(self):
+        rows = load_rows()
+        enemy = load_registry().select([HEATMAP_ENEMY])
+        levels = np.arange(LEVEL_MIN, LEVEL_MAX + 1)
+        ehp = frame_ehp(rows)
+        ratio = one_shot_ratio(ehp, levels, enemy)
+        n = len(rows)
+
+        title = Text(f"Which enemy level of {HEATMAP_ENEMY} one-shots?", font_size=36,
+                     t2c={HEATMAP_ENEMY: HEATMAP_ONE_SHOT_COLOR}).to_edge(UP)
+
+        ax = AtlasAxes(
+            x_range=[0, LEVEL_MAX + 1, 1000],
+            y_range=[0, n, 1],
+            x_length=10.5, y_length=5.8,
+            tips=False,
+            axis_config={"include_ticks": False, "include_numbers": False},
+            x_axis_config={"include_ticks": True, "include_numbers": True, "font_size": 24},
+        ).to_edge(DOWN).shift(RIGHT * 0.8)
+        x_label = Text("Enemy Level", font_size=28).next_to(ax.x_axis, DOWN, buff=0.3)
+
+        # ---------- Grid: one image, rows top to bottom in table order ----------
+        grid = ImageMobject(heatmap_pixels(ratio))
+        grid.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        lower_left = ax.c2p(LEVEL_MIN - 0.5, 0)
+        upper_right = ax.c2p(LEVEL_MAX + 0.5, n)
+        grid.stretch_to_fit_width(upper_right[0] - lower_left[0])
+        grid.stretch_to_fit_height(upper_right[1] - lower_left[1])
+        grid.move_to((lower_left + upper_right) / 2)
+
+        name_col = HEADERS.index("FRAME")
+        names = VGroup(*[
+            Text(str(row[name_col]), font_size=18).next_to(ax.c2p(0, n - i - 0.5), LEFT, buff=0.15)
+            for i, row in enumerate(rows)
+        ])
+
+        # ---------- One-shot edge: a staircase through every row's first one-shot level ----------
+        edge_levels = np.clip(levels_for_damage(ehp, enemy)[:, 0], LEVEL_MIN - 0.5, LEVEL_MAX + 0.5)
+        corners = []
+        for i, level in enumerate(edge_levels):
+            corners += [ax.c2p(level, n - i), ax.c2p(level, n - i - 1)]
+        edge = VMobject().set_points_as_corners(corners).set_stroke(WHITE, width=3)
+
+        legend = VGroup(
+            Text("one hit ≥ EHP", font_size=22, color=HEATMAP_ONE_SHOT_COLOR),
+            Text(f"one hit / EHP, 10^-{HEATMAP_DECADES} to 1", font_size=22, color=HEATMAP_HIGH_COLOR),
+        ).arrange(RIGHT, buff=0.6).next_to(title, DOWN, buff=0.15)
+
+        # ---------- Build & Animate ----------
+        self.play(Write(title), run_time=1.0)
+        self.play(Create(ax), FadeIn(x_label), FadeIn(names), run_time=1.5)
+        self.play(FadeIn(grid), FadeIn(legend), run_time=1.5)
+        self.play(Create(edge), run_time=2.0)
+        self.wait(2)
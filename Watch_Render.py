@@ -0,0 +1,215 @@
+import argparse
+import ast
+import difflib
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from Render_Daemon import PROJECT_DIR, QUALITIES, SceneModuleCache, render_job
+
+## ---------- Watch mode: re-render only the play() segments an edit can affect ----------#
+#
+#activate env .\manim-env\Scripts\Activate.ps1
+#run python Watch_Render.py Warframe_Animations.py WarframeDamageScalingOraxia -q l
+#run python Watch_Render.py EHP_Formula_Animations.py EHPComputeExample -q h --format=mov --transparent
+#
+# Every render records, per play()/wait() segment, which source lines of the project files it executed
+# (scene code, helper functions like damage(), updater lambdas). On save, the edit is diffed against the
+# source of that render:
+#   - segments before the first one that executed a changed line, or read a changed module-level
+#     name (BOMBARD_BASE_DAMAGE, a helper function, ...), reuse their partial movie file directly,
+#     without even hashing the scene
+#   - from there on manim's own per-play hash decides, so a segment whose frames come out identical
+#     is still reused and only the invalidated ones are rendered
+# manim then splices all partial movie files back into the output by stream copy.
+
+POLL_SECONDS = 0.5
+TOOL_FILES = {"Render_Daemon.py", "Watch_Render.py", "Scene_Cache.py"}
+
+def project_sources(project_dir=PROJECT_DIR):
+    return {
+        str(path.resolve()): path.read_text(encoding="utf-8")
+        for path in sorted(Path(project_dir).glob("*.py"))
+        if path.name not in TOOL_FILES
+    }
+
+def project_stamps(project_dir=PROJECT_DIR):
+    return {
+        path.name: path.stat().st_mtime_ns
+        for path in Path(project_dir).glob("*.py")
+        if path.name not in TOOL_FILES
+    }
+
+def changed_lines(old, new):
+    """Line numbers of `old` (1-based) that an edit replaced or deleted, or inserted next to."""
+    matcher = difflib.SequenceMatcher(a=old.splitlines(), b=new.splitlines(), autojunk=False)
+    lines = set()
+    for tag, i1, i2, _, _ in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if i1 == i2:
+            lines.update((i1, i1 + 1))  # inserted between old lines i1 and i1 + 1
+        else:
+            lines.update(range(i1 + 1, i2 + 1))
+    return lines
+
+def names_by_line(source):
+    """line -> names read on that line."""
+    out = {}
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            out.setdefault(node.lineno, set()).add(node.id)
+    return out
+
+def module_names_on_lines(source, lines):
+    """Module-level names (tunables, helper functions, classes, imports) defined by statements touching `lines`."""
+    names = set()
+    for stmt in ast.parse(source).body:
+        span = set(range(stmt.lineno, (stmt.end_lineno or stmt.lineno) + 1))
+        if not span & lines:
+            continue
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(stmt.name)
+        elif isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            names.update((alias.asname or alias.name).split(".")[0] for alias in stmt.names)
+        else:
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                    names.add(node.id)
+    return names
+
+class SegmentTracker:
+    """Which project source lines every play() segment of one render executed, plus its partial movie hash."""
+
+    def __init__(self, project_dir=PROJECT_DIR):
+        self.project_dir = Path(project_dir).resolve()
+        self.segments = []      # segment -> set of (file, line)
+        self.hashes = []        # segment -> manim partial movie hash
+        self.sources = {}       # file -> source the render ran
+        self._project_files = {}
+
+    def _in_project(self, filename):
+        if filename not in self._project_files:
+            path = Path(filename).resolve()
+            self._project_files[filename] = path.parent == self.project_dir and path.name not in TOOL_FILES
+        return self._project_files[filename]
+
+    @contextmanager
+    def recording(self, scene, reuse=None):
+        """Trace scene.render(); segments listed in reuse (index -> hash) skip manim's scene hashing."""
+        from manim.renderer import cairo_renderer
+
+        self.sources = project_sources(self.project_dir)
+        segments = self.segments = []
+
+        def line_tracer(frame, event, arg):
+            if event == "line":
+                seg = scene.renderer.num_plays
+                while len(segments) <= seg:
+                    segments.append(set())
+                segments[seg].add((frame.f_code.co_filename, frame.f_lineno))
+            return line_tracer
+
+        def call_tracer(frame, event, arg):
+            return line_tracer if self._in_project(frame.f_code.co_filename) else None
+
+        original_hash = getattr(cairo_renderer, "get_hash_from_play_call", None)
+        # Extra arguments (newer manim passes backend=, encoder_fingerprint=, ...) go through untouched
+        def reusing_hash(scene_object, *args, **kwargs):
+            known = (reuse or {}).get(scene_object.renderer.num_plays)
+            if known and scene_object.renderer.file_writer.is_already_cached(known):
+                return known
+            return original_hash(scene_object, *args, **kwargs)
+
+        if original_hash is not None:
+            cairo_renderer.get_hash_from_play_call = reusing_hash
+        sys.settrace(call_tracer)
+        try:
+            yield
+        finally:
+            sys.settrace(None)
+            if original_hash is not None:
+                cairo_renderer.get_hash_from_play_call = original_hash
+            self.hashes = list(scene.renderer.animations_hashes)
+
+    def first_invalidated(self, new_sources):
+        """Index of the first segment the edit can change (len(segments) if none)."""
+        changed = {}
+        changed_names = set()
+        for file, old in self.sources.items():
+            new = new_sources.get(file, "")
+            if new == old:
+                continue
+            lines = changed_lines(old, new)
+            changed[file] = lines
+            changed_names |= module_names_on_lines(old, lines)
+            changed_names |= module_names_on_lines(new, changed_lines(new, old))
+        if not changed:
+            return len(self.segments)
+
+        reads = {file: names_by_line(src) for file, src in self.sources.items()}
+        for k, executed in enumerate(self.segments):
+            for file, line in executed:
+                if line in changed.get(file, ()):
+                    return k
+                if changed_names & reads.get(file, {}).get(line, set()):
+                    return k
+        return len(self.segments)
+
+def watch(file, scene, quality="h", fmt=None, transparent=False, poll=POLL_SECONDS):
+    cache = SceneModuleCache(PROJECT_DIR)
+    job = {"file": file, "scene": scene, "quality": quality, "format": fmt, "transparent": transparent}
+    tracker = SegmentTracker(PROJECT_DIR)
+
+    def render(reuse):
+        new_tracker = SegmentTracker(PROJECT_DIR)
+        try:
+            reply = render_job(cache, job, around_render=lambda s: new_tracker.recording(s, reuse))
+        except Exception as exc:
+            print(f"render failed: {exc!r}, fix the file and save again")
+            return None
+        return reply, new_tracker
+
+    print(f"rendering {file} {scene} ...")
+    result = render({})
+    if result:
+        reply, tracker = result
+        print(f"{reply['output']}  ({len(tracker.hashes)} segments, {reply['seconds']:.1f}s)")
+
+    stamps = project_stamps()
+    while True:
+        time.sleep(poll)
+        now = project_stamps()
+        if now == stamps:
+            continue
+        stamps = now
+        sources = project_sources()
+
+        first = tracker.first_invalidated(sources) if tracker.segments else 0
+        reuse = {k: h for k, h in enumerate(tracker.hashes[:first]) if h}
+        result = render(reuse)
+        if not result:
+            continue
+        old_hashes = set(tracker.hashes)
+        reply, tracker = result
+        rendered = [k for k, h in enumerate(tracker.hashes) if h and h not in old_hashes]
+        print(f"{reply['output']}  (first changed segment {first}, re-rendered {len(rendered)}"
+              f"/{len(tracker.hashes)}: {rendered}, {reply['seconds']:.1f}s)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-render a scene on save, only the segments that changed")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--format")
+    parser.add_argument("-t", "--transparent", action="store_true")
+    args = parser.parse_args(argv)
+    try:
+        watch(args.file, args.scene, args.quality, args.format, args.transparent)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+from manim import *
+import numpy as np
+
+from Axis_Label_Atlas import AtlasAxes
+
+## ---------- Axes whose x/y ranges can be animated without rebuilding anything ----------#
+#
+# Transform(ax, ax_long) interpolates every tick, label and curve point of two complete Axes on every frame,
+# and an always_redraw curve on top re-samples its function every frame. ZoomableAxes instead:
+#   - keeps every curve plotted on it in data space and maps it with the current ranges each frame
+#     (an affine map of the stored points, no re-sampling), clipped to the visible x range
+#   - keeps one tick and one label per value and only shifts them, labels come from the atlas. Values that
+#     leave the range are dropped, and at most POOL_MAX of the others are kept
+#
+#   ax = ZoomableAxes(x_range=[0, 204, 25], ...)                 # same arguments as Axes
+#   curve = ax.plot(health, x_range=[0, 10000, 0.25])            # drawn up to x = 204 for now
+#   curve = ax.track(ParametricFunction(...))                     # any curve left to right, samples need not be even
+#   self.play(ax.zoom_to(x_range=[0, 9999, 1000], y_range=[0, y_final, y_step]), run_time=2)
+
+NICE_STEPS = (1, 2, 2.5, 5, 10)
+POOL_MAX = 200      # pooled ticks / labels per axis and kind, the least recently shown go first
+
+def nice_step(raw):
+    """Smallest 1/2/2.5/5 x 10^k step that is >= raw."""
+    if raw <= 0:
+        return 1
+    m = 10 ** np.floor(np.log10(raw))
+    for k in NICE_STEPS:
+        if raw <= k * m:
+            return k * m
+    return 10 * m
+
+def _tick_values(lo, hi, step):
+    values = np.arange(np.ceil(lo / step - 1e-9) * step, hi + step * 1e-9, step)
+    return np.round(values, 9) + 0.0    # + 0.0 turns -0.0 into 0.0
+
+def _zoom_interpolate(a, b, alpha):
+    # Geometric for positive bounds so 204 -> 9999 zooms at a steady rate instead of rushing at the start
+    if a > 0 and b > 0:
+        return a * (b / a) ** alpha
+    return a + (b - a) * alpha
+
+class ZoomableAxes(AtlasAxes):
+    """Axes with animatable ranges, see zoom_to. Same arguments as Axes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tracked = []      # [curve, full-length template, data-space points (n, 2)]
+        self._pools = {}        # axis index -> {"ticks": {value: [mob, anchor]}, "labels": {...}, "scale": s}
+
+    # ---------- data space ----------
+    def _origin(self):
+        return self.x_axis.number_to_point(self._origin_shift([self.x_axis.x_min, self.x_axis.x_max]))
+
+    def _data_to_points(self, data):
+        origin = self._origin()
+        x_pts = self.x_axis.number_to_point(data[:, 0])
+        y_pts = self.y_axis.number_to_point(data[:, 1])
+        return x_pts + y_pts - origin
+
+    def _points_to_data(self, points):
+        return np.column_stack([self.x_axis.point_to_number(points), self.y_axis.point_to_number(points)])
+
+    def plot(self, function, x_range=None, **kwargs):
+        return self.track(super().plot(function, x_range=x_range, **kwargs))
+
+    def track(self, curve):
+        """Let curve follow range changes. It is shown only as far as the visible x range reaches,
+        so plot it over the largest range it will ever need and zoom out to reveal the rest."""
+        self._tracked.append([curve, curve.copy(), self._points_to_data(curve.points)])
+        self._fit_curve(self._tracked[-1])
+        return curve
+
+    def _fit_curve(self, entry):
+        curve, template, data = entry
+        if not len(data):
+            return
+        template.points = self._data_to_points(data)
+        # Share of the curves (not of the x span) left of x_max, so the samples need not be evenly spaced
+        anchors_x = np.append(data[::curve.n_points_per_cubic_curve, 0], data[-1, 0])
+        if anchors_x[-1] == anchors_x[0]:
+            visible = 1.0
+        else:
+            visible = np.interp(self.x_axis.x_max, anchors_x, np.linspace(0.0, 1.0, len(anchors_x)))
+        if visible >= 1.0:
+            curve.points = template.points.copy()
+        else:
+            curve.pointwise_become_partial(template, 0.0, visible)
+
+    # ---------- ticks and labels ----------
+    def _relabel(self, index, axis):
+        pool = self._pools.setdefault(index, {"ticks": {}, "labels": {}, "scale": None})
+        ticks = getattr(axis, "ticks", None)
+        numbers = getattr(axis, "numbers", None)
+        if pool["scale"] is None:
+            # Axes are usually .scale()d after construction, fresh ticks/labels must match
+            pool["scale"] = ticks[0].get_length() / (2 * axis.tick_size) if ticks is not None and len(ticks) else 1.0
+        s = pool["scale"]
+        excluded = set(np.round(np.asarray(getattr(axis, "numbers_to_exclude", None) or [], dtype=float), 9))
+
+        def pooled(kind, value, make):
+            point = axis.number_to_point(value)
+            entry = pool[kind].pop(value, None)     # re-inserted at the end: dict order = least recently shown first
+            if entry is None:
+                mob = make(value).scale(s, about_point=point)
+                entry = [mob, point]
+            else:
+                entry[0].shift(point - entry[1])
+                entry[1] = point
+            pool[kind][value] = entry
+            return entry[0]
+
+        values = _tick_values(*axis.x_range[:3])
+        if ticks is not None:
+            ticks.submobjects = [pooled("ticks", v, axis.get_tick) for v in values]
+        if numbers is not None:
+            numbers.submobjects = [pooled("labels", v, axis.get_number_mobject) for v in values if v not in excluded]
+
+        # A long zoom passes through many steps, forget values off the range and the oldest beyond POOL_MAX
+        lo, hi = axis.x_range[:2]
+        shown = set(values)
+        for kind in ("ticks", "labels"):
+            entries = pool[kind]
+            for value in [v for v in entries if not lo <= v <= hi and v not in shown]:
+                del entries[value]
+            while len(entries) > max(POOL_MAX, len(values)):
+                del entries[next(iter(entries))]
+
+    # ---------- ranges ----------
+    def set_ranges(self, x_range=None, y_range=None):
+        """Jump to new [min, max, step] ranges (step optional, kept if omitted)."""
+        for index, (axis, new) in enumerate(((self.x_axis, x_range), (self.y_axis, y_range))):
+            if new is None:
+                continue
+            new = np.array(list(new) + list(axis.x_range[len(new):3]), dtype=float)
+            axis.x_range = new
+            axis.x_min, axis.x_max, axis.x_step = new
+            self._relabel(index, axis)
+        self.x_range = self.x_axis.x_range.copy()
+        self.y_range = self.y_axis.x_range.copy()
+        for entry in self._tracked:
+            self._fit_curve(entry)
+        return self
+
+    def zoom_to(self, x_range=None, y_range=None, **kwargs):
+        """Animation from the current ranges to new ones, every plotted curve follows."""
+        plans = []
+        for axis, new in ((self.x_axis, x_range), (self.y_axis, y_range)):
+            start = axis.x_range[:3].copy()
+            end = start if new is None else np.array(list(new) + list(start[len(new):]), dtype=float)
+            # Keep the tick count of whichever end shows more ticks, with round steps in between
+            n_ticks = max(len(_tick_values(*start)), len(_tick_values(*end)), 2) - 1
+            plans.append((start, end, n_ticks))
+
+        def update(mob, alpha):
+            ranges = []
+            for start, end, n_ticks in plans:
+                if alpha >= 1.0:
+                    ranges.append(end)
+                    continue
+                lo = start[0] + (end[0] - start[0]) * alpha
+                hi = _zoom_interpolate(start[1], end[1], alpha)
+                ranges.append((lo, hi, nice_step((hi - lo) / n_ticks)))
+            mob.set_ranges(*ranges)
+
+        return UpdateFromAlphaFunc(self, update, **kwargs)